@@ -0,0 +1,7 @@
+"""
+HTTP-level benchmarks run against a live server (docker-compose up or a
+deployed instance). Standard library only, so they run from any Python 3.11
+environment without installing the app.
+
+In-process benchmarks that need the ORM live in hrms/management/commands/bench_*.
+"""
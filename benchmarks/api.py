@@ -0,0 +1,87 @@
+"""Minimal keep-alive HTTP client for the HRMS API"""
+
+import http.client
+import json
+import uuid
+from urllib.parse import urlencode, urlsplit
+
+
+class ApiError(Exception):
+    pass
+
+
+class ApiClient:
+    """One persistent connection to a server; reconnects after failures"""
+
+    def __init__(self, base_url, timeout=60):
+        self.base = urlsplit(base_url.rstrip("/"))
+        self.timeout = timeout
+        self._connection = None
+
+    def _connect(self):
+        cls = (
+            http.client.HTTPSConnection
+            if self.base.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return cls(self.base.netloc, timeout=self.timeout)
+
+    def request(self, method, path, params=None, body=None, headers=None):
+        """Send a request and return (status, body bytes)"""
+        url = self.base.path + path + (f"?{urlencode(params)}" if params else "")
+        headers = {"Accept": "application/json", **(headers or {})}
+        if self._connection is None:
+            self._connection = self._connect()
+        try:
+            self._connection.request(method, url, body=body, headers=headers)
+            response = self._connection.getresponse()
+            content = response.read()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+        if response.will_close:
+            self.close()
+        return response.status, content
+
+    def json(self, method, path, params=None, data=None):
+        """JSON request; raises ApiError on a non-2xx answer"""
+        body = None if data is None else json.dumps(data).encode()
+        status, content = self.request(
+            method,
+            path,
+            params,
+            body,
+            {"Content-Type": "application/json"} if body else None,
+        )
+        if not 200 <= status < 300:
+            raise ApiError(f"{method} {path} -> {status}: {content[:500]!r}")
+        return json.loads(content) if content else None
+
+    def upload(self, path, filename, content, fields=None):
+        """multipart/form-data POST of one file plus form fields"""
+        boundary = uuid.uuid4().hex
+        parts = []
+        for name, value in (fields or {}).items():
+            parts.append(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"'
+                f"\r\n\r\n{value}\r\n".encode()
+            )
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; '
+            f'filename="{filename}"\r\nContent-Type: application/octet-stream'
+            f"\r\n\r\n".encode() + content + f"\r\n--{boundary}--\r\n".encode()
+        )
+        status, body = self.request(
+            "POST",
+            path,
+            body=b"".join(parts),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        )
+        if not 200 <= status < 300:
+            raise ApiError(f"POST {path} -> {status}: {body[:500]!r}")
+        return json.loads(body)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,65 @@
+"""
+Throughput and latency at increasing client counts for one or more running
+servers, e.g. the same build started with SERVER_MODE=wsgi and =asgi:
+
+    SERVER_MODE=wsgi PORT=8000 sh entrypoint.sh
+    SERVER_MODE=asgi PORT=8001 sh entrypoint.sh
+    python -m benchmarks.concurrency \\
+        wsgi=http://localhost:8000 asgi=http://localhost:8001 \\
+        --levels 10 50 100 200 --duration 20
+"""
+
+import argparse
+import json
+import sys
+from .load import run_load
+
+DEFAULT_PATHS = (
+    "/health/",
+    "/api/dashboard/",
+    "/api/employees/",
+    "/api/attendance/",
+)
+
+
+def parse_target(value):
+    name, _, base_url = value.partition("=")
+    if not base_url:
+        raise argparse.ArgumentTypeError("Targets must look like name=http://host:port")
+    return name, base_url.rstrip("/")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("targets", nargs="+", type=parse_target)
+    parser.add_argument(
+        "--levels", type=int, nargs="+", default=[10, 50, 100, 200], help="Clients"
+    )
+    parser.add_argument("--paths", nargs="+", default=list(DEFAULT_PATHS))
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds")
+    parser.add_argument("--json", help="Write all results to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'target':<10}{'clients':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for level in args.levels:
+        for name, base_url in args.targets:
+            result = run_load(
+                [base_url + path for path in args.paths], level, args.duration
+            )
+            result["target"] = name
+            results.append(result)
+            latency = result["latency_ms"]
+            print(
+                f"{name:<10}{level:>8}{result['throughput_rps']:>10}"
+                f"{latency['p50'] or '-':>10}{latency['p99'] or '-':>10}"
+                + (f"  ({result['errors']} errors)" if result["errors"] else "")
+            )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Closed-loop HTTP load test: N concurrent clients, each with its own
+keep-alive connection, request the given URLs round-robin for a fixed
+duration and the latency distribution is reported.
+
+    python -m benchmarks.load http://localhost:8000/api/employees/ \\
+        --concurrency 16 --duration 30 --json before.json
+
+To compare two server configurations, save a baseline and pass it to the
+second run:
+
+    python -m benchmarks.load http://localhost:8000/api/employees/ \\
+        --concurrency 16 --duration 30 --baseline before.json
+"""
+
+import argparse
+import http.client
+import json
+import statistics
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Client(threading.Thread):
+    """One simulated user issuing requests back to back on one connection"""
+
+    def __init__(self, urls, deadline, headers, offset=0):
+        super().__init__(daemon=True)
+        self.urls = [urlsplit(url) for url in urls]
+        self.deadline = deadline
+        self.headers = headers
+        self.offset = offset
+        self.latencies = []
+        self.errors = 0
+        self.statuses = {}
+        self._connection = None
+
+    def _connect(self, url):
+        cls = (
+            http.client.HTTPSConnection
+            if url.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return cls(url.netloc, timeout=30)
+
+    def run(self):
+        index = self.offset
+        while time.perf_counter() < self.deadline:
+            url = self.urls[index % len(self.urls)]
+            index += 1
+            path = url.path + (f"?{url.query}" if url.query else "")
+            if self._connection is None:
+                self._connection = self._connect(url)
+            start = time.perf_counter()
+            try:
+                self._connection.request("GET", path, headers=self.headers)
+                response = self._connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException):
+                self.errors += 1
+                self._connection.close()
+                self._connection = None
+                continue
+            self.latencies.append(time.perf_counter() - start)
+            self.statuses[response.status] = self.statuses.get(response.status, 0) + 1
+            if response.will_close:
+                self._connection.close()
+                self._connection = None
+        if self._connection is not None:
+            self._connection.close()
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def run_load(urls, concurrency, duration, headers=None, warmup=2.0):
+    """Run the load test and return a JSON-serializable result dict"""
+    headers = {"Accept": "application/json", **(headers or {})}
+
+    if warmup:
+        # Let workers start, open connections and fill caches before measuring
+        _run_clients(urls, concurrency, warmup, headers)
+
+    clients, elapsed = _run_clients(urls, concurrency, duration, headers)
+    latencies = sorted(t for client in clients for t in client.latencies)
+    statuses = {}
+    for client in clients:
+        for code, count in client.statuses.items():
+            statuses[str(code)] = statuses.get(str(code), 0) + count
+
+    return {
+        "urls": urls,
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 2),
+        "requests": len(latencies),
+        "errors": sum(c.errors for c in clients),
+        "statuses": statuses,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0,
+        "latency_ms": {
+            **{f"p{pct}": _ms(percentile(latencies, pct)) for pct in PERCENTILES},
+            "mean": _ms(statistics.fmean(latencies)) if latencies else None,
+            "max": _ms(latencies[-1]) if latencies else None,
+        },
+    }
+
+
+def _run_clients(urls, concurrency, duration, headers):
+    start = time.perf_counter()
+    deadline = start + duration
+    clients = [Client(urls, deadline, headers, offset=i) for i in range(concurrency)]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    return clients, time.perf_counter() - start
+
+
+def format_report(result, baseline=None):
+    lines = [
+        f"{result['requests']} requests in {result['duration_s']}s "
+        f"with {result['concurrency']} clients "
+        f"({result['throughput_rps']} req/s, {result['errors']} errors)",
+        f"status codes: {result['statuses']}",
+    ]
+    for key, value in result["latency_ms"].items():
+        line = f"  {key:>5}: {value} ms"
+        if baseline and value is not None:
+            before = baseline["latency_ms"].get(key)
+            if before:
+                change = (value - before) / before * 100
+                line += f"  (baseline {before} ms, {change:+.1f}%)"
+        lines.append(line)
+    if baseline:
+        lines.append(
+            f"  throughput: {result['throughput_rps']} req/s "
+            f"(baseline {baseline['throughput_rps']} req/s)"
+        )
+    return "\n".join(lines)
+
+
+def parse_header(value):
+    name, _, content = value.partition(":")
+    if not content:
+        raise argparse.ArgumentTypeError("Headers must look like 'Name: value'.")
+    return name.strip(), content.strip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("urls", nargs="+", help="URLs requested round-robin")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds")
+    parser.add_argument(
+        "--warmup", type=float, default=2.0, help="Unmeasured seconds first"
+    )
+    parser.add_argument(
+        "--header", type=parse_header, action="append", default=[], dest="headers"
+    )
+    parser.add_argument("--json", help="Write the result to this file")
+    parser.add_argument("--baseline", help="Result file of an earlier run to compare")
+    args = parser.parse_args(argv)
+
+    result = run_load(
+        args.urls,
+        args.concurrency,
+        args.duration,
+        headers=dict(args.headers),
+        warmup=args.warmup,
+    )
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print(format_report(result, baseline))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Seed a running server with benchmark data through its own API: N employees
+spread across departments (CSV import), then D days of attendance ending
+today (bulk marking), with a fixed share of absences.
+
+    python -m benchmarks.seed http://localhost:8000 --employees 2000 --days 90
+
+The same --seed always produces the same data, and rows that already exist
+are skipped, so re-running is safe. For millions of rows seed the database
+directly with `python manage.py seed_hrms` instead.
+"""
+
+import argparse
+import csv
+import datetime
+import io
+import json
+import random
+import sys
+import time
+from .api import ApiClient, ApiError
+
+# Same spread as hrms.seeding.DEFAULT_DEPARTMENTS
+DEPARTMENTS = (
+    "Engineering",
+    "Finance",
+    "HR",
+    "Marketing",
+    "Operations",
+    "Sales",
+    "Support",
+)
+
+IMPORT_ROWS_PER_UPLOAD = 5000
+EMPLOYEES_PER_BULK_REQUEST = 1000
+
+
+def employee_csv(prefix, start, stop):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["employee_id", "full_name", "email", "department"])
+    for i in range(start, stop):
+        writer.writerow(
+            [
+                f"{prefix}-{i:06d}",
+                f"{prefix.title()} Employee {i}",
+                f"{prefix.lower()}-{i:06d}@example.com",
+                DEPARTMENTS[i % len(DEPARTMENTS)],
+            ]
+        )
+    return out.getvalue().encode()
+
+
+def seed_employees(client, count, prefix):
+    """Import the employees and return their UUIDs, ordered by employee_id"""
+    created = 0
+    for start in range(0, count, IMPORT_ROWS_PER_UPLOAD):
+        stop = min(start + IMPORT_ROWS_PER_UPLOAD, count)
+        result = client.upload(
+            "/api/employees/import/",
+            "employees.csv",
+            employee_csv(prefix, start, stop),
+        )
+        created += result["created"]
+
+    return created, fetch_employee_ids(client, prefix, count)
+
+
+def fetch_employee_ids(client, prefix, count=None):
+    """UUIDs of the PREFIX-nnnnnn employees (the first `count`), by employee ID"""
+    status, body = client.request("GET", "/api/employees/export/", {"format": "ndjson"})
+    if status != 200:
+        raise ApiError(f"Employee export failed with {status}")
+    ids = []
+    for line in body.splitlines():
+        row = json.loads(line)
+        name, _, number = row["employee_id"].partition("-")
+        if name == prefix and number.isdigit():
+            if count is None or int(number) < count:
+                ids.append(row["id"])
+    return ids
+
+
+def seed_attendance(client, employee_ids, days, absence_rate, seed, end_date):
+    """Mark every employee for `days` days ending at end_date"""
+    rng = random.Random(seed)
+    created = 0
+    for offset in range(days):
+        date = (end_date - datetime.timedelta(days=offset)).isoformat()
+        absent = [i for i in employee_ids if rng.random() < absence_rate]
+        absent_set = set(absent)
+        present = [i for i in employee_ids if i not in absent_set]
+        for status, ids in (("ABSENT", absent), ("PRESENT", present)):
+            for start in range(0, len(ids), EMPLOYEES_PER_BULK_REQUEST):
+                result = client.json(
+                    "POST",
+                    "/api/attendance/bulk/",
+                    data={
+                        "date": date,
+                        "status": status,
+                        "employees": ids[start : start + EMPLOYEES_PER_BULK_REQUEST],
+                    },
+                )
+                created += result["summary"]["created"]
+    return created
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("base_url", help="e.g. http://localhost:8000")
+    parser.add_argument("--employees", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--absence-rate", type=float, default=0.07)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--prefix", default="BENCH", help="Employee ID prefix")
+    parser.add_argument(
+        "--end-date",
+        type=datetime.date.fromisoformat,
+        default=datetime.date.today(),
+        help="Last seeded day (YYYY-MM-DD); must not be after the server's today",
+    )
+    args = parser.parse_args(argv)
+
+    client = ApiClient(args.base_url)
+    start = time.perf_counter()
+    created, employee_ids = seed_employees(client, args.employees, args.prefix)
+    print(f"employees: {created} created, {len(employee_ids)} in the benchmark set")
+    records = seed_attendance(
+        client,
+        employee_ids,
+        args.days,
+        args.absence_rate,
+        args.seed,
+        args.end_date,
+    )
+    print(
+        f"attendance: {records} records created for {args.days} days "
+        f"ending {args.end_date} in {time.perf_counter() - start:.1f}s"
+    )
+    client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,338 @@
+"""
+Scripted mixed workload against a running server: dashboard polling,
+list/filter, reports, analytics, exports and bulk marking, picked at
+random by weight by N closed-loop clients. Reports throughput and
+p50/p95/p99 latency per scenario as JSON for comparing commits.
+
+    python -m benchmarks.seed http://localhost:8000 --employees 2000 --days 90
+    python -m benchmarks.workload http://localhost:8000 --days 90 \\
+        --concurrency 16 --duration 60 --json results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.workload http://localhost:8000 --days 90 \\
+        --baseline results/abc1234.json
+
+Bulk marking writes new records on dates before the seeded window, so
+every run adds rows; re-seed a fresh database for strictly comparable runs.
+"""
+
+import argparse
+import datetime
+import http.client
+import itertools
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from .api import ApiClient
+from .load import percentile
+from .seed import DEPARTMENTS, fetch_employee_ids
+
+PERCENTILES = (50, 95, 99)
+
+# Scenario -> relative weight
+DEFAULT_WEIGHTS = {
+    "dashboard": 30,
+    "employee_list": 10,
+    "attendance_list": 10,
+    "attendance_filter": 15,
+    "report": 10,
+    "analytics": 10,
+    "export": 5,
+    "bulk_mark": 10,
+}
+
+
+class Workload:
+    """Shared inputs: the seeded window, employee IDs and the write cursor"""
+
+    def __init__(self, employee_ids, days, end_date, bulk_size):
+        self.employee_ids = employee_ids
+        self.days = days
+        self.end_date = end_date
+        self.bulk_size = bulk_size
+        self._bulk_slots = itertools.count()
+        self._lock = threading.Lock()
+
+    def day(self, rng, back=0):
+        """A random ISO date in the seeded window, at least `back` days from its end"""
+        offset = rng.randrange(back, max(self.days, back + 1))
+        return (self.end_date - datetime.timedelta(days=offset)).isoformat()
+
+    def next_bulk_slot(self):
+        """(date, employees) never marked before: dates walk back from the window"""
+        with self._lock:
+            slot = next(self._bulk_slots)
+        per_day = max(1, len(self.employee_ids) // self.bulk_size)
+        date = self.end_date - datetime.timedelta(days=self.days + slot // per_day)
+        start = (slot % per_day) * self.bulk_size
+        return date.isoformat(), self.employee_ids[start : start + self.bulk_size]
+
+    # Each scenario returns (method, path, params, JSON body)
+
+    def dashboard(self, rng):
+        return "GET", "/api/dashboard/", None, None
+
+    def employee_list(self, rng):
+        return "GET", "/api/employees/", {"page_size": 50}, None
+
+    def attendance_list(self, rng):
+        return "GET", "/api/attendance/", {"page_size": 100}, None
+
+    def attendance_filter(self, rng):
+        params = {"date": self.day(rng), "status": rng.choice(["PRESENT", "ABSENT"])}
+        return "GET", "/api/attendance/", params, None
+
+    def report(self, rng):
+        start = self.day(rng, back=6)
+        end = (
+            datetime.date.fromisoformat(start) + datetime.timedelta(days=6)
+        ).isoformat()
+        params = {"start": start, "end": end, "department": rng.choice(DEPARTMENTS)}
+        return "GET", "/api/attendance/report/", params, None
+
+    def analytics(self, rng):
+        period = rng.choice(["day", "week", "month"])
+        return "GET", "/api/analytics/daily/", {"period": period}, None
+
+    def export(self, rng):
+        date = self.day(rng)
+        params = {"start": date, "end": date, "format": rng.choice(["csv", "ndjson"])}
+        return "GET", "/api/attendance/export/", params, None
+
+    def bulk_mark(self, rng):
+        date, employees = self.next_bulk_slot()
+        body = {"date": date, "status": "PRESENT", "employees": employees}
+        return "POST", "/api/attendance/bulk/", None, body
+
+
+class Client(threading.Thread):
+    """One simulated user running weighted scenarios back to back"""
+
+    def __init__(self, base_url, workload, weights, deadline, seed):
+        super().__init__(daemon=True)
+        self.api = ApiClient(base_url)
+        self.workload = workload
+        self.names = list(weights)
+        self.weights = list(weights.values())
+        self.deadline = deadline
+        self.rng = random.Random(seed)
+        self.latencies = {name: [] for name in self.names}
+        self.errors = {name: 0 for name in self.names}
+
+    def run(self):
+        while time.perf_counter() < self.deadline:
+            name = self.rng.choices(self.names, self.weights)[0]
+            method, path, params, data = getattr(self.workload, name)(self.rng)
+            body = None if data is None else json.dumps(data).encode()
+            headers = {"Content-Type": "application/json"} if body else None
+            start = time.perf_counter()
+            try:
+                status, _ = self.api.request(method, path, params, body, headers)
+            except (OSError, http.client.HTTPException):
+                self.errors[name] += 1
+                continue
+            if 200 <= status < 300 or status == 304:
+                self.latencies[name].append(time.perf_counter() - start)
+            else:
+                self.errors[name] += 1
+        self.api.close()
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def summarize(latencies, errors, elapsed):
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0,
+        "latency_ms": {
+            **{f"p{pct}": _ms(percentile(latencies, pct)) for pct in PERCENTILES},
+            "mean": _ms(statistics.fmean(latencies)) if latencies else None,
+            "max": _ms(latencies[-1]) if latencies else None,
+        },
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_workload(
+    base_url,
+    employee_ids,
+    days,
+    end_date,
+    concurrency,
+    duration,
+    weights=DEFAULT_WEIGHTS,
+    bulk_size=100,
+    seed=0,
+    warmup=2.0,
+):
+    """Run the workload and return a JSON-serializable result dict"""
+    workload = Workload(employee_ids, days, end_date, bulk_size)
+    weights = {name: weight for name, weight in weights.items() if weight > 0}
+    if warmup:
+        _run_clients(base_url, workload, weights, concurrency, warmup, seed)
+    clients, elapsed = _run_clients(
+        base_url, workload, weights, concurrency, duration, seed
+    )
+
+    scenarios = {
+        name: summarize(
+            [t for client in clients for t in client.latencies[name]],
+            sum(client.errors[name] for client in clients),
+            elapsed,
+        )
+        for name in weights
+    }
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "base_url": base_url,
+            "python": platform.python_version(),
+            "concurrency": concurrency,
+            "duration_s": round(elapsed, 2),
+            "employees": len(employee_ids),
+            "days": days,
+            "seed": seed,
+            "weights": weights,
+        },
+        "overall": summarize(
+            [t for client in clients for ts in client.latencies.values() for t in ts],
+            sum(sum(client.errors.values()) for client in clients),
+            elapsed,
+        ),
+        "scenarios": scenarios,
+    }
+
+
+def _run_clients(base_url, workload, weights, concurrency, duration, seed):
+    start = time.perf_counter()
+    deadline = start + duration
+    clients = [
+        Client(base_url, workload, weights, deadline, seed=seed * 1000 + i)
+        for i in range(concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    return clients, time.perf_counter() - start
+
+
+def format_report(result, baseline=None):
+    meta = result["meta"]
+    lines = [
+        f"commit {meta['commit']}, {meta['concurrency']} clients, "
+        f"{meta['duration_s']}s, {meta['employees']} employees x {meta['days']} days",
+        f"{'scenario':<18}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'errors':>8}"
+        + ("  p95 vs baseline" if baseline else ""),
+    ]
+    rows = [("overall", result["overall"])] + list(result["scenarios"].items())
+    for name, stats in rows:
+        latency = stats["latency_ms"]
+        line = (
+            f"{name:<18}{stats['throughput_rps']:>9}"
+            f"{latency['p50'] or '-':>9}{latency['p95'] or '-':>9}"
+            f"{latency['p99'] or '-':>9}{stats['errors']:>8}"
+        )
+        if baseline:
+            before = (
+                baseline["overall"]
+                if name == "overall"
+                else baseline["scenarios"].get(name)
+            )
+            if before and before["latency_ms"]["p95"] and latency["p95"]:
+                change = (latency["p95"] - before["latency_ms"]["p95"]) / before[
+                    "latency_ms"
+                ]["p95"]
+                line += f"  {change * 100:+.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def parse_weight(value):
+    name, _, weight = value.partition("=")
+    if name not in DEFAULT_WEIGHTS or not weight.isdigit():
+        raise argparse.ArgumentTypeError(
+            f"Weights look like scenario=N; scenarios: {', '.join(DEFAULT_WEIGHTS)}"
+        )
+    return name, int(weight)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("base_url", help="e.g. http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds")
+    parser.add_argument(
+        "--warmup", type=float, default=2.0, help="Unmeasured seconds first"
+    )
+    parser.add_argument("--days", type=int, default=90, help="Seeded days")
+    parser.add_argument(
+        "--end-date",
+        type=datetime.date.fromisoformat,
+        default=datetime.date.today(),
+        help="Last seeded day (YYYY-MM-DD)",
+    )
+    parser.add_argument("--prefix", default="BENCH", help="Seeded employee ID prefix")
+    parser.add_argument(
+        "--bulk-size", type=int, default=100, help="Employees per bulk request"
+    )
+    parser.add_argument(
+        "--weight",
+        type=parse_weight,
+        action="append",
+        default=[],
+        help="Override a scenario weight, e.g. export=0",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write the result to this file")
+    parser.add_argument("--baseline", help="Result file of an earlier run to compare")
+    args = parser.parse_args(argv)
+
+    employee_ids = fetch_employee_ids(ApiClient(args.base_url), args.prefix)
+    if not employee_ids:
+        parser.error(f"No {args.prefix}-* employees; run benchmarks.seed first.")
+
+    result = run_workload(
+        args.base_url,
+        employee_ids,
+        args.days,
+        args.end_date,
+        args.concurrency,
+        args.duration,
+        weights={**DEFAULT_WEIGHTS, **dict(args.weight)},
+        bulk_size=args.bulk_size,
+        seed=args.seed,
+        warmup=args.warmup,
+    )
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print(format_report(result, baseline))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+    return 1 if result["overall"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
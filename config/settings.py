@@ -51,7 +51,12 @@ INSTALLED_APPS = [
 
 # Static Files - WhiteNoise
 MIDDLEWARE = [
+    # Outermost, so timings cover the whole stack and bytes are as sent
+    "hrms.middleware.PerformanceMiddleware",
+    "hrms.querycheck.QueryDetectorMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    # Compresses API responses; WhiteNoise serves pre-compressed static files
+    "hrms.middleware.CompressionMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "corsheaders.middleware.CorsMiddleware",  # Must be before CommonMiddleware
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -82,6 +87,12 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "config.wsgi.application"
 
+# "wsgi" (gunicorn gthread workers) or "asgi" (uvicorn workers); see
+# entrypoint.sh. ASGI mode also routes the hot read endpoints to the async
+# views in hrms/async_views.py.
+SERVER_MODE = env.str("SERVER_MODE", default="wsgi")
+ASYNC_VIEWS = SERVER_MODE == "asgi"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
@@ -91,13 +102,124 @@ DATABASES = {
     "default": env.db(),
 }
 
+# Trigram lookups for employee search (hrms/search.py). Only on PostgreSQL:
+# the app imports psycopg, which SQLite deployments need not install.
+if "postgresql" in DATABASES["default"]["ENGINE"]:
+    INSTALLED_APPS.append("django.contrib.postgres")
+
+# Connection reuse: keep each worker's connection open for DB_CONN_MAX_AGE
+# seconds instead of reconnecting on every request (0 disables reuse).
+# Health checks make a reused connection that the server dropped reconnect
+# instead of failing the request.
+DATABASES["default"]["CONN_MAX_AGE"] = env.int(
+    # Under ASGI each request runs its ORM calls in its own thread, so
+    # persistent connections would pile up; use PgBouncer for reuse there.
+    "DB_CONN_MAX_AGE",
+    default=0 if ASYNC_VIEWS else 60,
+)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool(
+    "DB_CONN_HEALTH_CHECKS", default=True
+)
+
+# Set when connecting through PgBouncer in transaction pooling mode:
+# server-side cursors (used by QuerySet.iterator) cannot outlive a
+# transaction there, so fetch results client-side instead.
+DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = env.bool(
+    "DB_PGBOUNCER", default=False
+)
+
+# Large bulk writes (bulk marking, imports, seeding) on Postgres go through
+# COPY into a temporary table (hrms/bulkwrite.py); smaller ones, and other
+# databases, use bulk_create
+DB_COPY_WRITES = env.bool("DB_COPY_WRITES", default=True)
+DB_COPY_MIN_ROWS = env.int("DB_COPY_MIN_ROWS", default=500)
+
+
+# Cache: Parse from URL (e.g. redis://..., memcache://...)
+# The default in-process cache is per worker; use a shared backend in
+# production so invalidations reach every gunicorn worker.
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+# Upper bound on how stale cached dashboard stats can get when an
+# invalidation is missed (e.g. another worker's locmem cache)
+DASHBOARD_CACHE_TIMEOUT = env.int("DASHBOARD_CACHE_TIMEOUT", default=60)
+
+
+# API response compression (hrms/middleware.py). Brotli is used when the
+# optional brotli package is installed and the client accepts it.
+COMPRESSION_PATH_PREFIXES = env.list("COMPRESSION_PATH_PREFIXES", default=["/api/"])
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)
+COMPRESSION_GZIP_LEVEL = env.int("COMPRESSION_GZIP_LEVEL", default=6)
+# Streamed responses are flushed to the client every this many input bytes
+COMPRESSION_STREAM_FLUSH_SIZE = env.int("COMPRESSION_STREAM_FLUSH_SIZE", default=16384)
+# 4-5 is close to gzip speed with noticeably smaller output
+COMPRESSION_BROTLI_QUALITY = env.int("COMPRESSION_BROTLI_QUALITY", default=4)
+
+
+# Per-route latency, query count, DB time and response size
+# (hrms.middleware.PerformanceMiddleware), sent as a Server-Timing header
+# and exposed in the Prometheus format at /metrics/
+PERFORMANCE_METRICS = env.bool("PERFORMANCE_METRICS", default=True)
+# When set, /metrics/ requires "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_TOKEN = env.str("METRICS_TOKEN", default="")
+
+
+# N+1 and slow query detection per request (hrms/querycheck.py): "off",
+# "log" (warnings on the hrms.querycheck logger; use on staging) or
+# "raise". The test runner always uses "raise".
+QUERY_DETECTOR = env.str("QUERY_DETECTOR", default="off")
+# Same statement shape more often than this in one request is an N+1
+QUERY_DETECTOR_REPEAT_LIMIT = env.int("QUERY_DETECTOR_REPEAT_LIMIT", default=5)
+QUERY_DETECTOR_SLOW_MS = env.int("QUERY_DETECTOR_SLOW_MS", default=200)
+TEST_RUNNER = "hrms.querycheck.QueryDetectorTestRunner"
+
+
+# Background jobs (hrms/jobs.py), run by `manage.py run_hrms_worker`
+JOB_WORKER_PROCESSES = env.int("JOB_WORKER_PROCESSES", default=2)
+# A worker bumps its running job's heartbeat this often, from a thread, so
+# it keeps beating through long steps; keep it well under JOB_STALE_SECONDS
+JOB_HEARTBEAT_SECONDS = env.int("JOB_HEARTBEAT_SECONDS", default=30)
+# RUNNING jobs without a heartbeat for this long are marked failed
+JOB_STALE_SECONDS = env.int("JOB_STALE_SECONDS", default=600)
+# Finished jobs are deleted after this many days
+JOB_RETENTION_DAYS = env.int("JOB_RETENTION_DAYS", default=7)
+
+# In-process bitmap index of attendance (hrms/bitmaps.py) answering the
+# absence streak endpoint; without it the endpoint reads the range from
+# the database on every request
+ATTENDANCE_INDEX = env.bool("ATTENDANCE_INDEX", default=False)
+# Reload the index after this many seconds, so writes made by other
+# processes are seen; writes in the same process apply immediately
+ATTENDANCE_INDEX_MAX_AGE = env.int("ATTENDANCE_INDEX_MAX_AGE", default=900)
+# Snapshot file written by `manage.py attendance_index save` and read
+# instead of the Attendance table when it is newer than the max age
+ATTENDANCE_INDEX_SNAPSHOT = env.str("ATTENDANCE_INDEX_SNAPSHOT", default="")
+
+# Monthly Attendance partitions on PostgreSQL (hrms/partitions.py): months
+# after the current one kept created by the job worker and
+# `manage.py attendance_partitions create`
+ATTENDANCE_PARTITION_MONTHS_AHEAD = env.int(
+    "ATTENDANCE_PARTITION_MONTHS_AHEAD", default=3
+)
+# `attendance_partitions archive` moves months older than this many months
+# into gzipped CSV files here; mount persistent storage in containers
+ATTENDANCE_ARCHIVE_AFTER_MONTHS = env.int("ATTENDANCE_ARCHIVE_AFTER_MONTHS", default=24)
+ATTENDANCE_ARCHIVE_DIR = env.str(
+    "ATTENDANCE_ARCHIVE_DIR", default=str(BASE_DIR / "archive")
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
 AUTH_PASSWORD_VALIDATORS = [
     {
-        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
+        "NAME": (
+            "django.contrib.auth.password_validation."
+            "UserAttributeSimilarityValidator"
+        ),
     },
     {
         "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
@@ -142,6 +264,37 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
     ],
+    # orjson-backed when installed, same output as DRF's JSON classes
+    "DEFAULT_RENDERER_CLASSES": [
+        "hrms.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "hrms.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
+# Default page size for list endpoints (keyset pagination, see hrms/pagination.py)
+API_PAGE_SIZE = env.int("API_PAGE_SIZE", default=100)
+
+# Cache-Control for list/detail responses carrying ETag and Last-Modified
+# (hrms/conditional.py), keyed by viewset basename. The default lets
+# clients keep a copy but revalidate on every use, which costs one
+# query for the page's keys and an empty 304 when nothing changed.
+API_CACHE_CONTROL = {
+    "default": {"private": True, "no_cache": True},
+    "employee": {
+        "private": True,
+        "max_age": env.int("EMPLOYEE_CACHE_MAX_AGE", default=0),
+        "must_revalidate": True,
+    },
+    "attendance": {
+        "private": True,
+        "max_age": env.int("ATTENDANCE_CACHE_MAX_AGE", default=0),
+        "must_revalidate": True,
+    },
 }
 
 # drf-spectacular OpenAPI Settings
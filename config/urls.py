@@ -15,6 +15,7 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 from django.http import JsonResponse
@@ -24,7 +25,10 @@ from hrms.views import (
     EmployeeViewSet,
     AttendanceViewSet,
     DashboardStatsView,
+    DailyAnalyticsView,
+    JobViewSet,
     health_check,
+    metrics,
 )
 
 
@@ -37,10 +41,13 @@ def api_root(request):
             "status": "operational",
             "endpoints": {
                 "health": "/health/",
+                "metrics": "/metrics/",
                 "api_docs": "/api/docs/",
                 "dashboard": "/api/dashboard/",
                 "employees": "/api/employees/",
                 "attendance": "/api/attendance/",
+                "analytics": "/api/analytics/daily/",
+                "jobs": "/api/jobs/",
             },
         }
     )
@@ -49,12 +56,14 @@ def api_root(request):
 router = DefaultRouter()
 router.register(r"employees", EmployeeViewSet)
 router.register(r"attendance", AttendanceViewSet)
+router.register(r"jobs", JobViewSet)
 
 urlpatterns = [
     path("", api_root, name="api-root"),
     path("admin/", admin.site.urls),
     # Health check endpoint (no /api/ prefix for simplicity)
     path("health/", health_check, name="health-check"),
+    path("metrics/", metrics, name="metrics"),
     path("api/", include(router.urls)),
     # OpenAPI Documentation
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
@@ -64,4 +73,16 @@ urlpatterns = [
         name="swagger-ui",
     ),
     path("api/dashboard/", DashboardStatsView.as_view(), name="dashboard-stats"),
+    path("api/analytics/daily/", DailyAnalyticsView.as_view(), name="analytics-daily"),
 ]
+
+if settings.ASYNC_VIEWS:
+    from hrms import async_views
+
+    # Matched first, so these shadow the sync views on the same paths
+    urlpatterns = [
+        path("health/", async_views.health_check, name="health-check"),
+        path("api/dashboard/", async_views.dashboard_stats, name="dashboard-stats"),
+        path("api/employees/", async_views.employee_list, name="employee-list"),
+        path("api/attendance/", async_views.attendance_list, name="attendance-list"),
+    ] + urlpatterns
@@ -12,10 +12,47 @@ fi
 # Run migrations
 python manage.py migrate
 
+# Monthly Attendance partitions for the coming months (PostgreSQL only;
+# a no-op elsewhere)
+python manage.py attendance_partitions create
+
 # Collect static files (needed for Admin/Swagger)
 python manage.py collectstatic --noinput --clear
 
 # Start Gunicorn
 # Workers = (2 * CPU) + 1. We use 4 as a safe default for small containers.
 # Bind to PORT environment variable provided by Render (defaults to 8000 for local dev)
-exec gunicorn config.wsgi:application --bind 0.0.0.0:${PORT:-8000} --workers 4
\ No newline at end of file
+# SERVER_MODE=asgi runs uvicorn workers (async views, see config/urls.py);
+# otherwise gthread workers, which heartbeat from their main thread so long
+# streaming responses (e.g. /api/attendance/export/) are not killed by
+# --timeout the way a busy sync worker is.
+if [ "${SERVER_MODE:-wsgi}" = "asgi" ]; then
+    set -- gunicorn config.asgi:application --bind 0.0.0.0:${PORT:-8000} --workers 4 \
+        --worker-class uvicorn_worker.UvicornWorker
+else
+    set -- gunicorn config.wsgi:application --bind 0.0.0.0:${PORT:-8000} --workers 4 \
+        --worker-class gthread --threads ${GUNICORN_THREADS:-2}
+fi
+
+# Background jobs (hrms/jobs.py) normally run as their own service with the
+# same image (`python manage.py run_hrms_worker`, see docker-compose.yml).
+# RUN_JOB_WORKER=1 runs the worker in this container instead, for single
+# container deployments.
+if [ "${RUN_JOB_WORKER:-0}" != "1" ]; then
+    exec "$@"
+fi
+
+python manage.py run_hrms_worker &
+WORKER_PID=$!
+"$@" &
+SERVER_PID=$!
+
+# Pass the container's SIGTERM on to both, so the worker finishes its
+# current job; allow for that in the platform's stop timeout
+trap 'kill -TERM "$SERVER_PID" "$WORKER_PID" 2>/dev/null' TERM INT
+STATUS=0
+wait "$SERVER_PID" || STATUS=$?
+# Gunicorn exited, or the trap interrupted the wait: stop both and wait
+kill -TERM "$SERVER_PID" "$WORKER_PID" 2>/dev/null || true
+wait "$SERVER_PID" "$WORKER_PID" || true
+exit "$STATUS"
@@ -1,5 +1,15 @@
-import { apiClient } from './client';
-import type { Attendance, AttendanceCreate, AttendanceUpdate } from '../types';
+import { apiClient, fetchAllPages } from './client';
+import type {
+  Attendance,
+  AttendanceCreate,
+  AttendanceUpdate,
+  AttendanceReport,
+  AttendanceReportParams,
+  AttendanceMatrix,
+  BulkAttendanceCreate,
+  BulkAttendanceResult,
+  Job,
+} from '../types';
 
 // Get all attendance records (with optional filters)
 export const getAttendance = async (params?: {
@@ -7,8 +17,7 @@ export const getAttendance = async (params?: {
   status?: 'PRESENT' | 'ABSENT';
   employee?: string;
 }): Promise<Attendance[]> => {
-  const response = await apiClient.get<Attendance[]>('/attendance/', { params });
-  return response.data;
+  return fetchAllPages<Attendance>('/attendance/', params);
 };
 
 // Get single attendance record
@@ -25,6 +34,44 @@ export const createAttendance = async (
   return response.data;
 };
 
+// Mark many employees for one date in a single request
+export const bulkMarkAttendance = async (
+  data: BulkAttendanceCreate
+): Promise<BulkAttendanceResult> => {
+  const response = await apiClient.post<BulkAttendanceResult>('/attendance/bulk/', data);
+  return response.data;
+};
+
+// Queue bulk marking as a background job; poll it with getJob for progress
+export const bulkMarkAttendanceInBackground = async (
+  data: BulkAttendanceCreate
+): Promise<Job<BulkAttendanceResult>> => {
+  const response = await apiClient.post<Job<BulkAttendanceResult>>('/attendance/bulk/', data, {
+    params: { background: true },
+  });
+  return response.data;
+};
+
+// Get a page of the attendance report; pass the previous page's `next` to continue
+export const getAttendanceReport = async (
+  params: AttendanceReportParams,
+  next?: string | null
+): Promise<AttendanceReport> => {
+  const response = next
+    ? await apiClient.get<AttendanceReport>(next)
+    : await apiClient.get<AttendanceReport>('/attendance/report/', { params });
+  return response.data;
+};
+
+// Get every employee's attendance for a month (YYYY-MM, default current month)
+export const getAttendanceMatrix = async (params?: {
+  month?: string;
+  department?: string;
+}): Promise<AttendanceMatrix> => {
+  const response = await apiClient.get<AttendanceMatrix>('/attendance/matrix/', { params });
+  return response.data;
+};
+
 // Update attendance record
 export const updateAttendance = async (
   id: number,
@@ -43,8 +90,5 @@ export const deleteAttendance = async (id: number): Promise<void> => {
 export const getEmployeeAttendance = async (
   employeeId: string
 ): Promise<Attendance[]> => {
-  const response = await apiClient.get<Attendance[]>('/attendance/', {
-    params: { employee: employeeId },
-  });
-  return response.data;
+  return fetchAllPages<Attendance>('/attendance/', { employee: employeeId });
 };
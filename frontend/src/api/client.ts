@@ -37,3 +37,29 @@ apiClient.interceptors.response.use(
     return Promise.reject(error);
   }
 );
+
+// Keyset-paginated list response
+export interface Page<T> {
+  next: string | null;
+  results: T[];
+}
+
+// Largest page the API will serve
+const MAX_PAGE_SIZE = 1000;
+
+// Follow `next` links until the whole collection has been fetched
+export const fetchAllPages = async <T>(
+  url: string,
+  params?: Record<string, unknown>
+): Promise<T[]> => {
+  const results: T[] = [];
+  let response = await apiClient.get<Page<T>>(url, {
+    params: { ...params, page_size: MAX_PAGE_SIZE },
+  });
+  results.push(...response.data.results);
+  while (response.data.next) {
+    response = await apiClient.get<Page<T>>(response.data.next);
+    results.push(...response.data.results);
+  }
+  return results;
+};
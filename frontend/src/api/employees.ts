@@ -1,10 +1,17 @@
-import { apiClient } from './client';
+import { apiClient, fetchAllPages } from './client';
 import type { Employee, EmployeeCreate, EmployeeUpdate } from '../types';
 
 // Get all employees
 export const getEmployees = async (): Promise<Employee[]> => {
-  const response = await apiClient.get<Employee[]>('/employees/');
-  return response.data;
+  return fetchAllPages<Employee>('/employees/');
+};
+
+// Best matches for a query on employee ID, name or email (server-side, indexed)
+export const searchEmployees = async (q: string, limit = 20): Promise<Employee[]> => {
+  const response = await apiClient.get<{ results: Employee[] }>('/employees/search/', {
+    params: { q, limit },
+  });
+  return response.data.results;
 };
 
 // Get single employee by ID
@@ -1,4 +1,5 @@
 export * from './employees';
 export * from './attendance';
 export * from './dashboard';
+export * from './jobs';
 export { apiClient } from './client';
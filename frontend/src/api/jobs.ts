@@ -0,0 +1,11 @@
+import { apiClient } from './client';
+import type { Job } from '../types';
+
+// Get a background job's status, progress and, once finished, result or error
+export const getJob = async <Result = unknown>(id: string): Promise<Job<Result>> => {
+  const response = await apiClient.get<Job<Result>>(`/jobs/${id}/`);
+  return response.data;
+};
+
+export const isJobFinished = (job?: Job<unknown>): boolean =>
+  job?.status === 'SUCCEEDED' || job?.status === 'FAILED';
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
-import { useQuery } from '@tanstack/react-query';
-import { getAttendance } from '../api';
+import { useInfiniteQuery } from '@tanstack/react-query';
+import { getAttendanceReport } from '../api';
+import type { AttendanceReportParams } from '../types';
 import { Input, Table, StatusText, Button } from '../components/ui';
 
 function AttendanceReports() {
@@ -15,15 +16,26 @@ function AttendanceReports() {
   const [statusFilter, setStatusFilter] = useState<'ALL' | 'PRESENT' | 'ABSENT'>('ALL');
   const [hasSearched, setHasSearched] = useState(false);
 
-  const { data: attendance, isLoading, error, refetch } = useQuery({
+  const {
+    data,
+    isLoading,
+    error,
+    refetch,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
     queryKey: ['attendance', 'reports', startDate, endDate, statusFilter],
-    queryFn: () => {
-      const params: any = {};
-      if (statusFilter !== 'ALL') {
-        params.status = statusFilter;
-      }
-      return getAttendance(params);
+    queryFn: ({ pageParam }) => {
+      // Date range and status are filtered server-side
+      const params: AttendanceReportParams = {};
+      if (startDate) params.start = startDate;
+      if (endDate) params.end = endDate;
+      if (statusFilter !== 'ALL') params.status = statusFilter;
+      return getAttendanceReport(params, pageParam);
     },
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next,
     enabled: false, // Manual fetch
   });
 
@@ -40,29 +52,10 @@ function AttendanceReports() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [statusFilter]);
 
-  const filteredData = attendance?.filter((record) => {
-    if (!startDate && !endDate) return true;
-    const recordDate = new Date(record.date);
-    const start = startDate ? new Date(startDate) : null;
-    const end = endDate ? new Date(endDate) : null;
-
-    if (start && end) {
-      return recordDate >= start && recordDate <= end;
-    } else if (start) {
-      return recordDate >= start;
-    } else if (end) {
-      return recordDate <= end;
-    }
-    return true;
-  });
-
-  const stats = filteredData
-    ? {
-        total: filteredData.length,
-        present: filteredData.filter((r) => r.status === 'PRESENT').length,
-        absent: filteredData.filter((r) => r.status === 'ABSENT').length,
-      }
-    : { total: 0, present: 0, absent: 0 };
+  // Totals cover the whole range; rows arrive a page at a time
+  const report = data?.pages[0];
+  const records = data?.pages.flatMap((page) => page.results);
+  const stats = report?.summary ?? { total: 0, present: 0, absent: 0 };
 
   return (
     <div>
@@ -111,7 +104,7 @@ function AttendanceReports() {
       </div>
 
       {/* Statistics */}
-      {attendance && (
+      {report && (
         <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-4 mb-8">
           <div className="container-unibody">
             <p className="text-hierarchy-5 mb-2">TOTAL RECORDS</p>
@@ -135,11 +128,11 @@ function AttendanceReports() {
         <StatusText type="error">
           [ ERROR: FAILED TO LOAD ATTENDANCE RECORDS ]
         </StatusText>
-      ) : !attendance ? (
+      ) : !records ? (
         <StatusText type="info">
           [ SELECT DATE RANGE AND CLICK SEARCH TO VIEW REPORTS ]
         </StatusText>
-      ) : filteredData && filteredData.length === 0 ? (
+      ) : records.length === 0 ? (
         <StatusText type="info">
           [ NO ATTENDANCE RECORDS FOUND FOR SELECTED CRITERIA ]
         </StatusText>
@@ -156,7 +149,7 @@ function AttendanceReports() {
             </Table.Row>
           </Table.Header>
           <Table.Body>
-            {filteredData?.map((record) => (
+            {records.map((record) => (
               <Table.Row key={record.id}>
                 <Table.Cell>{record.date}</Table.Cell>
                 <Table.Cell>{record.employee_id}</Table.Cell>
@@ -181,6 +174,49 @@ function AttendanceReports() {
         </Table>
         </div>
       )}
+
+      {hasNextPage && (
+        <Button
+          className="mt-4"
+          onClick={() => fetchNextPage()}
+          disabled={isFetchingNextPage}
+        >
+          {isFetchingNextPage ? '[ LOADING ]' : '[ LOAD MORE ]'}
+        </Button>
+      )}
+
+      {/* Department Breakdown */}
+      {report && report.departments.length > 0 && (
+        <div className="mt-8">
+          <h2 className="text-hierarchy-2 mb-4">BY DEPARTMENT</h2>
+          <div className="overflow-x-auto border border-border">
+          <Table>
+            <Table.Header>
+              <Table.Row>
+                <Table.Head>DEPARTMENT</Table.Head>
+                <Table.Head>PRESENT</Table.Head>
+                <Table.Head>ABSENT</Table.Head>
+                <Table.Head>ATTENDANCE RATE</Table.Head>
+              </Table.Row>
+            </Table.Header>
+            <Table.Body>
+              {report.departments.map((department) => (
+                <Table.Row key={department.department}>
+                  <Table.Cell>{department.department}</Table.Cell>
+                  <Table.Cell>{department.present}</Table.Cell>
+                  <Table.Cell>{department.absent}</Table.Cell>
+                  <Table.Cell>
+                    {department.attendance_rate === null
+                      ? '-'
+                      : `${department.attendance_rate}%`}
+                  </Table.Cell>
+                </Table.Row>
+              ))}
+            </Table.Body>
+          </Table>
+          </div>
+        </div>
+      )}
     </div>
   );
 }
@@ -1,6 +1,13 @@
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { getEmployees, getAttendance, createAttendance } from '../api';
+import {
+  getEmployees,
+  getAttendance,
+  bulkMarkAttendanceInBackground,
+  getJob,
+  isJobFinished,
+} from '../api';
+import type { BulkAttendanceResult } from '../types';
 import { Button, Input, StatusText } from '../components/ui';
 
 function BulkAttendance() {
@@ -11,8 +18,6 @@ function BulkAttendance() {
   };
 
   const [selectedDate, setSelectedDate] = useState(getISTDate());
-  const [isMarking, setIsMarking] = useState(false);
-  const [progress, setProgress] = useState({ current: 0, total: 0 });
   const queryClient = useQueryClient();
 
   const { data: employees, isLoading: employeesLoading } = useQuery({
@@ -25,9 +30,29 @@ function BulkAttendance() {
     queryFn: () => getAttendance({ date: selectedDate }),
   });
 
-  const markAttendanceMutation = useMutation({
-    mutationFn: createAttendance,
+  // The server queues the marking as a job; poll it until it finishes
+  const bulkMarkMutation = useMutation({
+    mutationFn: bulkMarkAttendanceInBackground,
   });
+  const jobId = bulkMarkMutation.data?.id;
+  const { data: job, isError: jobError } = useQuery({
+    queryKey: ['job', jobId],
+    queryFn: () => getJob<BulkAttendanceResult>(jobId!),
+    enabled: !!jobId,
+    refetchInterval: (query) => (isJobFinished(query.state.data) ? false : 1000),
+  });
+  const jobFinished = isJobFinished(job);
+
+  useEffect(() => {
+    if (!jobFinished) return;
+    queryClient.invalidateQueries({ queryKey: ['attendance', selectedDate] });
+    queryClient.invalidateQueries({ queryKey: ['dashboard'] });
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [jobFinished]);
+
+  const isMarking = bulkMarkMutation.isPending || (!!jobId && !jobFinished && !jobError);
+  const result = job?.status === 'SUCCEEDED' ? job.result : null;
+  const markingFailed = bulkMarkMutation.isError || jobError || job?.status === 'FAILED';
 
   const getUnmarkedEmployees = () => {
     if (!employees || !attendanceRecords) return [];
@@ -35,29 +60,10 @@ function BulkAttendance() {
     return employees.filter((emp) => !markedEmployeeIds.includes(emp.id));
   };
 
-  const handleBulkMark = async (status: 'PRESENT' | 'ABSENT') => {
-    const unmarked = getUnmarkedEmployees();
-    if (unmarked.length === 0) return;
-
-    setIsMarking(true);
-    setProgress({ current: 0, total: unmarked.length });
-
-    for (let i = 0; i < unmarked.length; i++) {
-      try {
-        await markAttendanceMutation.mutateAsync({
-          employee: unmarked[i].id,
-          date: selectedDate,
-          status,
-        });
-        setProgress({ current: i + 1, total: unmarked.length });
-      } catch (error) {
-        console.error('Failed to mark attendance for:', unmarked[i].employee_id);
-      }
-    }
-
-    setIsMarking(false);
-    queryClient.invalidateQueries({ queryKey: ['attendance', selectedDate] });
-    queryClient.invalidateQueries({ queryKey: ['dashboard'] });
+  const handleBulkMark = (status: 'PRESENT' | 'ABSENT') => {
+    if (getUnmarkedEmployees().length === 0) return;
+    // Server marks every unmarked employee for the date in one request
+    bulkMarkMutation.mutate({ date: selectedDate, status });
   };
 
   const unmarkedCount = getUnmarkedEmployees().length;
@@ -152,22 +158,24 @@ function BulkAttendance() {
           {isMarking && (
             <div className="container-unibody">
               <StatusText type="loading" withCursor>
-                MARKING: {progress.current}/{progress.total} EMPLOYEES
+                {job?.status === 'RUNNING' && job.progress_total !== null
+                  ? `MARKING ${job.progress_done}/${job.progress_total} EMPLOYEES`
+                  : 'QUEUED'}
               </StatusText>
-              <div className="mt-4 h-2 bg-border">
-                <div
-                  className="h-full bg-systemBlue transition-all duration-300"
-                  style={{
-                    width: `${(progress.current / progress.total) * 100}%`,
-                  }}
-                />
-              </div>
             </div>
           )}
 
-          {!isMarking && progress.current > 0 && (
+          {markingFailed && (
+            <StatusText type="error" className="mt-4">
+              [ ERROR: BULK MARKING FAILED{job?.error && `: ${job.error}`} ]
+            </StatusText>
+          )}
+
+          {!isMarking && result && (
             <StatusText type="success" className="mt-4">
-              [ BULK MARKING COMPLETE: {progress.current}/{progress.total} ]
+              [ BULK MARKING COMPLETE: {result.summary.created} MARKED
+              {result.summary.skipped > 0 && `, ${result.summary.skipped} SKIPPED`}
+              {result.summary.failed > 0 && `, ${result.summary.failed} FAILED`} ]
             </StatusText>
           )}
         </>
@@ -1,19 +1,31 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { keepPreviousData, useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { useNavigate } from 'react-router-dom';
-import { getEmployees, deleteEmployee } from '../api';
-import { Button, Table, StatusText } from '../components/ui';
-import { useState } from 'react';
+import { getEmployees, deleteEmployee, searchEmployees } from '../api';
+import { Button, Input, Table, StatusText } from '../components/ui';
+import { useDeferredValue, useState } from 'react';
 
 function EmployeeList() {
   const navigate = useNavigate();
   const queryClient = useQueryClient();
   const [deleteId, setDeleteId] = useState<string | null>(null);
 
-  const { data: employees, isLoading, error } = useQuery({
+  const [search, setSearch] = useState('');
+  const searchTerm = useDeferredValue(search.trim());
+
+  const { data: allEmployees, isLoading, error } = useQuery({
     queryKey: ['employees'],
     queryFn: getEmployees,
   });
 
+  // Matching is done by the server's search index, not over the full list
+  const { data: searchResults } = useQuery({
+    queryKey: ['employees', 'search', searchTerm],
+    queryFn: () => searchEmployees(searchTerm),
+    enabled: searchTerm.length > 0,
+    placeholderData: keepPreviousData,
+  });
+  const employees = searchTerm ? searchResults : allEmployees;
+
   const deleteMutation = useMutation({
     mutationFn: deleteEmployee,
     onSuccess: () => {
@@ -63,6 +75,16 @@ function EmployeeList() {
         </Button>
       </div>
 
+      <div className="mb-8 max-w-md">
+        <Input
+          type="search"
+          label="SEARCH"
+          placeholder="ID, NAME OR EMAIL"
+          value={search}
+          onChange={(e) => setSearch(e.target.value)}
+        />
+      </div>
+
       {employees && employees.length === 0 ? (
         <StatusText type="info">[ NO EMPLOYEES FOUND ]</StatusText>
       ) : (
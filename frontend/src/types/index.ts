@@ -46,6 +46,70 @@ export interface AttendanceUpdate {
   status: 'PRESENT' | 'ABSENT';
 }
 
+export interface BulkAttendanceCreate {
+  date: string; // YYYY-MM-DD
+  status: 'PRESENT' | 'ABSENT';
+  employees?: string[]; // UUIDs; omit to mark all unmarked employees
+}
+
+export interface BulkAttendanceResult {
+  date: string;
+  status: 'PRESENT' | 'ABSENT';
+  created: string[];
+  skipped: string[];
+  failed: { employee: string; error: string }[];
+  summary: {
+    created: number;
+    skipped: number;
+    failed: number;
+  };
+}
+
+// Attendance Report (server-side filtered and aggregated)
+export interface AttendanceReportParams {
+  start?: string; // YYYY-MM-DD
+  end?: string; // YYYY-MM-DD
+  status?: 'PRESENT' | 'ABSENT';
+  department?: string;
+}
+
+export interface AttendanceTotals {
+  present: number;
+  absent: number;
+  attendance_rate: number | null; // Percentage of marked days present
+}
+
+export interface AttendanceReport {
+  next: string | null;
+  results: Attendance[];
+  summary: AttendanceTotals & { total: number };
+  departments: (AttendanceTotals & { department: string; total: number })[];
+  employees: (AttendanceTotals & {
+    employee: string;
+    employee_id: string;
+    employee_name: string;
+    department: string;
+  })[];
+}
+
+// Monthly attendance matrix: one row per employee, `days` holds one code
+// per day of the month ('P' present, 'A' absent, '-' not marked)
+export type AttendanceMatrixRow = [
+  id: string,
+  employee_id: string,
+  full_name: string,
+  department: string,
+  days: string,
+];
+
+export interface AttendanceMatrix {
+  month: string;
+  days: number;
+  codes: Record<string, 'PRESENT' | 'ABSENT' | null>;
+  columns: string[];
+  rows: AttendanceMatrixRow[];
+}
+
 // Dashboard Stats
 export interface DashboardStats {
   total_employees: number;
@@ -57,6 +121,24 @@ export interface DashboardStats {
   };
 }
 
+// Background Job (GET /api/jobs/<id>/)
+export type JobStatus = 'QUEUED' | 'RUNNING' | 'SUCCEEDED' | 'FAILED';
+
+export interface Job<Result = unknown> {
+  id: string; // UUID
+  kind: string;
+  status: JobStatus;
+  params: Record<string, unknown>;
+  progress_done: number;
+  progress_total: number | null; // Unknown until the job has started
+  result: Result | null; // Set once SUCCEEDED
+  error: string; // Set once FAILED
+  worker: string;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+}
+
 // API Error Response
 export interface ApiError {
   detail?: string;
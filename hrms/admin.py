@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import Employee, Attendance
+from .search import filter_employees
 
 
 @admin.register(Employee)
@@ -8,16 +9,18 @@ class EmployeeAdmin(admin.ModelAdmin):
 
     list_display = ("employee_id", "full_name", "email", "department", "created_at")
     list_filter = ("department", "created_at")
-    search_fields = (
-        "employee_id",
-        "full_name",
-        "email",
-        "department",
-    )  # For autocomplete
+    # Shows the search box and enables autocomplete; matching itself goes
+    # through the indexed search in get_search_results
+    search_fields = ("employee_id", "full_name", "email")
     readonly_fields = ("id", "created_at", "updated_at")
     ordering = ("-created_at",)
     date_hierarchy = "created_at"
 
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        return filter_employees(queryset, search_term), False
+
 
 @admin.register(Attendance)
 class AttendanceAdmin(admin.ModelAdmin):
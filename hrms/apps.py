@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class HrmsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "hrms"
+
+    def ready(self):
+        # Register signal receivers
+        from . import receivers  # noqa: F401
@@ -0,0 +1,129 @@
+"""
+Async versions of the hot read endpoints, routed when SERVER_MODE=asgi
+(see config/urls.py). DRF views are sync only, so these are plain Django
+async views that reuse the viewsets' querysets, pagination and serializers
+but fetch rows with the async ORM.
+"""
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_safe
+from rest_framework.exceptions import APIException
+from .cache import aget_dashboard_entry
+from .renderers import FastJSONRenderer
+from .conditional import (
+    build_validators,
+    cache_control_for,
+    not_modified,
+    set_validators,
+)
+from .views import AttendanceViewSet, EmployeeViewSet
+
+
+def _json(data, status=200):
+    return HttpResponse(
+        FastJSONRenderer().render(data), content_type="application/json", status=status
+    )
+
+
+@require_safe
+async def health_check(request):
+    """
+    Health check endpoint for deployment monitoring.
+    Returns 200 OK with status information.
+    """
+    return _json(
+        {
+            "status": "healthy",
+            "version": "1.0.0",
+            "service": "hrms-lite-backend",
+        }
+    )
+
+
+@require_safe
+async def dashboard_stats(request):
+    """Async DashboardStatsView: same cache entry, ETag and Last-Modified"""
+    entry = await aget_dashboard_entry()
+
+    not_modified = get_conditional_response(
+        request,
+        etag=entry["etag"],
+        last_modified=int(entry["last_modified"].timestamp()),
+    )
+    if not_modified is not None:
+        return not_modified
+
+    response = _json(entry["data"])
+    response["ETag"] = entry["etag"]
+    response["Last-Modified"] = http_date(entry["last_modified"].timestamp())
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def _wants_json(request):
+    """Plain JSON list request, as opposed to the browsable API or a stream"""
+    return (
+        request.method == "GET"
+        and "stream" not in request.GET
+        and "format" not in request.GET
+        and "text/html" not in request.headers.get("Accept", "")
+    )
+
+
+def async_list_view(viewset_class, basename):
+    """
+    Serve GET on a viewset's list route with the async ORM, including its
+    conditional GET handling. Other methods and list variants that need
+    DRF's rendering are handed to the sync viewset.
+    """
+    sync_view = sync_to_async(
+        viewset_class.as_view({"get": "list", "post": "create"}, basename=basename)
+    )
+
+    async def view(request, *args, **kwargs):
+        if not _wants_json(request):
+            return await sync_view(request, *args, **kwargs)
+
+        viewset = viewset_class(
+            action_map={"get": "list"},
+            args=args,
+            kwargs=kwargs,
+            format_kwarg=None,
+            basename=basename,
+        )
+        viewset.action = "list"
+        viewset.headers = {}
+        viewset.request = drf_request = viewset.initialize_request(request)
+        try:
+            # Authentication and permissions may read the session
+            await sync_to_async(viewset.initial)(drf_request)
+
+            queryset = viewset.filter_queryset(viewset.get_queryset())
+            rows = [row async for row in viewset.validator_queryset(queryset)]
+            etag, last_modified = build_validators(rows, viewset.validator_key())
+            response = not_modified(request, etag, last_modified)
+            if response is None:
+                page = await viewset.paginator.apaginate_queryset(
+                    viewset.get_list_queryset(), drf_request, view=viewset
+                )
+                response = _json(
+                    {
+                        "next": viewset.paginator.get_next_link(),
+                        "results": viewset.get_list_data(page),
+                    }
+                )
+        except APIException as exc:
+            return _json({"detail": exc.detail}, status=exc.status_code)
+        return set_validators(
+            response, etag, last_modified, cache_control_for(basename)
+        )
+
+    return csrf_exempt(view)
+
+
+employee_list = async_list_view(EmployeeViewSet, "employee")
+attendance_list = async_list_view(AttendanceViewSet, "attendance")
@@ -0,0 +1,46 @@
+import time
+from contextlib import contextmanager
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+
+class Measurement:
+    """Wall time and SQL query count of a measured block"""
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self.queries = 0
+
+
+@contextmanager
+def measure():
+    """Measure wall time and number of SQL queries executed inside the block"""
+    result = Measurement()
+    with CaptureQueriesContext(connection) as ctx:
+        start = time.perf_counter()
+        yield result
+        result.elapsed = time.perf_counter() - start
+    result.queries = len(ctx.captured_queries)
+
+
+@contextmanager
+def rollback_sandbox():
+    """
+    Run a benchmark inside a transaction that is always rolled back,
+    so benchmarks can be pointed at a real database without leaving data behind.
+    """
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+@contextmanager
+def api_client():
+    """
+    In-process DRF client usable outside the test runner.
+    Requests should pass secure=True so SECURE_SSL_REDIRECT does not
+    turn them into 301s.
+    """
+    with override_settings(ALLOWED_HOSTS=["testserver"]):
+        yield APIClient()
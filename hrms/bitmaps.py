@@ -0,0 +1,435 @@
+"""
+In-process bitmap index of attendance, for workforce-wide streak, rate and
+weekday pattern queries without scanning Attendance.
+
+For every year, each employee has two bitsets, days present and days
+absent, with bit n for day n of the year (0 = 1 January); marked days are
+their union. Bitsets are Python ints, so masking, shifting and
+int.bit_count() handle a whole year per operation in C. Each year holds
+one array of bitsets per status, indexed by the employee's slot; the
+snapshot stores those arrays packed, 46 bytes per employee and year.
+
+With ATTENDANCE_INDEX enabled, get_index() loads the index on first use,
+hrms.receivers apply this process's attendance writes to it on commit,
+and a background thread reloads it once it is older than
+ATTENDANCE_INDEX_MAX_AGE seconds, which bounds how long writes made by
+other processes go unseen. Loading reads a
+snapshot written by `manage.py attendance_index save` to
+ATTENDANCE_INDEX_SNAPSHOT when there is a recent enough one, and the whole
+Attendance table otherwise.
+"""
+
+import datetime
+import logging
+import os
+import struct
+import threading
+import time
+import uuid
+import zlib
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import CharField
+from django.db.models.functions import Cast
+from django.utils import timezone
+from .models import Attendance
+
+logger = logging.getLogger(__name__)
+
+# One bit per day of a leap year, rounded up to whole bytes
+YEAR_BYTES = 46
+SNAPSHOT_MAGIC = b"HRMSBIT1"
+# Header after the magic: built_at timestamp, employees, years
+SNAPSHOT_HEADER = struct.Struct("<dII")
+# Records updated shortly before a snapshot was taken are applied again on
+# load, in case their transaction committed after the snapshot read
+SNAPSHOT_OVERLAP = datetime.timedelta(minutes=5)
+LOAD_CHUNK_SIZE = 10_000
+
+# _lock guards _index and _pending; _load_lock lets one thread load at a
+# time without blocking writes to the current index
+_lock = threading.Lock()
+_load_lock = threading.Lock()
+_index = None
+# While a refresh runs, changes applied to the current index, to replay on
+# the new one; None when no refresh is running
+_pending = None
+
+
+def _day(date):
+    return date.timetuple().tm_yday - 1
+
+
+class AttendanceIndex:
+    """Present and absent day bitsets per employee and year"""
+
+    def __init__(self, built_at=None):
+        self.slots = {}  # employee UUID -> slot
+        self.employees = []  # slot -> employee UUID, None once removed
+        self.years = {}  # year -> (present, absent), lists of bitsets by slot
+        # Records committed before this are included
+        self.built_at = built_at or timezone.now()
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    def from_database(cls, queryset=None):
+        """Index the records in `queryset` (all attendance by default)"""
+        index = cls()
+        queryset = Attendance.objects.all() if queryset is None else queryset
+        # Rows come in (employee, date) order from the unique index. The
+        # key is read as text so a UUID is built once per employee rather
+        # than once per row.
+        records = (
+            queryset.order_by("employee_id", "date")
+            .annotate(key=Cast("employee_id", CharField()))
+            .values_list("key", "date", "status")
+        )
+        key = slot = None
+        year_starts = {}
+        for row_key, date, status in records.iterator(chunk_size=LOAD_CHUNK_SIZE):
+            if row_key != key:
+                key = row_key
+                slot = index._slot(uuid.UUID(key))
+            year = date.year
+            start = year_starts.get(year)
+            if start is None:
+                index._year(year)
+                start = year_starts[year] = datetime.date(year, 1, 1).toordinal()
+            bits = index.years[year][0 if status == "PRESENT" else 1]
+            bits[slot] |= 1 << (date.toordinal() - start)
+        return index
+
+    @classmethod
+    def from_snapshot(cls, path):
+        """Read a snapshot written by save(); raises ValueError if it is not one"""
+        with open(path, "rb") as f:
+            try:
+                data = zlib.decompress(f.read())
+            except zlib.error as exc:
+                raise ValueError(f"{path} is not an attendance index snapshot") from exc
+        if not data.startswith(SNAPSHOT_MAGIC):
+            raise ValueError(f"{path} is not an attendance index snapshot")
+        built_at, count, years = SNAPSHOT_HEADER.unpack_from(data, len(SNAPSHOT_MAGIC))
+        index = cls(
+            built_at=datetime.datetime.fromtimestamp(built_at, datetime.timezone.utc)
+        )
+        view = memoryview(data)
+        pos = len(SNAPSHOT_MAGIC) + SNAPSHOT_HEADER.size
+        index.employees = [
+            uuid.UUID(bytes=bytes(view[pos + 16 * i : pos + 16 * (i + 1)]))
+            for i in range(count)
+        ]
+        index.slots = {employee_id: i for i, employee_id in enumerate(index.employees)}
+        pos += 16 * count
+        for _ in range(years):
+            (year,) = struct.unpack_from("<H", data, pos)
+            pos += 2
+            arrays = []
+            for _ in range(2):
+                arrays.append(
+                    [
+                        int.from_bytes(view[offset : offset + YEAR_BYTES], "little")
+                        for offset in range(pos, pos + YEAR_BYTES * count, YEAR_BYTES)
+                    ]
+                )
+                pos += YEAR_BYTES * count
+            index.years[year] = tuple(arrays)
+        return index
+
+    def save(self, path):
+        """Write a compressed snapshot to `path`, replacing it atomically"""
+        slots = [slot for slot, e in enumerate(self.employees) if e is not None]
+        parts = [
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_HEADER.pack(
+                self.built_at.timestamp(), len(slots), len(self.years)
+            ),
+            b"".join(self.employees[slot].bytes for slot in slots),
+        ]
+        for year, arrays in sorted(self.years.items()):
+            parts.append(struct.pack("<H", year))
+            for bits in arrays:
+                parts.append(
+                    b"".join(
+                        bits[slot].to_bytes(YEAR_BYTES, "little") for slot in slots
+                    )
+                )
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, "wb") as f:
+            f.write(zlib.compress(b"".join(parts), 1))
+        os.replace(temp, path)
+
+    def catch_up(self):
+        """Apply records created or updated since the index was built"""
+        recent = Attendance.objects.filter(
+            updated_at__gte=self.built_at - SNAPSHOT_OVERLAP
+        )
+        self.built_at = timezone.now()
+        for employee_id, date, status in recent.order_by().values_list(
+            "employee_id", "date", "status"
+        ):
+            self.mark(employee_id, date, status)
+
+    def expire(self):
+        """Make get_index() load a fresh index on its next call"""
+        self.loaded_at = float("-inf")
+
+    def _slot(self, employee_id):
+        slot = self.slots.get(employee_id)
+        if slot is None:
+            # Readers take slots from self.employees, so the year arrays
+            # grow first
+            for present, absent in self.years.values():
+                present.append(0)
+                absent.append(0)
+            slot = len(self.employees)
+            self.employees.append(employee_id)
+            self.slots[employee_id] = slot
+        return slot
+
+    def _year(self, year):
+        arrays = self.years.get(year)
+        if arrays is None:
+            count = len(self.employees)
+            arrays = self.years[year] = ([0] * count, [0] * count)
+        return arrays
+
+    def mark(self, employee_id, date, status):
+        slot = self._slot(employee_id)
+        present, absent = self._year(date.year)
+        bit = 1 << _day(date)
+        if status == "PRESENT":
+            present[slot] |= bit
+            absent[slot] &= ~bit
+        else:
+            absent[slot] |= bit
+            present[slot] &= ~bit
+
+    def mark_many(self, employee_ids, date, status):
+        for employee_id in employee_ids:
+            self.mark(employee_id, date, status)
+
+    def unmark(self, employee_id, date):
+        slot = self.slots.get(employee_id)
+        arrays = self.years.get(date.year)
+        if slot is None or arrays is None:
+            return
+        mask = ~(1 << _day(date))
+        for bits in arrays:
+            bits[slot] &= mask
+
+    def remove_employee(self, employee_id):
+        slot = self.slots.pop(employee_id, None)
+        if slot is None:
+            return
+        self.employees[slot] = None
+        for arrays in self.years.values():
+            for bits in arrays:
+                bits[slot] = 0
+
+    def range_bits(self, start, end):
+        """
+        Yield (employee UUID, present, absent) for every indexed employee,
+        with the bitsets cut to start..end: bit 0 is `start`.
+        """
+        parts = []
+        offset = 0
+        for year in range(start.year, end.year + 1):
+            first = max(start, datetime.date(year, 1, 1))
+            last = min(end, datetime.date(year, 12, 31))
+            days = (last - first).days + 1
+            if year in self.years:
+                present, absent = self.years[year]
+                parts.append((present, absent, _day(first), (1 << days) - 1, offset))
+            offset += days
+
+        if len(parts) == 1 and parts[0][2] == parts[0][4] == 0:
+            # Range starts on 1 January: mask only
+            present, absent, _, mask, _ = parts[0]
+            for slot, employee_id in enumerate(self.employees):
+                if employee_id is not None:
+                    yield employee_id, present[slot] & mask, absent[slot] & mask
+            return
+
+        for slot, employee_id in enumerate(self.employees):
+            if employee_id is None:
+                continue
+            present_bits = absent_bits = 0
+            for present, absent, shift, mask, offset in parts:
+                present_bits |= ((present[slot] >> shift) & mask) << offset
+                absent_bits |= ((absent[slot] >> shift) & mask) << offset
+            yield employee_id, present_bits, absent_bits
+
+    def counts(self, start, end):
+        """
+        {employee UUID: (present days, absent days)} within start..end, for
+        employees marked in it
+        """
+        return {
+            employee_id: (present.bit_count(), absent.bit_count())
+            for employee_id, present, absent in self.range_bits(start, end)
+            if present or absent
+        }
+
+    def absence_streaks(self, start, end, min_days=1):
+        """
+        {employee UUID: longest run of consecutive absent days} within
+        start..end, for employees with a run of at least `min_days`
+        """
+        streaks = {}
+        for employee_id, _, absent in self.range_bits(start, end):
+            # After n steps only bits starting a run of n + 1 days are left
+            run = absent
+            for _ in range(min_days - 1):
+                run &= run >> 1
+            if not run:
+                continue
+            longest = max(min_days - 1, 0)
+            while run:
+                run &= run >> 1
+                longest += 1
+            streaks[employee_id] = longest
+        return streaks
+
+    def weekday_counts(self, start, end, status="ABSENT"):
+        """
+        {employee UUID: [days with `status` on Mondays, ..., Sundays]}
+        within start..end, for employees with any
+        """
+        days = (end - start).days + 1
+        masks = []
+        for weekday in range(7):
+            first = (weekday - start.weekday()) % 7
+            masks.append(sum(1 << day for day in range(first, days, 7)))
+        counts = {}
+        for employee_id, present, absent in self.range_bits(start, end):
+            bits = present if status == "PRESENT" else absent
+            if bits:
+                counts[employee_id] = [(bits & mask).bit_count() for mask in masks]
+        return counts
+
+
+def _expired(index):
+    return time.monotonic() - index.loaded_at > settings.ATTENDANCE_INDEX_MAX_AGE
+
+
+def _load():
+    path = settings.ATTENDANCE_INDEX_SNAPSHOT
+    max_age = datetime.timedelta(seconds=settings.ATTENDANCE_INDEX_MAX_AGE)
+    if path and os.path.exists(path):
+        try:
+            index = AttendanceIndex.from_snapshot(path)
+        except (OSError, ValueError, struct.error):
+            logger.warning("Ignoring unreadable attendance index snapshot %s", path)
+        else:
+            if timezone.now() - index.built_at <= max_age:
+                index.catch_up()
+                return index
+    return AttendanceIndex.from_database()
+
+
+def get_index():
+    """
+    This process's index, loaded on first use. Once expired it is still
+    returned while a background thread loads its replacement.
+    """
+    index = _index
+    if index is None:
+        refresh()
+        return _index
+    if _expired(index):
+        _refresh_in_background()
+    return index
+
+
+def _refresh_in_background():
+    global _pending
+    with _lock:
+        if _pending is not None:
+            return
+        _pending = []
+    threading.Thread(
+        target=_background_refresh, name="attendance-index-refresh", daemon=True
+    ).start()
+
+
+def _background_refresh():
+    try:
+        refresh()
+    except Exception:
+        logger.exception("Refreshing the attendance index failed")
+    finally:
+        connections.close_all()
+
+
+def refresh():
+    """Load a new index and replace the current one with it"""
+    global _index, _pending
+    with _load_lock:
+        if _index is not None and not _expired(_index):
+            # Loaded by another thread while this one waited
+            return
+        with _lock:
+            if _pending is None:
+                _pending = []
+        try:
+            fresh = _load()
+            with _lock:
+                # Changes committed during the load may be missing from it
+                for change in _pending:
+                    change(fresh)
+                _index = fresh
+        finally:
+            with _lock:
+                _pending = None
+
+
+def reset():
+    """Drop this process's index; the next get_index() loads it again"""
+    global _index
+    with _lock:
+        _index = None
+
+
+def _apply(change):
+    with _lock:
+        if _index is not None:
+            change(_index)
+        if _pending is not None:
+            _pending.append(change)
+
+
+def _on_commit(change):
+    # Nothing to keep current until an index has been loaded
+    if settings.ATTENDANCE_INDEX and _index is not None:
+        transaction.on_commit(lambda: _apply(change))
+
+
+def record_marked(employee_ids, date, status):
+    employee_ids = list(employee_ids)
+    _on_commit(lambda index: index.mark_many(employee_ids, date, status))
+
+
+def record_moved(loaded, employee_id, date, status):
+    """
+    An updated record, with `loaded` its (employee_id, date, status) as
+    read from the database, or () if unknown
+    """
+    if not loaded:
+        # Where the record was is unknown: reload on next use
+        _on_commit(AttendanceIndex.expire)
+        return
+
+    def move(index):
+        index.unmark(loaded[0], loaded[1])
+        index.mark(employee_id, date, status)
+
+    _on_commit(move)
+
+
+def record_removed(employee_id, date):
+    _on_commit(lambda index: index.unmark(employee_id, date))
+
+
+def record_employee_removed(employee_id):
+    _on_commit(lambda index: index.remove_employee(employee_id))
@@ -0,0 +1,269 @@
+"""
+Bulk inserts and upserts that use PostgreSQL COPY when available.
+
+bulk_write() streams rows with COPY FROM STDIN into a temporary table and
+moves them into the model's table with one INSERT ... SELECT, optionally
+ON CONFLICT DO NOTHING / DO UPDATE. Postgres then parses one COPY stream
+instead of multi-row INSERT statements with thousands of parameters.
+Other databases, small writes and DB_COPY_WRITES=False use bulk_create
+with the same conflict handling.
+
+With `returning`, bulk_write() reports which rows were inserted rather
+than skipped on conflict: through RETURNING on PostgreSQL, and by reading
+the conflicting keys inside the transaction elsewhere.
+"""
+
+import io
+import uuid
+from itertools import islice
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+# Rows per COPY + INSERT ... SELECT round, each in its own transaction
+COPY_BATCH_SIZE = 100_000
+
+
+def copy_enabled(using=DEFAULT_DB_ALIAS):
+    return settings.DB_COPY_WRITES and connections[using].vendor == "postgresql"
+
+
+def bulk_write(
+    model,
+    fields,
+    rows,
+    unique_fields=None,
+    update_fields=None,
+    batch_size=None,
+    using=DEFAULT_DB_ALIAS,
+    returning=None,
+):
+    """
+    Insert `rows`, tuples of values for `fields` (attnames such as
+    "employee_id"), into the model's table. auto_now and auto_now_add
+    timestamps are filled in.
+
+    With `unique_fields`, rows conflicting on them are skipped, or, with
+    `update_fields`, have those fields (and auto_now timestamps)
+    overwritten. Without, a conflict raises IntegrityError as with
+    bulk_create. `batch_size` is the rows per INSERT on the bulk_create
+    path. Returns the number of rows sent.
+
+    With `returning`, names from `fields`, returns instead a list of
+    tuples of those values for the rows actually inserted, leaving out
+    rows skipped on conflict. Needs `unique_fields` without
+    `update_fields`.
+    """
+    if returning and (not unique_fields or update_fields):
+        raise ValueError("returning needs unique_fields without update_fields")
+    fields = list(fields)
+    timestamps = [
+        field.attname
+        for field in model._meta.concrete_fields
+        if (getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False))
+        and field.attname not in fields
+    ]
+    update_fields = list(update_fields or [])
+    if update_fields:
+        update_fields += [
+            field.attname
+            for field in model._meta.concrete_fields
+            if getattr(field, "auto_now", False) and field.attname not in update_fields
+        ]
+
+    use_copy = copy_enabled(using)
+    chunk_size = COPY_BATCH_SIZE if use_copy else (batch_size or COPY_BATCH_SIZE)
+    rows = iter(rows)
+    sent = 0
+    inserted = []
+
+    def stamped(batch):
+        now = timezone.now()
+        return [(*row, *([now] * len(timestamps))) for row in batch]
+
+    while batch := list(islice(rows, chunk_size)):
+        if use_copy and len(batch) >= settings.DB_COPY_MIN_ROWS:
+            inserted += _copy_batch(
+                model,
+                fields + timestamps,
+                stamped(batch),
+                unique_fields,
+                update_fields,
+                using,
+                returning,
+            )
+        elif returning and connections[using].vendor == "postgresql":
+            inserted += _insert_batch(
+                model,
+                fields + timestamps,
+                stamped(batch),
+                unique_fields,
+                batch_size or len(batch),
+                using,
+                returning,
+            )
+        elif returning:
+            inserted += _create_batch(
+                model, fields, batch, unique_fields, batch_size, using, returning
+            )
+        else:
+            model._default_manager.db_manager(using).bulk_create(
+                [model(**dict(zip(fields, row))) for row in batch],
+                batch_size=batch_size,
+                ignore_conflicts=bool(unique_fields) and not update_fields,
+                update_conflicts=bool(update_fields),
+                unique_fields=unique_fields if update_fields else None,
+                update_fields=update_fields or None,
+            )
+        sent += len(batch)
+    return inserted if returning else sent
+
+
+def _columns(model, names, quote):
+    return ", ".join(quote(model._meta.get_field(name).column) for name in names)
+
+
+def _copy_batch(model, fields, rows, unique_fields, update_fields, using, returning):
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    columns = _columns(model, fields, quote)
+    table = quote(model._meta.db_table)
+    temp = quote(f"hrms_copy_{uuid.uuid4().hex}")
+    # Position of each row in `rows`, so that duplicates resolve the same
+    # way as on the bulk_create path
+    seq = quote("hrms_copy_seq")
+
+    select = f"SELECT {columns} FROM {temp}"
+    conflict = ""
+    if unique_fields:
+        keys = ", ".join(
+            quote(model._meta.get_field(name).column) for name in unique_fields
+        )
+        if update_fields:
+            # A row may only be updated once per statement; the last wins
+            select = (
+                f"SELECT DISTINCT ON ({keys}) {columns} FROM {temp} "
+                f"ORDER BY {keys}, {seq} DESC"
+            )
+            assignments = ", ".join(
+                f"{column} = EXCLUDED.{column}"
+                for column in (
+                    quote(model._meta.get_field(name).column) for name in update_fields
+                )
+            )
+            conflict = f" ON CONFLICT ({keys}) DO UPDATE SET {assignments}"
+        else:
+            # The first is inserted and later duplicates skipped
+            select += f" ORDER BY {seq}"
+            conflict = f" ON CONFLICT ({keys}) DO NOTHING"
+    if returning:
+        conflict += f" RETURNING {_columns(model, returning, quote)}"
+
+    with transaction.atomic(
+        using=using, savepoint=False
+    ), connection.cursor() as cursor:
+        # Same column types as the target, but no constraints or indexes
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {temp} ON COMMIT DROP AS "
+            f"SELECT {columns} FROM {table} WITH NO DATA"
+        )
+        cursor.execute(
+            f"ALTER TABLE {temp} ADD COLUMN {seq} bigint GENERATED ALWAYS AS IDENTITY"
+        )
+        copy = f"COPY {temp} ({columns}) FROM STDIN"
+        raw = cursor.cursor
+        if hasattr(raw, "copy_expert"):  # psycopg2
+            raw.copy_expert(copy, io.StringIO(copy_text(rows)))
+        else:  # psycopg 3 adapts values itself
+            with raw.copy(copy) as stream:
+                for row in rows:
+                    stream.write_row(row)
+        cursor.execute(f"INSERT INTO {table} ({columns}) {select}{conflict}")
+        inserted = [tuple(row) for row in cursor.fetchall()] if returning else []
+        # ON COMMIT DROP only fires at the outermost commit
+        cursor.execute(f"DROP TABLE {temp}")
+    return inserted
+
+
+def _insert_batch(model, fields, rows, unique_fields, batch_size, using, returning):
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING, for batches too small to COPY"""
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    model_fields = [model._meta.get_field(name) for name in fields]
+    sql = (
+        f"INSERT INTO {quote(model._meta.db_table)} ({_columns(model, fields, quote)}) "
+        "VALUES {values} "
+        f"ON CONFLICT ({_columns(model, unique_fields, quote)}) DO NOTHING "
+        f"RETURNING {_columns(model, returning, quote)}"
+    )
+    placeholder = "(" + ", ".join(["%s"] * len(fields)) + ")"
+    inserted = []
+    with transaction.atomic(
+        using=using, savepoint=False
+    ), connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            chunk = rows[start : start + batch_size]
+            cursor.execute(
+                sql.format(values=", ".join([placeholder] * len(chunk))),
+                [
+                    field.get_db_prep_save(value, connection)
+                    for row in chunk
+                    for field, value in zip(model_fields, row)
+                ],
+            )
+            inserted += [tuple(row) for row in cursor.fetchall()]
+    return inserted
+
+
+def _create_batch(model, fields, rows, unique_fields, batch_size, using, returning):
+    """
+    bulk_create skipping conflicts, returning the rows it inserted. The
+    keys already present are read in the same transaction as the insert,
+    so on SQLite, which serializes writers, no other insert comes between.
+    """
+    key_at = [fields.index(name) for name in unique_fields]
+    returned_at = [fields.index(name) for name in returning]
+    manager = model._default_manager.db_manager(using)
+
+    def key(row):
+        return tuple(row[i] for i in key_at)
+
+    with transaction.atomic(using=using, savepoint=False):
+        # Narrowed per field, then matched on the whole key
+        candidates = manager.filter(
+            **{
+                f"{name}__in": {row[i] for row in rows}
+                for name, i in zip(unique_fields, key_at)
+            }
+        ).values_list(*unique_fields)
+        seen = set(candidates)
+        new_rows = []
+        for row in rows:
+            if key(row) not in seen:
+                seen.add(key(row))
+                new_rows.append(row)
+        manager.bulk_create(
+            [model(**dict(zip(fields, row))) for row in new_rows],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+    return [tuple(row[i] for i in returned_at) for row in new_rows]
+
+
+def copy_text(rows):
+    """Rows in COPY's default text format"""
+    return "".join(
+        "\t".join(_copy_value(value) for value in row) + "\n" for row in rows
+    )
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
@@ -0,0 +1,63 @@
+import hashlib
+import json
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+from .services import adashboard_stats, dashboard_stats
+
+DASHBOARD_CACHE_KEY = "hrms:dashboard"
+
+
+def _today():
+    return timezone.localtime(timezone.now()).date()
+
+
+def _is_current(entry, today):
+    return entry is not None and entry["date"] == today
+
+
+def _build_entry(today, data):
+    body = json.dumps(data, cls=JSONEncoder, sort_keys=True).encode()
+    return {
+        "date": today,
+        "data": data,
+        "etag": f'"{hashlib.md5(body).hexdigest()}"',
+        "last_modified": timezone.now(),
+    }
+
+
+def get_dashboard_entry():
+    """
+    Return the cached dashboard entry, computing it on a miss.
+
+    The entry holds the response payload plus an ETag and Last-Modified
+    timestamp, so a warm cache answers both full and conditional requests
+    without touching the database. It is rebuilt when invalidated or when
+    the local date rolls over.
+    """
+    today = _today()
+    entry = cache.get(DASHBOARD_CACHE_KEY)
+    if _is_current(entry, today):
+        return entry
+
+    entry = _build_entry(today, dashboard_stats(today))
+    cache.set(DASHBOARD_CACHE_KEY, entry, settings.DASHBOARD_CACHE_TIMEOUT)
+    return entry
+
+
+async def aget_dashboard_entry():
+    """get_dashboard_entry for async views"""
+    today = _today()
+    entry = await cache.aget(DASHBOARD_CACHE_KEY)
+    if _is_current(entry, today):
+        return entry
+
+    entry = _build_entry(today, await adashboard_stats(today))
+    await cache.aset(DASHBOARD_CACHE_KEY, entry, settings.DASHBOARD_CACHE_TIMEOUT)
+    return entry
+
+
+def invalidate_dashboard():
+    """Drop cached dashboard stats after employees or attendance change"""
+    cache.delete(DASHBOARD_CACHE_KEY)
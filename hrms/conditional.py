@@ -0,0 +1,109 @@
+import hashlib
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def validator_rows(queryset, timestamp_fields):
+    """Primary key plus each timestamp feeding the payload, per row"""
+    return queryset.values_list("pk", *timestamp_fields)
+
+
+def build_validators(rows, key):
+    """
+    (ETag, Last-Modified datetime or None) from validator_rows results.
+
+    Inserts and deletes change the keys and every update bumps a timestamp,
+    so the pair changes whenever the rows do. The key (path, query string,
+    including any cursor, and response format) separates representations
+    of the same rows.
+    """
+    digest = hashlib.md5(key.encode())
+    last_modified = None
+    for row in rows:
+        digest.update(("|" + "|".join(str(value) for value in row)).encode())
+        for value in row[1:]:
+            if value and (last_modified is None or value > last_modified):
+                last_modified = value
+    # Weak: derived from the data, not from the response bytes
+    return f'W/"{digest.hexdigest()}"', last_modified
+
+
+def not_modified(request, etag, last_modified):
+    """304 response if the client's copy is current, else None"""
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+
+def set_validators(response, etag, last_modified, cache_control):
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, **cache_control)
+    return response
+
+
+def cache_control_for(basename):
+    """Cache-Control directives for a viewset, from settings.API_CACHE_CONTROL"""
+    policies = settings.API_CACHE_CONTROL
+    return policies.get(basename, policies["default"])
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified on list and retrieve.
+
+    Validators come from the keys and latest `validator_timestamps` of the
+    rows the response shows: the requested page of a list (fetched with
+    the paginator's keyset query, so the cost does not grow with the
+    collection) or the retrieved row. An unchanged page answers 304
+    without serializing rows. `validator_timestamps` must cover every
+    table the payload reads. Streamed lists are exports and are not
+    validated.
+    """
+
+    validator_timestamps = ("updated_at",)
+
+    def list(self, request, *args, **kwargs):
+        if "stream" in request.query_params:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.conditional(queryset, super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup]}
+            )
+        except (DjangoValidationError, ValueError):
+            # Malformed key; retrieve() answers 404
+            return super().retrieve(request, *args, **kwargs)
+        return self.conditional(queryset, super().retrieve, request, *args, **kwargs)
+
+    def validator_queryset(self, queryset):
+        """validator_rows for what the response shows: one page of a list"""
+        if self.action == "list" and self.paginator is not None:
+            queryset = self.paginator.page_queryset(queryset, self.request)
+        return validator_rows(queryset, self.validator_timestamps)
+
+    def conditional(self, queryset, respond, request, *args, **kwargs):
+        """Answer 304 or call respond(), adding the validators either way"""
+        rows = list(self.validator_queryset(queryset))
+        if not rows and self.action == "retrieve":
+            return respond(request, *args, **kwargs)
+
+        etag, last_modified = build_validators(rows, self.validator_key())
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            response = respond(request, *args, **kwargs)
+        return set_validators(
+            response, etag, last_modified, cache_control_for(self.basename)
+        )
+
+    def validator_key(self):
+        return f"{self.request.get_full_path()}|{self.request.accepted_renderer.format}"
@@ -0,0 +1,202 @@
+import codecs
+import csv
+import uuid
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from rest_framework import serializers
+from .bulkwrite import bulk_write
+from .models import Employee
+from .seeding import chunked
+from .serializers import EMPLOYEE_NORMALIZERS
+from .signals import employees_bulk_created
+
+IMPORT_COLUMNS = tuple(EMPLOYEE_NORMALIZERS)
+
+# Rows validated, duplicate-checked and inserted together
+IMPORT_BATCH_SIZE = 1000
+
+
+class ImportFormatError(Exception):
+    """The uploaded file cannot be read as an employee sheet"""
+
+
+def _header(names):
+    """Map column positions to employee fields, ignoring unknown columns"""
+    columns = [str(name or "").strip().lower() for name in names]
+    missing = [name for name in IMPORT_COLUMNS if name not in columns]
+    if missing:
+        raise ImportFormatError(f"Missing column(s): {', '.join(missing)}.")
+    return columns
+
+
+def read_csv(fileobj, encoding="utf-8-sig"):
+    """
+    Yield (row number, {column: value}) from a binary CSV file object.
+    Decodes incrementally, so only the current line is held in memory.
+    """
+    reader = csv.reader(codecs.iterdecode(fileobj, encoding))
+    try:
+        columns = _header(next(reader, []))
+        for values in reader:
+            if not any(value.strip() for value in values):
+                continue
+            yield reader.line_num, dict(zip(columns, values))
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise ImportFormatError(f"Invalid CSV: {exc}") from exc
+
+
+def read_xlsx(fileobj):
+    """Yield (row number, {column: value}) from the first sheet of an XLSX file"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFormatError("XLSX import requires the openpyxl package.")
+
+    try:
+        # read_only streams rows instead of loading the whole sheet
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    except Exception as exc:
+        raise ImportFormatError(f"Invalid XLSX: {exc}") from exc
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        columns = _header(next(rows, ()))
+        for number, values in enumerate(rows, start=2):
+            if all(value is None or str(value).strip() == "" for value in values):
+                continue
+            yield number, {
+                column: "" if value is None else str(value)
+                for column, value in zip(columns, values)
+            }
+    finally:
+        workbook.close()
+
+
+READERS = {
+    "csv": read_csv,
+    "xlsx": read_xlsx,
+}
+
+
+def _normalize(row):
+    """Run the EmployeeSerializer field rules on one row; returns (values, errors)"""
+    values = {}
+    errors = {}
+    for name, normalize in EMPLOYEE_NORMALIZERS.items():
+        raw = row.get(name)
+        if raw is None:
+            errors[name] = ["This field is required."]
+            continue
+        try:
+            value = normalize(raw)
+        except serializers.ValidationError as exc:
+            errors[name] = exc.detail
+            continue
+        max_length = Employee._meta.get_field(name).max_length
+        if len(value) > max_length:
+            errors[name] = [
+                f"Ensure this field has no more than {max_length} characters."
+            ]
+            continue
+        values[name] = value
+    return values, errors
+
+
+def _taken(candidates):
+    """Row errors of (row number, values) whose employee ID or email exists"""
+    taken_ids = set()
+    taken_emails = set()
+    for employee_id, email in Employee.objects.filter(
+        Q(employee_id__in=[values["employee_id"] for _, values in candidates])
+        | Q(email__in=[values["email"] for _, values in candidates])
+    ).values_list("employee_id", "email"):
+        taken_ids.add(employee_id)
+        taken_emails.add(email)
+
+    errors = {}
+    for number, values in candidates:
+        row_errors = {}
+        if values["employee_id"] in taken_ids:
+            row_errors["employee_id"] = [
+                "employee with this employee id already exists."
+            ]
+        if values["email"] in taken_emails:
+            row_errors["email"] = ["employee with this email already exists."]
+        if row_errors:
+            errors[number] = row_errors
+    return errors
+
+
+def import_employees(rows, batch_size=IMPORT_BATCH_SIZE, progress=None):
+    """
+    Create employees from (row number, {column: value}) pairs.
+
+    Rows are processed in chunks: each chunk is normalized, checked for
+    duplicates within the file and against the database with one query,
+    and inserted with one bulk_create in its own transaction, so valid
+    chunks are kept when later rows fail. If another request takes an
+    employee ID or email in between, the check is repeated and the chunk
+    inserted without the rows that now conflict. Memory is bounded by the
+    chunk size plus the keys seen so far. `progress`, if given, is called
+    with the number of rows processed after each chunk.
+    """
+    seen_ids = set()
+    seen_emails = set()
+    created = 0
+    errors = []
+    processed = 0
+
+    for chunk in chunked(rows, batch_size):
+        chunk_errors = []
+        candidates = []
+        for number, row in chunk:
+            values, row_errors = _normalize(row)
+            if "employee_id" in values and values["employee_id"] in seen_ids:
+                row_errors["employee_id"] = ["Duplicate employee ID in file."]
+            if "email" in values and values["email"] in seen_emails:
+                row_errors["email"] = ["Duplicate email in file."]
+            seen_ids.add(values.get("employee_id"))
+            seen_emails.add(values.get("email"))
+            if row_errors:
+                chunk_errors.append({"row": number, "errors": row_errors})
+            else:
+                candidates.append((number, values))
+
+        conflict = None
+        while candidates:
+            taken = _taken(candidates)
+            if conflict is not None and not taken:
+                # Not a duplicate employee ID or email after all
+                raise conflict
+            chunk_errors += [
+                {"row": number, "errors": row_errors}
+                for number, row_errors in taken.items()
+            ]
+            candidates = [row for row in candidates if row[0] not in taken]
+            employees = [
+                (uuid.uuid4(), *(values[name] for name in IMPORT_COLUMNS))
+                for _, values in candidates
+            ]
+            if not employees:
+                break
+            try:
+                with transaction.atomic():
+                    bulk_write(Employee, ("id", *IMPORT_COLUMNS), employees)
+                    employees_bulk_created.send(
+                        sender=Employee, employee_ids=[row[0] for row in employees]
+                    )
+            except IntegrityError as exc:
+                # Taken by another request since the check
+                conflict = exc
+                continue
+            created += len(employees)
+            break
+        errors.extend(sorted(chunk_errors, key=lambda error: error["row"]))
+        processed += len(chunk)
+        if progress is not None:
+            progress(processed)
+
+    return {
+        "created": created,
+        "failed": len(errors),
+        "errors": errors,
+    }
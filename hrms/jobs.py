@@ -0,0 +1,305 @@
+"""
+Database-backed background jobs.
+
+Views enqueue() a Job row and answer 202 with its ID instead of doing the
+work inside the request; `manage.py run_hrms_worker` processes claim queued
+jobs, run the handler registered for the job's kind and record progress,
+the result or the error on the row, which GET /api/jobs/<id>/ reports.
+No broker is needed: a job is claimed with a conditional UPDATE, so any
+number of workers can poll the same table.
+"""
+
+import datetime
+import io
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connections, transaction
+from django.utils import timezone
+from . import partitions
+from .imports import IMPORT_BATCH_SIZE, READERS, import_employees
+from .models import Employee, Job
+from .rollups import history_bounds, rebuild_rollups
+from .seeding import chunked
+from .services import BULK_BATCH_SIZE, bulk_mark_attendance
+from .summaries import employee_id_chunks, rebuild_summaries
+
+logger = logging.getLogger(__name__)
+
+# Job kind -> handler(job, progress) returning the JSON-serializable result
+HANDLERS = {}
+
+# Employees per summary rebuild and days per rollup rebuild transaction
+SUMMARY_CHUNK = 1000
+ROLLUP_CHUNK_DAYS = 31
+
+
+def job(kind):
+    """Register the decorated function as the handler for `kind`"""
+
+    def register(handler):
+        HANDLERS[kind] = handler
+        return handler
+
+    return register
+
+
+def enqueue(kind, params=None, payload=None):
+    """Queue a job for the workers and return it"""
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown job kind {kind!r}")
+    return Job.objects.create(kind=kind, params=params or {}, payload=payload)
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim_next(worker):
+    """
+    Mark the oldest queued job RUNNING for `worker` and return it, or None.
+    The UPDATE only matches while the row is still QUEUED, so when workers
+    race for the same job exactly one wins and the others try the next.
+    """
+    while True:
+        candidate = (
+            Job.objects.filter(status=Job.QUEUED)
+            .order_by("created_at")
+            .values_list("id", flat=True)
+            .first()
+        )
+        if candidate is None:
+            return None
+        now = timezone.now()
+        claimed = Job.objects.filter(id=candidate, status=Job.QUEUED).update(
+            status=Job.RUNNING,
+            worker=worker,
+            started_at=now,
+            heartbeat_at=now,
+            updated_at=now,
+        )
+        if claimed:
+            return Job.objects.get(id=candidate)
+
+
+def progress_reporter(job_id):
+    """progress(done, total=None) callback storing progress and a heartbeat"""
+
+    def progress(done, total=None):
+        fields = {"progress_done": done, "heartbeat_at": timezone.now()}
+        if total is not None:
+            fields["progress_total"] = total
+        Job.objects.filter(id=job_id).update(**fields)
+
+    return progress
+
+
+def heartbeat(job_id, stop, interval):
+    """
+    Bump the job's heartbeat every `interval` seconds until `stop` (a
+    threading.Event) is set, so a handler busy in one long step is not
+    taken for a dead worker by fail_stale().
+    """
+    while not stop.wait(interval):
+        try:
+            Job.objects.filter(id=job_id, status=Job.RUNNING).update(
+                heartbeat_at=timezone.now()
+            )
+        except DatabaseError:
+            # e.g. SQLite locked by the job's own write; try again next beat
+            logger.warning("Heartbeat for job %s failed", job_id, exc_info=True)
+
+
+def _heartbeat_thread(job_id, stop, interval):
+    try:
+        heartbeat(job_id, stop, interval)
+    finally:
+        # This thread's own connection
+        connections.close_all()
+
+
+def run_job(job):
+    """Run a claimed job, with heartbeats from a thread, and record its outcome"""
+    stop_heartbeat = threading.Event()
+    beat = threading.Thread(
+        target=_heartbeat_thread,
+        args=(job.id, stop_heartbeat, settings.JOB_HEARTBEAT_SECONDS),
+        name=f"hrms-job-heartbeat-{job.id}",
+        daemon=True,
+    )
+    beat.start()
+    try:
+        handler = HANDLERS.get(job.kind)
+        if handler is None:
+            raise ValueError(f"Unknown job kind {job.kind!r}")
+        result = handler(job, progress_reporter(job.id))
+    except Exception as exc:
+        logger.exception("Job %s (%s) failed", job.id, job.kind)
+        outcome = {"status": Job.FAILED, "error": str(exc) or type(exc).__name__}
+    else:
+        outcome = {"status": Job.SUCCEEDED, "result": result}
+    finally:
+        stop_heartbeat.set()
+        beat.join()
+    now = timezone.now()
+    # The uploaded file is not needed once the job has finished
+    Job.objects.filter(id=job.id).update(
+        **outcome, payload=None, finished_at=now, updated_at=now
+    )
+    job.refresh_from_db()
+    return job
+
+
+def fail_stale():
+    """
+    Fail RUNNING jobs whose worker stopped sending heartbeats (killed or
+    crashed); a live worker beats every JOB_HEARTBEAT_SECONDS. They are
+    not retried: handlers may have committed part of their work, and the
+    client decides whether to submit again.
+    """
+    now = timezone.now()
+    return Job.objects.filter(
+        status=Job.RUNNING,
+        heartbeat_at__lt=now - datetime.timedelta(seconds=settings.JOB_STALE_SECONDS),
+    ).update(
+        status=Job.FAILED,
+        error="The worker stopped before the job finished.",
+        payload=None,
+        finished_at=now,
+        updated_at=now,
+    )
+
+
+def prune_finished():
+    """Delete finished jobs older than JOB_RETENTION_DAYS"""
+    cutoff = timezone.now() - datetime.timedelta(days=settings.JOB_RETENTION_DAYS)
+    deleted, _ = Job.objects.filter(
+        status__in=(Job.SUCCEEDED, Job.FAILED), finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+def work(worker=None, poll_interval=1.0, once=False, stop=None):
+    """
+    Process jobs until `stop` (a threading.Event) is set, or, with `once`,
+    until the queue is empty. A job in progress always runs to completion.
+    Returns the number of jobs processed.
+    """
+    worker = worker or worker_name()
+    stop = stop or threading.Event()
+    processed = 0
+    next_maintenance = 0.0
+    while not stop.is_set():
+        claimed = claim_next(worker)
+        if claimed is not None:
+            run_job(claimed)
+            processed += 1
+            continue
+        if once:
+            break
+        if time.monotonic() >= next_maintenance:
+            fail_stale()
+            prune_finished()
+            if partitions.is_partitioned():
+                partitions.ensure_partitions()
+            next_maintenance = time.monotonic() + 60
+        # Idle: drop connections that broke or outlived CONN_MAX_AGE
+        close_old_connections()
+        stop.wait(poll_interval)
+    return processed
+
+
+@job("bulk_mark")
+def bulk_mark(job, progress):
+    """
+    bulk_mark_attendance() one chunk of employees at a time, with the same
+    result as a single call. Without "employees", every employee unmarked
+    on the date when the job starts is marked.
+    """
+    date = datetime.date.fromisoformat(str(job.params["date"]))
+    status = job.params["status"]
+    if job.params.get("employees") is None:
+        targets = list(
+            Employee.objects.exclude(attendance_records__date=date).values_list(
+                "id", flat=True
+            )
+        )
+    else:
+        targets = list(
+            dict.fromkeys(uuid.UUID(str(i)) for i in job.params["employees"])
+        )
+
+    result = {
+        "date": date,
+        "status": status,
+        "created": [],
+        "skipped": [],
+        "failed": [],
+    }
+    progress(0, len(targets))
+    for done, chunk in enumerate(chunked(targets, BULK_BATCH_SIZE), start=1):
+        marked = bulk_mark_attendance(date, status, chunk)
+        for key in ("created", "skipped", "failed"):
+            result[key] += marked[key]
+        progress(min(done * BULK_BATCH_SIZE, len(targets)))
+    result["summary"] = {
+        key: len(result[key]) for key in ("created", "skipped", "failed")
+    }
+    return result
+
+
+@job("import_employees")
+def import_employees_job(job, progress):
+    """import_employees() on the uploaded file; progress counts rows read"""
+    rows = READERS[job.params["extension"]](io.BytesIO(bytes(job.payload)))
+    return import_employees(
+        rows,
+        batch_size=job.params.get("batch_size", IMPORT_BATCH_SIZE),
+        progress=progress,
+    )
+
+
+@job("rebuild_summaries")
+def rebuild_summaries_job(job, progress):
+    """Recompute every EmployeeAttendanceSummary, one chunk per transaction"""
+    total = Employee.objects.count()
+    done = 0
+    progress(0, total)
+    for employee_ids in employee_id_chunks(SUMMARY_CHUNK):
+        with transaction.atomic():
+            rebuild_summaries(employee_ids)
+        done += len(employee_ids)
+        progress(done, max(done, total))
+    return {"employees": done}
+
+
+@job("rebuild_rollups")
+def rebuild_rollups_job(job, progress):
+    """
+    Recompute DailyAttendanceRollup rows for params start..end (ISO dates),
+    defaulting to the full attendance history, archived months included;
+    progress counts days.
+    """
+    first, last = history_bounds()
+    start = job.params.get("start") or first
+    end = job.params.get("end") or last
+    if start is None or end is None:
+        return {"start": None, "end": None, "rows": 0}
+    start = datetime.date.fromisoformat(str(start))
+    end = datetime.date.fromisoformat(str(end))
+    dates = [
+        start + datetime.timedelta(days=offset)
+        for offset in range((end - start).days + 1)
+    ]
+
+    written = 0
+    progress(0, len(dates))
+    for done, chunk in enumerate(chunked(dates, ROLLUP_CHUNK_DAYS), start=1):
+        with transaction.atomic():
+            written += rebuild_rollups(chunk)
+        progress(min(done * ROLLUP_CHUNK_DAYS, len(dates)))
+    return {"start": start, "end": end, "rows": written}
@@ -0,0 +1,41 @@
+import os
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from hrms.bitmaps import AttendanceIndex
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the attendance bitmap index from the database. `save` writes "
+        "it as the snapshot workers load at startup (run it periodically, "
+        "more often than ATTENDANCE_INDEX_MAX_AGE); `info` reports its size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=["save", "info"])
+        parser.add_argument(
+            "--path",
+            default=settings.ATTENDANCE_INDEX_SNAPSHOT,
+            help="Snapshot file (default ATTENDANCE_INDEX_SNAPSHOT)",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if options["action"] == "save" and not path:
+            raise CommandError("Set ATTENDANCE_INDEX_SNAPSHOT or pass --path.")
+
+        start = time.perf_counter()
+        index = AttendanceIndex.from_database()
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"Indexed {len(index.slots):,} employees over "
+            f"{len(index.years)} year(s) in {elapsed:.2f}s."
+        )
+        if options["action"] == "save":
+            index.save(path)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Wrote {path} ({os.path.getsize(path) / 1024:,.0f} KB)."
+                )
+            )
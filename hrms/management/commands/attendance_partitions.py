@@ -0,0 +1,111 @@
+import datetime
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from hrms import partitions
+from hrms.models import AttendanceArchive
+
+
+def month(value):
+    return datetime.datetime.strptime(value, "%Y-%m").date()
+
+
+class Command(BaseCommand):
+    help = (
+        "Manage the monthly partitions of the Attendance table (PostgreSQL). "
+        "`list` shows partitions and archived months; `create` adds "
+        "partitions for the coming months; `archive` moves old months into "
+        "gzipped CSV files in ATTENDANCE_ARCHIVE_DIR; `restore` loads an "
+        "archived month back."
+    )
+
+    def add_arguments(self, parser):
+        subcommands = parser.add_subparsers(dest="action", required=True)
+        subcommands.add_parser("list")
+        create = subcommands.add_parser("create")
+        create.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.ATTENDANCE_PARTITION_MONTHS_AHEAD,
+        )
+        archive = subcommands.add_parser("archive")
+        archive.add_argument(
+            "--before",
+            type=month,
+            help="Archive months before this one (YYYY-MM); defaults to "
+            "ATTENDANCE_ARCHIVE_AFTER_MONTHS months ago",
+        )
+        archive.add_argument(
+            "--dry-run", action="store_true", help="Only list the months"
+        )
+        restore = subcommands.add_parser("restore")
+        restore.add_argument("month", type=month, help="YYYY-MM")
+
+    def handle(self, *args, **options):
+        if not partitions.is_partitioned():
+            if options["action"] == "create":
+                self.stdout.write("Attendance is not partitioned; nothing to do.")
+                return
+            raise CommandError(
+                "Attendance is not partitioned: partitioning needs PostgreSQL "
+                "(migration 0009)."
+            )
+        getattr(self, options["action"])(options)
+
+    def list(self, options):
+        for partition in partitions.partitions():
+            bounds = (
+                f"{partition.start} .. {partition.end}"
+                if partition.start
+                else "default"
+            )
+            self.stdout.write(f"  {partition.name:<28}{bounds}")
+        for archive in AttendanceArchive.objects.all():
+            self.stdout.write(
+                f"  {archive.month:%Y-%m} archived: {archive.file}, "
+                f"{archive.rows:,} records, {archive.size / 1024:,.0f} KB"
+            )
+
+    def create(self, options):
+        created = partitions.ensure_partitions(options["months_ahead"])
+        for start in created:
+            self.stdout.write(f"  created {partitions.partition_name(start)}")
+        self.stdout.write(self.style.SUCCESS(f"Created {len(created)} partition(s)."))
+
+    def archive(self, options):
+        before = options["before"] or partitions.add_months(
+            partitions.month_start(timezone.localtime(timezone.now()).date()),
+            -settings.ATTENDANCE_ARCHIVE_AFTER_MONTHS,
+        )
+        months = [
+            p.start
+            for p in partitions.partitions()
+            if p.start is not None and p.start < before
+        ]
+        for start in months:
+            if options["dry_run"]:
+                self.stdout.write(f"  would archive {start:%Y-%m}")
+                continue
+            try:
+                archive = partitions.archive_month(start)
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            self.stdout.write(
+                f"  {start:%Y-%m}: {archive.rows:,} records -> {archive.file} "
+                f"({archive.size / 1024:,.0f} KB)"
+            )
+        if not options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"Archived {len(months)} month(s)."))
+
+    def restore(self, options):
+        try:
+            rows = partitions.restore_month(options["month"])
+        except AttendanceArchive.DoesNotExist:
+            raise CommandError(f"{options['month']:%Y-%m} is not archived.")
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Restored {rows:,} records for {options['month']:%Y-%m}."
+            )
+        )
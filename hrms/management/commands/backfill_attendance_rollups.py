@@ -0,0 +1,48 @@
+import datetime
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from hrms.rollups import history_bounds, rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild DailyAttendanceRollup rows from Attendance and the totals of "
+        "archived months. Defaults to the full attendance history; processes "
+        "one chunk of days per transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", type=datetime.date.fromisoformat)
+        parser.add_argument("--end", type=datetime.date.fromisoformat)
+        parser.add_argument(
+            "--chunk-days", type=int, default=31, help="Days rebuilt per transaction"
+        )
+
+    def handle(self, *args, **options):
+        first, last = history_bounds()
+        start = options["start"] or first
+        end = options["end"] or last
+        if start is None or end is None:
+            self.stdout.write("No attendance recorded; nothing to backfill.")
+            return
+        if start > end:
+            raise CommandError("--start must be on or before --end.")
+
+        written = 0
+        day = start
+        while day <= end:
+            chunk_end = min(
+                day + datetime.timedelta(days=options["chunk_days"] - 1), end
+            )
+            dates = [
+                day + datetime.timedelta(days=offset)
+                for offset in range((chunk_end - day).days + 1)
+            ]
+            with transaction.atomic():
+                written += rebuild_rollups(dates)
+            self.stdout.write(f"  {day} .. {chunk_end}")
+            day = chunk_end + datetime.timedelta(days=1)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Backfilled {written} rollup rows ({start} .. {end}).")
+        )
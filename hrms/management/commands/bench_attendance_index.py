@@ -0,0 +1,100 @@
+import datetime
+import os
+import statistics
+import tempfile
+import time
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q
+from hrms.benchmarking import measure, rollback_sandbox
+from hrms.bitmaps import AttendanceIndex
+from hrms.models import Attendance
+from hrms.seeding import seed_attendance, seed_employees
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the attendance bitmap index (load from the database, snapshot "
+        "save and load, and workforce-wide rate, streak and weekday queries) "
+        "against the equivalent SQL, over N synthetic employees with a year "
+        "of attendance. Runs in a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employees", type=int, default=5000)
+        parser.add_argument("--days", type=int, default=365)
+        parser.add_argument("--repeat", type=int, default=10)
+
+    def timed(self, label, function):
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            result = function()
+            timings.append((time.perf_counter() - start) * 1000)
+        self.stdout.write(
+            f"  {label:<36}{statistics.median(timings):>10.1f} ms"
+            f"{len(result):>10,} rows"
+        )
+
+    def handle(self, *args, **options):
+        self.repeat = options["repeat"]
+        end = datetime.date(2026, 12, 31)
+        start = end - datetime.timedelta(days=options["days"] - 1)
+        year_start = datetime.date(end.year, 1, 1)
+        quarter_start = datetime.date(end.year, 10, 1)
+
+        with rollback_sandbox():
+            employee_ids = seed_employees(options["employees"], prefix="BIT", seed=0)
+            written = seed_attendance(
+                employee_ids, options["days"], absence_rate=0.1, end_date=end
+            )
+            self.stdout.write(
+                f"{len(employee_ids):,} employees, {written:,} attendance records"
+            )
+
+            with measure() as m:
+                index = AttendanceIndex.from_database()
+            self.stdout.write(
+                f"  {'load from database':<36}{m.elapsed * 1000:>10.1f} ms"
+            )
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "attendance.idx")
+                with measure() as m:
+                    index.save(path)
+                self.stdout.write(
+                    f"  {'save snapshot':<36}{m.elapsed * 1000:>10.1f} ms"
+                    f"{os.path.getsize(path) / 1024:>10,.0f} KB"
+                )
+                with measure() as m:
+                    AttendanceIndex.from_snapshot(path)
+                self.stdout.write(
+                    f"  {'load snapshot':<36}{m.elapsed * 1000:>10.1f} ms"
+                )
+
+            self.stdout.write("Rate per employee, this year")
+            self.timed("index", lambda: index.counts(year_start, end))
+            self.timed(
+                "SQL",
+                lambda: list(
+                    Attendance.objects.filter(date__range=(year_start, end))
+                    .order_by()
+                    .values("employee_id")
+                    .annotate(
+                        present=Count("id", filter=Q(status="PRESENT")),
+                        absent=Count("id", filter=Q(status="ABSENT")),
+                    )
+                ),
+            )
+
+            self.stdout.write("Absent 3+ consecutive days, this quarter")
+            self.timed("index", lambda: index.absence_streaks(quarter_start, end, 3))
+            self.timed(
+                "SQL rows + Python",
+                lambda: AttendanceIndex.from_database(
+                    Attendance.objects.filter(
+                        date__range=(quarter_start, end), status="ABSENT"
+                    )
+                ).absence_streaks(quarter_start, end, 3),
+            )
+
+            self.stdout.write("Absences per weekday, this year")
+            self.timed("index", lambda: index.weekday_counts(year_start, end))
@@ -0,0 +1,101 @@
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count, Q
+from django.utils import timezone
+from hrms.benchmarking import rollback_sandbox
+from hrms.models import Attendance, Employee
+from hrms.seeding import seed_attendance, seed_employees
+
+
+def hot_queries(today):
+    """The attendance access paths the API serves most often"""
+    return {
+        "dashboard (date)": Attendance.objects.filter(date=today)
+        .values("status")
+        .annotate(count=Count("id"))
+        .order_by(),
+        "list page (date)": Attendance.objects.select_related("employee")
+        .filter(date=today)
+        .order_by("-date", "-id")[:100],
+        "list page (date + status)": Attendance.objects.select_related("employee")
+        .filter(date=today, status="ABSENT")
+        .order_by("-date", "-id")[:100],
+        "employees present count": Employee.objects.annotate(
+            total_present_days=Count(
+                "attendance_records", filter=Q(attendance_records__status="PRESENT")
+            )
+        ).order_by("-created_at", "-id")[:100],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed N employees x M days in a rolled-back transaction and report "
+        "EXPLAIN plans and timings of hot attendance queries with and without "
+        "the attendance indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employees", type=int, default=1000)
+        parser.add_argument("--days", type=int, default=90)
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Runs per query; median is reported"
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localtime(timezone.now()).date()
+        indexes = [
+            index.name
+            for index in Attendance._meta.indexes
+            if index.name != "attendance_date_id_idx"
+        ]
+
+        with rollback_sandbox():
+            self.stdout.write(
+                f"Seeding {options['employees']} employees x {options['days']} days..."
+            )
+            employee_ids = seed_employees(options["employees"], prefix="BENCH")
+            seed_attendance(employee_ids, options["days"], end_date=today)
+            self._analyze()
+
+            after = self._run(hot_queries(today), options["repeat"])
+
+            # DDL is transactional on Postgres and SQLite; the rollback restores these
+            with connection.cursor() as cursor:
+                for name in indexes:
+                    cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+            self._analyze()
+            before = self._run(hot_queries(today), options["repeat"])
+
+        self.stdout.write(f"\nIndexes compared: {', '.join(indexes)}\n")
+        for name in after:
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(f"  without indexes: {before[name]['ms']:.2f} ms")
+            self.stdout.write(self._indent(before[name]["plan"]))
+            self.stdout.write(f"  with indexes:    {after[name]['ms']:.2f} ms")
+            self.stdout.write(self._indent(after[name]["plan"]))
+
+    def _run(self, queries, repeat):
+        results = {}
+        for name, queryset in queries.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                # Fresh clone each run so the result cache is not reused
+                list(queryset.all())
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = {
+                "ms": statistics.median(timings),
+                "plan": queryset.explain(),
+            }
+        return results
+
+    def _analyze(self):
+        """Refresh planner statistics so plans reflect the seeded data"""
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Attendance._meta.db_table}")
+
+    def _indent(self, plan):
+        return "\n".join(f"    {line}" for line in plan.splitlines())
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+from django.utils import timezone
+from hrms.benchmarking import api_client, measure, rollback_sandbox
+from hrms.models import Attendance
+from hrms.seeding import seed_employees
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare marking N employees with one POST /api/attendance/ each "
+        "against a single POST /api/attendance/bulk/. Runs in a rolled-back "
+        "transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employees", type=int, default=500)
+        parser.add_argument(
+            "--status", choices=["PRESENT", "ABSENT"], default="PRESENT"
+        )
+
+    def handle(self, *args, **options):
+        count = options["employees"]
+        status = options["status"]
+        today = timezone.localtime(timezone.now()).date().isoformat()
+
+        with rollback_sandbox(), api_client() as client:
+            employee_ids = seed_employees(count, prefix="BENCH")
+
+            # Current frontend behaviour: one request per employee
+            with measure() as loop:
+                for employee_id in employee_ids:
+                    client.post(
+                        reverse("attendance-list"),
+                        {"employee": employee_id, "date": today, "status": status},
+                        format="json",
+                        secure=True,
+                    )
+
+            Attendance.objects.filter(employee_id__in=employee_ids).delete()
+
+            with measure() as bulk:
+                response = client.post(
+                    reverse("attendance-bulk"),
+                    {"date": today, "status": status, "employees": employee_ids},
+                    format="json",
+                    secure=True,
+                )
+
+        self.stdout.write(f"Employees: {count}")
+        self.stdout.write(
+            f"{'path':<10}{'round trips':>14}{'SQL queries':>14}{'total ms':>12}"
+        )
+        self.stdout.write(
+            f"{'loop':<10}{count:>14}{loop.queries:>14}{loop.elapsed * 1000:>12.1f}"
+        )
+        self.stdout.write(
+            f"{'bulk':<10}{1:>14}{bulk.queries:>14}{bulk.elapsed * 1000:>12.1f}"
+        )
+        self.stdout.write(f"Bulk summary: {response.data['summary']}")
+        if bulk.elapsed:
+            self.stdout.write(
+                self.style.SUCCESS(f"Speedup: {loop.elapsed / bulk.elapsed:.1f}x")
+            )
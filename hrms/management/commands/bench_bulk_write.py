@@ -0,0 +1,64 @@
+import datetime
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils import timezone
+from hrms.benchmarking import measure, rollback_sandbox
+from hrms.bulkwrite import bulk_write, copy_enabled
+from hrms.models import Attendance
+from hrms.seeding import seed_employees
+
+FIELDS = ("employee_id", "date", "status")
+KEYS = ("employee_id", "date")
+
+
+class Command(BaseCommand):
+    help = (
+        "Time inserting and then upserting N attendance rows with bulk_write, "
+        "through COPY (Postgres) and through bulk_create. Runs in a "
+        "rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--employees", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        days = -(-options["rows"] // options["employees"])
+        today = timezone.localtime(timezone.now()).date()
+        paths = {"bulk_create": False}
+        if copy_enabled():
+            paths = {"copy": True, **paths}
+        else:
+            self.stdout.write(
+                f"COPY needs Postgres ({connection.vendor} in use); "
+                "timing bulk_create only."
+            )
+
+        self.stdout.write(f"{'path':<13}{'rows':>9}{'insert ms':>12}{'upsert ms':>12}")
+        for name, enabled in paths.items():
+            with rollback_sandbox(), override_settings(DB_COPY_WRITES=enabled):
+                employee_ids = seed_employees(options["employees"], prefix="BENCH")
+                rows = [
+                    (employee_id, today - datetime.timedelta(days=offset), "PRESENT")
+                    for offset in range(days)
+                    for employee_id in employee_ids
+                ][: options["rows"]]
+
+                with measure() as insert:
+                    bulk_write(Attendance, FIELDS, rows, unique_fields=KEYS)
+                absent = [
+                    (employee_id, date, "ABSENT") for employee_id, date, _ in rows
+                ]
+                with measure() as upsert:
+                    bulk_write(
+                        Attendance,
+                        FIELDS,
+                        absent,
+                        unique_fields=KEYS,
+                        update_fields=("status",),
+                    )
+            self.stdout.write(
+                f"{name:<13}{len(rows):>9,}{insert.elapsed * 1000:>12.1f}"
+                f"{upsert.elapsed * 1000:>12.1f}"
+            )
@@ -0,0 +1,85 @@
+import time
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+from django.utils import timezone
+from hrms.benchmarking import api_client, rollback_sandbox
+from hrms.middleware import brotli
+from hrms.seeding import seed_attendance, seed_employees
+
+
+class Command(BaseCommand):
+    help = (
+        "Bytes on the wire and latency of the attendance list with no "
+        "compression, gzip and Brotli, for a 1k-row page and a 10k-row stream. "
+        "Runs in a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--bandwidth",
+            type=float,
+            default=20.0,
+            help="Link speed in Mbit/s used to estimate transfer time",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Runs per case; fastest is reported"
+        )
+
+    def handle(self, *args, **options):
+        encodings = ["identity", "gzip"] + (["br"] if brotli else [])
+        cases = {
+            "1k page": {"page_size": 1000},
+            "10k stream": {"stream": "json"},
+        }
+        bytes_per_second = options["bandwidth"] * 1_000_000 / 8
+
+        with rollback_sandbox(), api_client() as client:
+            employee_ids = seed_employees(10_000, prefix="BENCH")
+            seed_attendance(
+                employee_ids, 1, end_date=timezone.localtime(timezone.now()).date()
+            )
+
+            self.stdout.write(
+                f"{'case':<12}{'encoding':<10}{'bytes':>12}{'ratio':>8}"
+                f"{'server ms':>12}{'wire ms':>10}{'total ms':>10}"
+            )
+            for name, params in cases.items():
+                sizes = {}
+                for encoding in encodings:
+                    size, elapsed = self._fetch(
+                        client, params, encoding, options["repeat"]
+                    )
+                    sizes[encoding] = size
+                    wire = size / bytes_per_second
+                    self.stdout.write(
+                        f"{name:<12}{encoding:<10}{size:>12,}"
+                        f"{sizes['identity'] / size:>7.1f}x"
+                        f"{elapsed * 1000:>12.1f}{wire * 1000:>10.1f}"
+                        f"{(elapsed + wire) * 1000:>10.1f}"
+                    )
+
+        if not brotli:
+            self.stdout.write("Install the brotli package to include Brotli.")
+        self.stdout.write(
+            f"wire ms is estimated at {options['bandwidth']:g} Mbit/s; "
+            "server ms includes rendering and compression."
+        )
+
+    def _fetch(self, client, params, encoding, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = client.get(
+                reverse("attendance-list"),
+                params,
+                HTTP_ACCEPT_ENCODING=encoding,
+                secure=True,
+            )
+            body = (
+                b"".join(response.streaming_content)
+                if response.streaming
+                else response.content
+            )
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return len(body), best
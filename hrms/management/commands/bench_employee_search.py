@@ -0,0 +1,78 @@
+import random
+import statistics
+import uuid
+from django.core.management.base import BaseCommand
+from django.db import connection
+from hrms.benchmarking import api_client, measure, rollback_sandbox
+from hrms.bulkwrite import bulk_write
+from hrms.models import Employee
+from hrms.seeding import DEFAULT_DEPARTMENTS, EMPLOYEE_FIELDS, chunked
+from hrms.search import search_backend
+
+FIRST_NAMES = (
+    "Aarav Priya Rohan Ananya Vikram Sneha Arjun Kavya Rahul Meera "
+    "James Mary Robert Linda Michael Sarah David Emma Daniel Olivia"
+).split()
+LAST_NAMES = (
+    "Sharma Patel Iyer Reddy Gupta Nair Singh Das Mehta Rao "
+    "Smith Johnson Brown Garcia Miller Davis Wilson Moore Taylor Clark"
+).split()
+
+
+class Command(BaseCommand):
+    help = (
+        "Time GET /api/employees/search/ over N synthetic employees for "
+        "employee ID, name and email queries. Runs in a rolled-back "
+        "transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employees", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, **options):
+        count = options["employees"]
+        rng = random.Random(0)
+        with rollback_sandbox():
+            rows = (
+                (
+                    uuid.UUID(int=rng.getrandbits(128), version=4),
+                    f"BENCH-{i:06d}",
+                    f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}",
+                    f"bench{i:06d}@example.com",
+                    DEFAULT_DEPARTMENTS[i % len(DEFAULT_DEPARTMENTS)],
+                )
+                for i in range(count)
+            )
+            for chunk in chunked(rows, 5000):
+                bulk_write(Employee, EMPLOYEE_FIELDS, chunk)
+            self.stdout.write(
+                f"{count:,} employees, {connection.vendor} "
+                f"({search_backend(Employee.objects.all())} search)"
+            )
+
+            queries = {
+                "exact id": f"BENCH-{count // 2:06d}",
+                "id prefix": "BENCH-0123",
+                "first name": "priya",
+                "full name": "meera iyer",
+                "email": f"bench{count // 3:06d}",
+                "no match": "zzzz",
+            }
+            self.stdout.write(
+                f"{'query':<12}{'results':>8}{'p50 ms':>9}{'max ms':>9}{'queries':>9}"
+            )
+            with api_client() as client:
+                for name, q in queries.items():
+                    timings = []
+                    for _ in range(options["repeat"]):
+                        with measure() as m:
+                            response = client.get(
+                                "/api/employees/search/", {"q": q}, secure=True
+                            )
+                        timings.append(m.elapsed * 1000)
+                    self.stdout.write(
+                        f"{name:<12}{len(response.data['results']):>8}"
+                        f"{statistics.median(timings):>9.2f}{max(timings):>9.2f}"
+                        f"{m.queries:>9}"
+                    )
@@ -0,0 +1,98 @@
+import datetime
+import time
+import uuid
+from io import BytesIO
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from hrms import renderers
+from hrms.models import Attendance, Employee
+from hrms.renderers import FastJSONParser, FastJSONRenderer
+from hrms.serializers import AttendanceSerializer, EmployeeSerializer
+
+
+def build_payloads(count):
+    """Serializer output for `count` unsaved employees and attendance records"""
+    now = timezone.now()
+    employees = []
+    records = []
+    for i in range(count):
+        employee = Employee(
+            id=uuid.uuid4(),
+            employee_id=f"BENCH-{i:06d}",
+            full_name=f"Bench Employee {i}",
+            email=f"bench-{i:06d}@example.com",
+            department="Engineering",
+            created_at=now,
+            updated_at=now,
+        )
+        employee.total_present_days = i % 30
+        employees.append(employee)
+        records.append(
+            Attendance(
+                id=i + 1,
+                employee=employee,
+                date=now.date() - datetime.timedelta(days=i % 365),
+                status="PRESENT",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    return {
+        "employees": EmployeeSerializer(employees, many=True).data,
+        "attendance": AttendanceSerializer(records, many=True).data,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Time rendering and parsing EmployeeSerializer and AttendanceSerializer "
+        "output with DRF's stdlib JSON classes and the orjson-backed ones."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Runs per case; fastest is reported"
+        )
+
+    def handle(self, *args, **options):
+        if renderers.orjson is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    "orjson is not installed; both paths use stdlib json."
+                )
+            )
+        self.stdout.write(
+            f"{'payload':<12}{'rows':>9}{'render std':>12}{'render fast':>13}"
+            f"{'parse std':>11}{'parse fast':>12}{'speedup':>9}"
+        )
+        for size in options["sizes"]:
+            for name, data in build_payloads(size).items():
+                self._report(name, size, data, options["repeat"])
+
+    def _report(self, name, size, data, repeat):
+        body = JSONRenderer().render(data)
+        render_std = self._best(lambda: JSONRenderer().render(data), repeat)
+        render_fast = self._best(lambda: FastJSONRenderer().render(data), repeat)
+        parse_std = self._best(lambda: self._parse(JSONParser(), body), repeat)
+        parse_fast = self._best(lambda: self._parse(FastJSONParser(), body), repeat)
+        self.stdout.write(
+            f"{name:<12}{size:>9,}{render_std:>10.1f}ms{render_fast:>11.1f}ms"
+            f"{parse_std:>9.1f}ms{parse_fast:>10.1f}ms"
+            f"{render_std / render_fast:>8.1f}x"
+        )
+
+    def _parse(self, parser, body):
+        return parser.parse(BytesIO(body), parser_context={"encoding": "utf-8"})
+
+    def _best(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return min(timings)
@@ -0,0 +1,86 @@
+import multiprocessing
+import signal
+import threading
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from hrms.jobs import work, worker_name
+
+
+def _run_worker(poll_interval):
+    """Process entry point: work until SIGTERM/SIGINT, finishing the current job"""
+    stop = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *args: stop.set())
+    work(worker_name(), poll_interval=poll_interval, stop=stop)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background jobs (bulk marking, imports, rebuilds) queued in the "
+        "database, in a pool of worker processes. SIGTERM or Ctrl-C lets "
+        "each process finish its current job before exiting."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=settings.JOB_WORKER_PROCESSES,
+            help="Worker processes, each running one job at a time",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds between queue checks while idle",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run queued jobs in this process and exit when the queue is empty",
+        )
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            processed = work(worker_name(), once=True)
+            self.stdout.write(f"Processed {processed} job(s).")
+            return
+
+        count = max(1, options["processes"])
+        if connections[DEFAULT_DB_ALIAS].vendor == "sqlite" and count > 1:
+            # Concurrent write transactions from several processes fail
+            # with "database is locked" instead of waiting
+            self.stdout.write("SQLite database: using a single worker process.")
+            count = 1
+
+        # Forked children must open their own connections
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(
+                target=_run_worker,
+                args=(options["poll_interval"],),
+                name=f"hrms-worker-{i}",
+            )
+            for i in range(count)
+        ]
+        for process in processes:
+            process.start()
+        self.stdout.write(
+            f"Started {len(processes)} job worker process(es): "
+            + ", ".join(str(process.pid) for process in processes)
+        )
+
+        def forward(signum, frame):
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        # Ctrl-C already reaches the whole process group; SIGTERM (docker
+        # stop) only reaches this process and is passed on
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, lambda *args: None)
+        for process in processes:
+            process.join()
+        self.stdout.write("Job workers stopped.")
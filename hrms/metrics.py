@@ -0,0 +1,130 @@
+"""
+In-process request metrics, rendered in the Prometheus text format by the
+/metrics/ view. PerformanceMiddleware (hrms/middleware.py) records one
+observation per request.
+
+Each gunicorn worker keeps its own registry, so every scrape sees a single
+worker. Scrape each worker, or sum the series per instance.
+"""
+
+import bisect
+import threading
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+# Requests that matched no URL pattern share one label, so arbitrary
+# paths cannot grow the registry
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """Cumulative-bucket histogram; callers hold the registry lock"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def samples(self):
+        """(le, cumulative count) pairs, ending with +Inf"""
+        total = 0
+        for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+            total += count
+            yield bound, total
+
+
+class RequestMetrics:
+    """Per-route request counters and histograms"""
+
+    HISTOGRAMS = {
+        "hrms_http_request_duration_seconds": (
+            "Wall time from the first middleware to the last response byte",
+            DURATION_BUCKETS,
+        ),
+        "hrms_db_query_duration_seconds": (
+            "Time spent in database queries per request",
+            DURATION_BUCKETS,
+        ),
+        "hrms_db_queries_per_request": (
+            "Database queries issued per request",
+            QUERY_COUNT_BUCKETS,
+        ),
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._requests = {}  # (route, method, status) -> count
+            self._response_bytes = {}  # route -> bytes
+            self._histograms = {name: {} for name in self.HISTOGRAMS}
+
+    def observe(self, route, method, status, duration, queries, db_time, size):
+        with self._lock:
+            key = (route, method, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._response_bytes[route] = self._response_bytes.get(route, 0) + size
+            for name, value in (
+                ("hrms_http_request_duration_seconds", duration),
+                ("hrms_db_query_duration_seconds", db_time),
+                ("hrms_db_queries_per_request", queries),
+            ):
+                histograms = self._histograms[name]
+                if route not in histograms:
+                    histograms[route] = Histogram(self.HISTOGRAMS[name][1])
+                histograms[route].observe(value)
+
+    def render(self):
+        """Prometheus text exposition format, version 0.0.4"""
+        lines = [
+            "# HELP hrms_http_requests_total Requests handled, by route",
+            "# TYPE hrms_http_requests_total counter",
+        ]
+        with self._lock:
+            for (route, method, status), count in sorted(self._requests.items()):
+                labels = _labels(route=route, method=method, status=status)
+                lines.append(f"hrms_http_requests_total{{{labels}}} {count}")
+
+            lines += [
+                "# HELP hrms_http_response_bytes_total Response body bytes sent",
+                "# TYPE hrms_http_response_bytes_total counter",
+            ]
+            for route, size in sorted(self._response_bytes.items()):
+                lines.append(
+                    f"hrms_http_response_bytes_total{{{_labels(route=route)}}} {size}"
+                )
+
+            for name, (description, _) in self.HISTOGRAMS.items():
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+                for route, histogram in sorted(self._histograms[name].items()):
+                    for bound, count in histogram.samples():
+                        labels = _labels(route=route, le=_number(bound))
+                        lines.append(f"{name}_bucket{{{labels}}} {count}")
+                    labels = _labels(route=route)
+                    lines.append(f"{name}_sum{{{labels}}} {_number(histogram.sum)}")
+                    lines.append(f"{name}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _number(value):
+    return value if isinstance(value, str) else repr(float(value))
+
+
+def _labels(**labels):
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for name, value in labels.items()
+    )
+
+
+registry = RequestMetrics()
@@ -0,0 +1,238 @@
+import time
+import zlib
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from .metrics import UNMATCHED_ROUTE, registry
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip only without it
+    brotli = None
+
+
+class GzipEncoder:
+    name = "gzip"
+
+    def __init__(self):
+        # wbits=31: gzip container rather than a raw zlib stream
+        self._compressor = zlib.compressobj(
+            settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31
+        )
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    name = "br"
+
+    def __init__(self):
+        self._compressor = brotli.Compressor(
+            quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+def accepted_encodings(header):
+    """Content codings the client accepts (q > 0), lowercased"""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if coding and params not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.lower())
+    return accepted
+
+
+def choose_encoder(request):
+    accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    if brotli is not None and "br" in accepted:
+        return BrotliEncoder
+    if "gzip" in accepted:
+        return GzipEncoder
+    return None
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Brotli (when the brotli package is installed) or gzip compression for
+    responses under settings.COMPRESSION_PATH_PREFIXES.
+
+    Buffered responses smaller than COMPRESSION_MIN_SIZE are sent as is.
+    Streaming responses, sync or async, are compressed as they are produced
+    and flushed every COMPRESSION_STREAM_FLUSH_SIZE bytes of input, so
+    exports keep streaming without paying a flush per row.
+    """
+
+    def process_response(self, request, response):
+        if not request.path.startswith(tuple(settings.COMPRESSION_PATH_PREFIXES)):
+            return response
+        if response.has_header("Content-Encoding"):
+            return response
+        if not response.streaming and (
+            len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoder_class = choose_encoder(request)
+        if encoder_class is None:
+            return response
+
+        encoder = encoder_class()
+        if response.streaming:
+            response.streaming_content = (
+                self._compress_async(response.streaming_content, encoder)
+                if response.is_async
+                else self._compress(response.streaming_content, encoder)
+            )
+            del response.headers["Content-Length"]
+        else:
+            compressed = encoder.compress(response.content) + encoder.finish()
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # The compressed bytes differ, so a strong ETag must become weak
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoder.name
+        return response
+
+    def _compress(self, chunks, encoder):
+        pending = 0
+        for chunk in chunks:
+            data = encoder.compress(chunk)
+            pending += len(chunk)
+            if pending >= settings.COMPRESSION_STREAM_FLUSH_SIZE:
+                data += encoder.flush()
+                pending = 0
+            if data:
+                yield data
+        yield encoder.finish()
+
+    async def _compress_async(self, chunks, encoder):
+        pending = 0
+        async for chunk in chunks:
+            data = encoder.compress(chunk)
+            pending += len(chunk)
+            if pending >= settings.COMPRESSION_STREAM_FLUSH_SIZE:
+                data += encoder.flush()
+                pending = 0
+            if data:
+                yield data
+        yield encoder.finish()
+
+
+class QueryTimer:
+    """connection.execute_wrapper hook counting queries and their time"""
+
+    def __init__(self):
+        self.count = 0
+        self.elapsed = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.elapsed += time.perf_counter() - start
+
+
+class PerformanceMiddleware(MiddlewareMixin):
+    """
+    Records wall time, query count, DB time and response bytes per route
+    (the URL name, e.g. "employee-list") into hrms.metrics.registry, and
+    sends the timings in a Server-Timing header.
+
+    Streamed responses are recorded when the last chunk has been sent; their
+    headers go out before the work is done, so they get no Server-Timing.
+    Disabled with PERFORMANCE_METRICS=False.
+    """
+
+    def process_request(self, request):
+        if not settings.PERFORMANCE_METRICS:
+            return
+        timer = QueryTimer()
+        # The connection itself, not the thread-local proxy: a stream may
+        # finish on another thread
+        db = connections[DEFAULT_DB_ALIAS]
+        db.execute_wrappers.append(timer)
+        request._performance = (time.perf_counter(), db, timer)
+
+    def process_response(self, request, response):
+        state = getattr(request, "_performance", None)
+        if state is None:
+            return response
+
+        if response.streaming:
+            chunks = response.streaming_content
+            response.streaming_content = (
+                self._measure_async(request, response, state, chunks)
+                if response.is_async
+                else self._measure(request, response, state, chunks)
+            )
+            return response
+
+        duration, timer = self._record(request, response, state, len(response.content))
+        response["Server-Timing"] = (
+            f"app;dur={duration * 1000:.1f}, "
+            f'db;dur={timer.elapsed * 1000:.1f};desc="{timer.count} queries"'
+        )
+        return response
+
+    def _measure(self, request, response, state, chunks):
+        size = 0
+        try:
+            for chunk in chunks:
+                size += len(chunk)
+                yield chunk
+        finally:
+            self._record(request, response, state, size)
+
+    async def _measure_async(self, request, response, state, chunks):
+        size = 0
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                yield chunk
+        finally:
+            self._record(request, response, state, size)
+
+    def _record(self, request, response, state, size):
+        start, db, timer = state
+        duration = time.perf_counter() - start
+        if timer in db.execute_wrappers:
+            db.execute_wrappers.remove(timer)
+
+        match = request.resolver_match
+        route = (match.url_name or match.route) if match else UNMATCHED_ROUTE
+        registry.observe(
+            route,
+            request.method,
+            response.status_code,
+            duration,
+            timer.count,
+            timer.elapsed,
+            size,
+        )
+        return duration, timer
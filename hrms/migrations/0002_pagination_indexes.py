@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-17 14:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hrms", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(fields=["date", "id"], name="attendance_date_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(
+                fields=["created_at", "id"], name="employee_created_id_idx"
+            ),
+        ),
+    ]
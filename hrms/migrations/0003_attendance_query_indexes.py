@@ -0,0 +1,27 @@
+# Generated by Django 5.0.14 on 2026-10-17 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hrms", "0002_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["date", "status"], name="attendance_date_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                condition=models.Q(("status", "PRESENT")),
+                fields=["employee"],
+                name="attendance_present_emp_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.0.14 on 2026-10-17 15:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Q
+
+
+def backfill_summaries(apps, schema_editor):
+    Employee = apps.get_model("hrms", "Employee")
+    EmployeeAttendanceSummary = apps.get_model("hrms", "EmployeeAttendanceSummary")
+    rows = (
+        Employee.objects.annotate(
+            present=Count(
+                "attendance_records", filter=Q(attendance_records__status="PRESENT")
+            ),
+            absent=Count(
+                "attendance_records", filter=Q(attendance_records__status="ABSENT")
+            ),
+            last_marked=Max("attendance_records__date"),
+        )
+        .filter(last_marked__isnull=False)
+        .values_list("id", "present", "absent", "last_marked")
+    )
+    EmployeeAttendanceSummary.objects.bulk_create(
+        (
+            EmployeeAttendanceSummary(
+                employee_id=employee_id,
+                present_days=present,
+                absent_days=absent,
+                last_marked_date=last_marked,
+            )
+            for employee_id, present, absent, last_marked in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hrms", "0003_attendance_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmployeeAttendanceSummary",
+            fields=[
+                (
+                    "employee",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="attendance_summary",
+                        serialize=False,
+                        to="hrms.employee",
+                    ),
+                ),
+                ("present_days", models.IntegerField(default=0)),
+                ("absent_days", models.IntegerField(default=0)),
+                ("last_marked_date", models.DateField(blank=True, null=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.14 on 2026-10-17 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hrms", "0004_employee_attendance_summary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyAttendanceRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("department", models.CharField(max_length=100)),
+                ("present", models.IntegerField(default=0)),
+                ("absent", models.IntegerField(default=0)),
+                ("headcount", models.IntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["date", "department"],
+                "unique_together": {("date", "department")},
+            },
+        ),
+    ]
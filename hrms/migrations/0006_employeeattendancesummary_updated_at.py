@@ -0,0 +1,22 @@
+# Generated by Django 5.0.14 on 2026-10-17 21:10
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hrms", "0005_daily_attendance_rollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employeeattendancesummary",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
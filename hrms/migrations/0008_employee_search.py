@@ -0,0 +1,83 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS employee_name_trgm_idx "
+    "ON hrms_employee USING gin (full_name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS employee_email_trgm_idx "
+    "ON hrms_employee USING gin (email gin_trgm_ops)",
+    # The unique index only serves LIKE 'prefix%' under the C collation
+    "CREATE INDEX IF NOT EXISTS employee_id_prefix_idx "
+    "ON hrms_employee (employee_id varchar_pattern_ops)",
+]
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS employee_name_trgm_idx",
+    "DROP INDEX IF EXISTS employee_email_trgm_idx",
+    "DROP INDEX IF EXISTS employee_id_prefix_idx",
+]
+
+# FTS5 table over the names and emails in hrms_employee (employee IDs are
+# matched by prefix on their unique index), kept in sync by triggers. Rows
+# carry the employee's UUID in an unindexed column: hrms_employee has no
+# INTEGER PRIMARY KEY, so its rowids may change on VACUUM and cannot key
+# the index. Renames and deletes find their row by scanning the table,
+# which is cheap at employee counts. The prefix indexes keep one- to
+# three-character prefix queries fast. A later migration that makes SQLite
+# rebuild hrms_employee drops the triggers and must recreate them.
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE hrms_employee_fts USING fts5("
+    "id UNINDEXED, full_name, email, prefix='1 2 3')",
+    "CREATE TRIGGER hrms_employee_fts_insert AFTER INSERT ON hrms_employee BEGIN "
+    "INSERT INTO hrms_employee_fts (id, full_name, email) "
+    "VALUES (new.id, new.full_name, new.email); END",
+    "CREATE TRIGGER hrms_employee_fts_delete AFTER DELETE ON hrms_employee BEGIN "
+    "DELETE FROM hrms_employee_fts WHERE id = old.id; END",
+    "CREATE TRIGGER hrms_employee_fts_update AFTER UPDATE OF full_name, email "
+    "ON hrms_employee BEGIN "
+    "UPDATE hrms_employee_fts SET full_name = new.full_name, email = new.email "
+    "WHERE id = old.id; END",
+    "INSERT INTO hrms_employee_fts (id, full_name, email) "
+    "SELECT id, full_name, email FROM hrms_employee",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS hrms_employee_fts_insert",
+    "DROP TRIGGER IF EXISTS hrms_employee_fts_delete",
+    "DROP TRIGGER IF EXISTS hrms_employee_fts_update",
+    "DROP TABLE IF EXISTS hrms_employee_fts",
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for statement in POSTGRES_FORWARD:
+            schema_editor.execute(statement)
+    elif vendor == "sqlite":
+        with schema_editor.connection.cursor() as cursor:
+            try:
+                cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+            except OperationalError:
+                # SQLite built without FTS5: search uses icontains
+                return
+            cursor.execute("DROP TABLE temp.fts5_probe")
+        for statement in SQLITE_FORWARD:
+            schema_editor.execute(statement)
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}
+    for statement in statements.get(vendor, []):
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hrms", "0007_job"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
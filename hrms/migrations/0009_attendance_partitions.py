@@ -0,0 +1,205 @@
+# Generated by Django 5.0.14 on 2026-10-17 16:13
+
+import datetime
+import django.db.models.deletion
+from django.db import migrations, models
+
+TABLE = "hrms_attendance"
+# Months after the current one that get a partition up front; afterwards
+# `manage.py attendance_partitions create` and the job worker add them
+MONTHS_AHEAD = 3
+
+
+def _months(first, last):
+    month = first.replace(day=1)
+    while month <= last:
+        following = (month + datetime.timedelta(days=32)).replace(day=1)
+        yield month, following
+        month = following
+
+
+def _definitions(cursor, table):
+    """Constraint and index definitions of `table`, for re-creating them"""
+    cursor.execute(
+        "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass ORDER BY contype DESC",
+        [table],
+    )
+    constraints = cursor.fetchall()
+    cursor.execute(
+        "SELECT pg_get_indexdef(indexrelid) FROM pg_index "
+        "WHERE indrelid = %s::regclass AND indexrelid NOT IN "
+        "(SELECT conindid FROM pg_constraint WHERE conrelid = %s::regclass)",
+        [table, table],
+    )
+    # Indexes of a partitioned table are defined ON ONLY the parent
+    indexes = [row[0].replace(" ON ONLY ", " ON ", 1) for row in cursor.fetchall()]
+    return constraints, indexes
+
+
+def _rebuild(schema_editor, partitioned):
+    """
+    Recreate hrms_attendance as a table partitioned by month (or back as a
+    plain table), copying its rows, constraints and indexes. A partitioned
+    table's primary key must include the partition key, so it becomes
+    (id, date). Ids come from a sequence owned by the new table (identity
+    columns on partitioned tables need PostgreSQL 17), continuing after
+    the highest copied id.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = %s::regclass", [TABLE])
+        if (cursor.fetchone()[0] == "p") == partitioned:
+            return
+        constraints, indexes = _definitions(cursor, TABLE)
+        cursor.execute(f"SELECT MIN(date), MAX(date) FROM {TABLE}")
+        first, last = cursor.fetchone()
+
+    old = f"{TABLE}_old"
+    statements = [
+        f"ALTER TABLE {TABLE} RENAME TO {old}",
+        f"CREATE TABLE {TABLE} (LIKE {old} INCLUDING DEFAULTS)"
+        + (' PARTITION BY RANGE ("date")' if partitioned else ""),
+        # A serial default would keep the old table's sequence alive
+        f"ALTER TABLE {TABLE} ALTER COLUMN id DROP DEFAULT",
+    ]
+    if partitioned:
+        today = datetime.date.today()
+        first = min(first or today, today)
+        last = max(last or today, today)
+        last = last.replace(day=1) + datetime.timedelta(days=32 * MONTHS_AHEAD)
+        for month, following in _months(first, last):
+            statements.append(
+                f"CREATE TABLE {TABLE}_y{month:%Y}m{month:%m} PARTITION OF {TABLE} "
+                f"FOR VALUES FROM ('{month}') TO ('{following}')"
+            )
+        # Rows for months without a partition (e.g. marked far in the past)
+        statements.append(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+    statements += [
+        f"INSERT INTO {TABLE} SELECT * FROM {old}",
+        # Drops the old table's partitions or identity sequence with it
+        f"DROP TABLE {old}",
+        f"CREATE SEQUENCE {TABLE}_id_seq AS bigint OWNED BY {TABLE}.id",
+        f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')",
+        f"SELECT setval('{TABLE}_id_seq', "
+        f"COALESCE((SELECT MAX(id) FROM {TABLE}), 0) + 1, false)",
+    ]
+    for name, kind, definition in constraints:
+        if kind == "p":
+            definition = (
+                'PRIMARY KEY (id, "date")' if partitioned else "PRIMARY KEY (id)"
+            )
+        statements.append(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" {definition}')
+    statements += indexes
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def partition_attendance(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        _rebuild(schema_editor, partitioned=True)
+
+
+def unpartition_attendance(apps, schema_editor):
+    # Archived months stay in their files; restore them first to keep them
+    if schema_editor.connection.vendor == "postgresql":
+        _rebuild(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hrms", "0008_employee_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttendanceArchive",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("month", models.DateField(unique=True)),
+                ("file", models.CharField(max_length=255)),
+                ("rows", models.IntegerField()),
+                ("size", models.BigIntegerField()),
+                ("sha256", models.CharField(max_length=64)),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-month"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedAttendanceSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("present_days", models.IntegerField(default=0)),
+                ("absent_days", models.IntegerField(default=0)),
+                ("last_marked_date", models.DateField(blank=True, null=True)),
+                (
+                    "archive",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="summaries",
+                        to="hrms.attendancearchive",
+                    ),
+                ),
+                (
+                    "employee",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_summaries",
+                        to="hrms.employee",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("archive", "employee")},
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("department", models.CharField(max_length=100)),
+                ("present", models.IntegerField(default=0)),
+                ("absent", models.IntegerField(default=0)),
+                (
+                    "archive",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="hrms.attendancearchive",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date", "department"],
+                "unique_together": {("date", "department")},
+            },
+        ),
+        migrations.RunPython(partition_attendance, unpartition_attendance),
+    ]
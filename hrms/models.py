@@ -1,5 +1,7 @@
 import uuid
-from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models import Q
 
 
 class TimeStampedModel(models.Model):
@@ -25,6 +27,12 @@ class Employee(TimeStampedModel):
     email = models.EmailField(unique=True)
     department = models.CharField(max_length=100)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination order (see hrms/pagination.py)
+            models.Index(fields=["created_at", "id"], name="employee_created_id_idx"),
+        ]
+
     def __str__(self):
         return f"{self.full_name} ({self.employee_id})"
 
@@ -45,6 +53,204 @@ class Attendance(TimeStampedModel):
         # Prevent marking attendance twice for the same person on the same day
         unique_together = ("employee", "date")
         ordering = ["-date"]
+        indexes = [
+            # Keyset pagination order (see hrms/pagination.py)
+            models.Index(fields=["date", "id"], name="attendance_date_id_idx"),
+            # Dashboard and bulk-mark page: a day's counts per status
+            # are answered from the index alone
+            models.Index(fields=["date", "status"], name="attendance_date_status_idx"),
+            # Present-day counts per employee; partial, so ABSENT rows
+            # do not bloat it (ignored on backends without partial indexes)
+            models.Index(
+                fields=["employee"],
+                condition=Q(status="PRESENT"),
+                name="attendance_present_emp_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.employee.employee_id} - {self.date} - {self.status}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what is stored so receivers can tell what an update changed
+        instance._loaded_state = (
+            instance.__dict__.get("employee_id"),
+            instance.__dict__.get("date"),
+            instance.__dict__.get("status"),
+        )
+        return instance
+
+    def save(self, *args, **kwargs):
+        # post_save receivers (hrms.receivers) update derived data in the
+        # same transaction; deletes are already atomic in Django
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        self._loaded_state = (self.employee_id, self.date, self.status)
+
+
+class EmployeeAttendanceSummary(models.Model):
+    """
+    Per-employee attendance totals, maintained by hrms.receivers on every
+    attendance write so listing employees needs no aggregate over history.
+    `manage.py rebuild_attendance_summary` recomputes it from scratch.
+    """
+
+    employee = models.OneToOneField(
+        Employee,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="attendance_summary",
+    )
+    present_days = models.IntegerField(default=0)
+    absent_days = models.IntegerField(default=0)
+    last_marked_date = models.DateField(null=True, blank=True)
+    # Set explicitly by hrms.summaries, whose counter updates bypass save()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.employee_id}: {self.present_days}P / {self.absent_days}A"
+
+
+class DailyAttendanceRollup(models.Model):
+    """
+    Present/absent counts per day and department, maintained by
+    hrms.receivers so trend queries read one row per day and department
+    instead of scanning Attendance. Attendance counts under the employee's
+    department when marked; `manage.py backfill_attendance_rollups`
+    rebuilds rows from source using current departments.
+    """
+
+    date = models.DateField()
+    department = models.CharField(max_length=100)
+    present = models.IntegerField(default=0)
+    absent = models.IntegerField(default=0)
+    # Department size when the row was last refreshed
+    headcount = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("date", "department")
+        ordering = ["date", "department"]
+
+    def __str__(self):
+        return f"{self.date} {self.department}: {self.present}P / {self.absent}A"
+
+
+class Job(TimeStampedModel):
+    """
+    A unit of background work (bulk marking, imports, rebuilds), queued in
+    the database and run by `manage.py run_hrms_worker`. See hrms/jobs.py.
+    """
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=50)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    params = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    # Uploaded file for imports; kept in the database so web and worker
+    # processes need no shared filesystem
+    payload = models.BinaryField(null=True, editable=False)
+    progress_done = models.IntegerField(default=0)
+    progress_total = models.IntegerField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True)
+    worker = models.CharField(max_length=100, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Bumped with progress; RUNNING jobs that stop beating were orphaned
+    # by a dead worker and are marked failed
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            # Workers claim the oldest queued job
+            models.Index(
+                fields=["status", "created_at"], name="job_status_created_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.id} ({self.status})"
+
+
+class AttendanceArchive(models.Model):
+    """
+    A month of attendance detached from the partitioned Attendance table
+    (PostgreSQL) and stored as a gzipped CSV file in
+    ATTENDANCE_ARCHIVE_DIR by `manage.py attendance_partitions archive`.
+    See hrms/partitions.py.
+    """
+
+    # First day of the month
+    month = models.DateField(unique=True)
+    # File name inside ATTENDANCE_ARCHIVE_DIR
+    file = models.CharField(max_length=255)
+    rows = models.IntegerField()
+    size = models.BigIntegerField()
+    sha256 = models.CharField(max_length=64)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-month"]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} ({self.rows} records)"
+
+
+class ArchivedAttendanceSummary(models.Model):
+    """
+    An employee's attendance totals within an archived month, recorded by
+    hrms.partitions.archive_month(). Summary rebuilds add them to what is
+    left in Attendance, so archiving a month does not change the totals.
+    """
+
+    archive = models.ForeignKey(
+        AttendanceArchive, on_delete=models.CASCADE, related_name="summaries"
+    )
+    employee = models.ForeignKey(
+        Employee, on_delete=models.CASCADE, related_name="archived_summaries"
+    )
+    present_days = models.IntegerField(default=0)
+    absent_days = models.IntegerField(default=0)
+    last_marked_date = models.DateField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("archive", "employee")
+
+    def __str__(self):
+        return f"{self.employee_id} in {self.archive}"
+
+
+class ArchivedDailyRollup(models.Model):
+    """
+    DailyAttendanceRollup counts for a day of an archived month, under the
+    departments employees had when it was archived. Rollup rebuilds add
+    them to the counts aggregated from Attendance.
+    """
+
+    archive = models.ForeignKey(
+        AttendanceArchive, on_delete=models.CASCADE, related_name="rollups"
+    )
+    date = models.DateField()
+    department = models.CharField(max_length=100)
+    present = models.IntegerField(default=0)
+    absent = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("date", "department")
+        ordering = ["date", "department"]
+
+    def __str__(self):
+        return f"{self.date} {self.department}: {self.present}P / {self.absent}A"
@@ -0,0 +1,168 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _encode_value(value):
+    """JSON fallback for cursor values; keeps full microsecond precision"""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset (seek) pagination.
+
+    The cursor holds the ordering values of the last row on the page, and the
+    next page is fetched with a WHERE on those values instead of an OFFSET.
+    Every page costs the same regardless of depth, and rows inserted while a
+    client is paging never shift or duplicate results.
+
+    `ordering` must end with a unique column so the position is unambiguous.
+    """
+
+    ordering = ()
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self._set_page(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset for async views, fetching with the async ORM"""
+        return self._set_page(
+            [row async for row in self.page_queryset(queryset, request)]
+        )
+
+    def page_queryset(self, queryset, request):
+        """The unevaluated query for the requested page, plus one row"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.seek_filter(position))
+            except (DjangoValidationError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+
+        # Fetch one extra row to know whether another page exists
+        return queryset[: self.page_size + 1]
+
+    def _set_page(self, rows):
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def seek_filter(self, position):
+        """
+        Build `(a, b) < (x, y)` as `a <= x AND (a < x OR (a = x AND b < y))`.
+        The leading bound lets the database range-scan the ordering index.
+        """
+        fields = [field.lstrip("-") for field in self.ordering]
+        lookups = ["lt" if field.startswith("-") else "gt" for field in self.ordering]
+
+        condition = Q()
+        for i, (field, lookup) in enumerate(zip(fields, lookups)):
+            term = Q(**{f"{field}__{lookup}": position[i]})
+            for prior_field, prior_value in zip(fields[:i], position[:i]):
+                term &= Q(**{prior_field: prior_value})
+            condition |= term
+
+        leading = f"{fields[0]}__{lookups[0]}e"
+        return Q(**{leading: position[0]}) & condition
+
+    def encode_cursor(self, row):
+        fields = [field.lstrip("-") for field in self.ordering]
+        # Rows are model instances, or dicts when the view uses .values()
+        if isinstance(row, dict):
+            values = [row[field] for field in fields]
+        else:
+            values = [getattr(row, field) for field in fields]
+        raw = json.dumps(values, default=_encode_value).encode()
+        return urlsafe_b64encode(raw).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            position = json.loads(urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.page[-1])
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    f"Number of results per page (max {self.max_page_size})."
+                ),
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class EmployeePagination(KeysetPagination):
+    ordering = ("-created_at", "-id")
+
+
+class AttendancePagination(KeysetPagination):
+    ordering = ("-date", "-id")
+
+
+class JobPagination(KeysetPagination):
+    ordering = ("-created_at", "-id")
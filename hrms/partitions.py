@@ -0,0 +1,354 @@
+"""
+Monthly partitions of the Attendance table on PostgreSQL, and archival of
+old months to files.
+
+Migration 0009 makes hrms_attendance a table partitioned by RANGE (date),
+one partition per month (hrms_attendance_y2026m10) plus a default
+partition for months without one. Queries filtering on date (the
+dashboard, reports, exports, the matrix, rollups) only scan the partitions
+their range covers, and old months no longer weigh on recent ones.
+
+ensure_partitions() creates partitions ahead of time; archive_month()
+detaches a past month, writes its rows to a gzipped CSV file in
+ATTENDANCE_ARCHIVE_DIR and drops it; read_archive() reads an archived
+month back on demand, and restore_month() re-attaches it.
+
+Archiving records the month's per-employee and per-day totals
+(ArchivedAttendanceSummary, ArchivedDailyRollup), which summary and
+rollup rebuilds add to what Attendance holds, so archived records keep
+counting in EmployeeAttendanceSummary and DailyAttendanceRollup. It also
+seals the month with an empty partition whose CHECK rejects every row:
+writes for an archived month fail with IntegrityError whatever path they
+take (ORM, bulk_write, COPY) instead of landing in the default partition
+next to the archived records. The API rejects them up front
+(is_archived()).
+
+On other databases Attendance is a plain table and is_partitioned() is
+False.
+"""
+
+import csv
+import datetime
+import gzip
+import hashlib
+import os
+import re
+import uuid
+from collections import namedtuple
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from .models import (
+    ArchivedAttendanceSummary,
+    ArchivedDailyRollup,
+    AttendanceArchive,
+    Employee,
+)
+
+PARENT = "hrms_attendance"
+DEFAULT_PARTITION = f"{PARENT}_default"
+# Column order of archive files
+ARCHIVE_COLUMNS = ("id", "employee_id", "date", "status", "created_at", "updated_at")
+COPY_CHUNK_SIZE = 1 << 16
+SEALED_SUFFIX = "_archived"
+
+Partition = namedtuple("Partition", "name start end")
+
+_BOUND = re.compile(r"FROM \('([\d-]+)'\) TO \('([\d-]+)'\)")
+
+
+def month_start(date):
+    return date.replace(day=1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"{PARENT}_y{month:%Y}m{month:%m}"
+
+
+def sealed_name(month):
+    """Empty partition standing in for an archived month"""
+    return f"{partition_name(month)}{SEALED_SUFFIX}"
+
+
+def archive_file_name(month):
+    return f"{partition_name(month)}.csv.gz"
+
+
+def archive_path(archive):
+    return os.path.join(settings.ATTENDANCE_ARCHIVE_DIR, archive.file)
+
+
+def is_partitioned(using=DEFAULT_DB_ALIAS):
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = %s::regclass", [PARENT]
+        )
+        return cursor.fetchone()[0] == "p"
+
+
+def is_archived(date, using=DEFAULT_DB_ALIAS):
+    """
+    True if the month of `date` is archived. Only past months can be, so
+    current and future dates need no query.
+    """
+    month = month_start(date)
+    if month >= month_start(timezone.localtime(timezone.now()).date()):
+        return False
+    return AttendanceArchive.objects.using(using).filter(month=month).exists()
+
+
+def partitions(using=DEFAULT_DB_ALIAS):
+    """
+    Attached partitions by start month, leaving out sealed archived months;
+    the default one has no bounds
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass",
+            [PARENT],
+        )
+        rows = cursor.fetchall()
+    result = []
+    for name, bound in rows:
+        if name.endswith(SEALED_SUFFIX):
+            continue
+        match = _BOUND.search(bound)
+        if match:
+            start, end = (
+                datetime.date.fromisoformat(value) for value in match.groups()
+            )
+        else:
+            start = end = None
+        result.append(Partition(name, start, end))
+    return sorted(result, key=lambda p: (p.start is None, p.start))
+
+
+def _attach(cursor, name, month):
+    """
+    Attach table `name` as the partition for `month`, first moving in any
+    rows for the month that were stored in the default partition
+    """
+    start, end = month, add_months(month, 1)
+    cursor.execute(
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+        f"WHERE date >= %s AND date < %s RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved",
+        [start, end],
+    )
+    _attach_empty(cursor, name, month)
+
+
+def _attach_empty(cursor, name, month):
+    start, end = month, add_months(month, 1)
+    # DDL takes no parameters under server-side binding (psycopg 3)
+    cursor.execute(
+        f"ALTER TABLE {PARENT} ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def _seal(cursor, month):
+    """
+    Attach an empty partition for an archived month that rejects every
+    row. The month's own partition must be detached and the default
+    partition hold no rows for it.
+    """
+    name = sealed_name(month)
+    cursor.execute(
+        f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS, "
+        f"CONSTRAINT attendance_month_archived CHECK (false))"
+    )
+    _attach_empty(cursor, name, month)
+
+
+def _unseal(cursor, month):
+    """Drop the sealed partition of an archived month"""
+    name = sealed_name(month)
+    cursor.execute(f"ALTER TABLE {PARENT} DETACH PARTITION {name}")
+    cursor.execute(f"DROP TABLE {name}")
+
+
+def create_partition(month, using=DEFAULT_DB_ALIAS):
+    """Create the partition for the month containing `month`"""
+    month = month_start(month)
+    name = partition_name(month)
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS)")
+        _attach(cursor, name, month)
+    return name
+
+
+def ensure_partitions(months_ahead=None, using=DEFAULT_DB_ALIAS):
+    """
+    Create missing partitions from the current month through `months_ahead`
+    months later (ATTENDANCE_PARTITION_MONTHS_AHEAD by default). Months
+    that are archived are skipped. Returns the months created.
+    """
+    if months_ahead is None:
+        months_ahead = settings.ATTENDANCE_PARTITION_MONTHS_AHEAD
+    current = month_start(timezone.localtime(timezone.now()).date())
+    existing = {p.start for p in partitions(using)}
+    archived = set(
+        AttendanceArchive.objects.using(using).values_list("month", flat=True)
+    )
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing and month not in archived:
+            create_partition(month, using)
+            created.append(month)
+    return created
+
+
+def _copy_out(cursor, sql, file):
+    raw = cursor.cursor
+    if hasattr(raw, "copy_expert"):  # psycopg2
+        raw.copy_expert(sql, file)
+    else:  # psycopg 3
+        with raw.copy(sql) as copy:
+            for data in copy:
+                file.write(data)
+
+
+def _copy_in(cursor, sql, file):
+    raw = cursor.cursor
+    if hasattr(raw, "copy_expert"):  # psycopg2
+        raw.copy_expert(sql, file)
+    else:  # psycopg 3
+        with raw.copy(sql) as copy:
+            while data := file.read(COPY_CHUNK_SIZE):
+                copy.write(data)
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while data := f.read(COPY_CHUNK_SIZE):
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def archive_month(month, using=DEFAULT_DB_ALIAS):
+    """
+    Detach the partition for a past month, write its rows to a gzipped CSV
+    file in ATTENDANCE_ARCHIVE_DIR and drop it. Returns the
+    AttendanceArchive. Raises ValueError for the current or a future
+    month, or a month without a partition.
+    """
+    month = month_start(month)
+    if month >= month_start(timezone.localtime(timezone.now()).date()):
+        raise ValueError(f"{month:%Y-%m} is not a past month.")
+    name = partition_name(month)
+    if name not in {p.name for p in partitions(using)}:
+        raise ValueError(f"{month:%Y-%m} has no partition.")
+
+    os.makedirs(settings.ATTENDANCE_ARCHIVE_DIR, exist_ok=True)
+    file = archive_file_name(month)
+    path = os.path.join(settings.ATTENDANCE_ARCHIVE_DIR, file)
+    temp = f"{path}.tmp"
+    columns = ", ".join(ARCHIVE_COLUMNS)
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {PARENT} DETACH PARTITION {name}")
+        cursor.execute(f"SELECT COUNT(*) FROM {name}")
+        (rows,) = cursor.fetchone()
+        with gzip.open(temp, "wb") as f:
+            _copy_out(
+                cursor,
+                f"COPY (SELECT {columns} FROM {name} ORDER BY date, employee_id) "
+                f"TO STDOUT WITH (FORMAT csv, HEADER)",
+                f,
+            )
+        os.replace(temp, path)
+        archive = AttendanceArchive.objects.using(using).create(
+            month=month,
+            file=file,
+            rows=rows,
+            size=os.path.getsize(path),
+            sha256=_sha256(path),
+        )
+        _record_totals(cursor, name, archive)
+        cursor.execute(f"DROP TABLE {name}")
+        _seal(cursor, month)
+    return archive
+
+
+def _record_totals(cursor, name, archive):
+    """Per-employee and per-day totals of the detached partition `name`"""
+    counts = (
+        "COUNT(*) FILTER (WHERE a.status = 'PRESENT'), "
+        "COUNT(*) FILTER (WHERE a.status = 'ABSENT')"
+    )
+    cursor.execute(
+        f"INSERT INTO {ArchivedAttendanceSummary._meta.db_table} "
+        "(archive_id, employee_id, present_days, absent_days, last_marked_date) "
+        f"SELECT %s, a.employee_id, {counts}, MAX(a.date) FROM {name} a "
+        "GROUP BY a.employee_id",
+        [archive.pk],
+    )
+    # Under current departments, as rebuild_rollups() attributes them
+    cursor.execute(
+        f"INSERT INTO {ArchivedDailyRollup._meta.db_table} "
+        "(archive_id, date, department, present, absent) "
+        f"SELECT %s, a.date, e.department, {counts} FROM {name} a "
+        f"JOIN {Employee._meta.db_table} e ON e.id = a.employee_id "
+        "GROUP BY a.date, e.department",
+        [archive.pk],
+    )
+
+
+def restore_month(month, using=DEFAULT_DB_ALIAS):
+    """
+    Load an archived month back into its partition and forget the archive
+    and its totals; the file is left in place. Returns the number of rows
+    restored.
+    """
+    month = month_start(month)
+    archive = AttendanceArchive.objects.using(using).get(month=month)
+    path = archive_path(archive)
+    if _sha256(path) != archive.sha256:
+        raise ValueError(f"{path} does not match its recorded checksum.")
+
+    name = partition_name(month)
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        _unseal(cursor, month)
+        cursor.execute(f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS)")
+        with gzip.open(path, "rb") as f:
+            _copy_in(
+                cursor,
+                f"COPY {name} ({', '.join(ARCHIVE_COLUMNS)}) "
+                f"FROM STDIN WITH (FORMAT csv, HEADER)",
+                f,
+            )
+        _attach(cursor, name, month)
+        archive.delete()
+    return archive.rows
+
+
+def read_archive(archive, employee=None):
+    """
+    Yield the records of an archived month as dicts of ARCHIVE_COLUMNS
+    values, optionally only those of one employee (UUID)
+    """
+    with gzip.open(archive_path(archive), "rt", newline="") as f:
+        for row in csv.DictReader(f):
+            employee_id = uuid.UUID(row["employee_id"])
+            if employee is not None and employee_id != employee:
+                continue
+            yield {
+                "id": int(row["id"]),
+                "employee_id": employee_id,
+                "date": datetime.date.fromisoformat(row["date"]),
+                "status": row["status"],
+                "created_at": parse_datetime(row["created_at"]),
+                "updated_at": parse_datetime(row["updated_at"]),
+            }
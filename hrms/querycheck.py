@@ -0,0 +1,188 @@
+"""
+N+1 and slow query detection.
+
+QueryDetector is a connection.execute_wrapper hook that fingerprints each
+statement (literals and IN lists collapsed) and flags a statement shape
+repeated more than QUERY_DETECTOR_REPEAT_LIMIT times, plus any single
+query slower than QUERY_DETECTOR_SLOW_MS. QueryDetectorMiddleware runs it
+per request and reports the view, and for N+1s the serializer field and
+line of code that issued the repeated query.
+
+QUERY_DETECTOR selects the mode: "off", "log" (a warning on the
+hrms.querycheck logger, for staging) or "raise" (N+1s raise
+NPlusOneError; the test runner below uses it so CI fails on them).
+"""
+
+import logging
+import re
+import sys
+import time
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.runner import DiscoverRunner
+from django.utils.deprecation import MiddlewareMixin
+from rest_framework.fields import Field
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN \((?:\s*(?:%s|\?|NULL)\s*,?)+\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    """Statement shape: SQL with literals and IN lists collapsed"""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def query_origin():
+    """
+    Where the current query comes from: the innermost serializer field
+    being read and the innermost project source line, e.g.
+    ("AttendanceSerializer.employee_name", "hrms/views.py:120").
+    """
+    field = line = None
+    base_dir = str(settings.BASE_DIR)
+    frame = sys._getframe(2)
+    while frame is not None and not (field and line):
+        if field is None:
+            owner = frame.f_locals.get("self")
+            if isinstance(owner, Field) and owner.field_name and owner.parent:
+                field = f"{type(owner.parent).__name__}.{owner.field_name}"
+        filename = frame.f_code.co_filename
+        if (
+            line is None
+            and filename.startswith(base_dir)
+            and "site-packages" not in filename
+            and filename != __file__
+        ):
+            line = f"{filename[len(base_dir) + 1:]}:{frame.f_lineno}"
+        frame = frame.f_back
+    return field, line
+
+
+class QueryDetector:
+    """
+    Execute wrapper recording statement shapes, repeats and slow queries.
+
+        with QueryDetector() as detector:
+            ...
+        detector.problems()
+    """
+
+    def __init__(self, repeat_limit=None, slow_ms=None):
+        self.repeat_limit = (
+            settings.QUERY_DETECTOR_REPEAT_LIMIT
+            if repeat_limit is None
+            else repeat_limit
+        )
+        self.slow_ms = settings.QUERY_DETECTOR_SLOW_MS if slow_ms is None else slow_ms
+        self.counts = {}
+        # fingerprint -> (serializer field, source line), captured once the
+        # shape first goes over the limit
+        self.repeated = {}
+        self.slow = []  # (milliseconds, sql)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            shape = fingerprint(sql)
+            count = self.counts[shape] = self.counts.get(shape, 0) + 1
+            if count == self.repeat_limit + 1:
+                self.repeated[shape] = query_origin()
+            if elapsed > self.slow_ms:
+                self.slow.append((elapsed, sql))
+
+    def __enter__(self):
+        # Kept so a stream finishing on another thread detaches from the
+        # connection the request used
+        self.connection = connections[DEFAULT_DB_ALIAS]
+        self.connection.execute_wrappers.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self in self.connection.execute_wrappers:
+            self.connection.execute_wrappers.remove(self)
+
+    def problems(self):
+        """Human-readable descriptions of what was detected"""
+        messages = []
+        for shape, (field, line) in self.repeated.items():
+            where = ", ".join(
+                part for part in (field and f"field {field}", line) if part
+            )
+            messages.append(
+                f"N+1: {self.counts[shape]} x {shape}"
+                + (f" ({where})" if where else "")
+            )
+        for elapsed, sql in self.slow:
+            messages.append(f"Slow query: {elapsed:.0f} ms {sql}")
+        return messages
+
+
+class QueryDetectorMiddleware(MiddlewareMixin):
+    """Runs QueryDetector around each request when QUERY_DETECTOR is on"""
+
+    def process_request(self, request):
+        if settings.QUERY_DETECTOR == "off":
+            return
+        request._query_detector = QueryDetector().__enter__()
+
+    def process_response(self, request, response):
+        detector = getattr(request, "_query_detector", None)
+        if detector is None:
+            return response
+        if response.streaming:
+            chunks = response.streaming_content
+            response.streaming_content = (
+                self._check_async(request, detector, chunks)
+                if response.is_async
+                else self._check(request, detector, chunks)
+            )
+            return response
+        self.report(request, detector)
+        return response
+
+    def _check(self, request, detector, chunks):
+        try:
+            yield from chunks
+        finally:
+            self.report(request, detector)
+
+    async def _check_async(self, request, detector, chunks):
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            self.report(request, detector)
+
+    def report(self, request, detector):
+        detector.__exit__()
+        problems = detector.problems()
+        if not problems:
+            return
+        match = request.resolver_match
+        view = match.view_name if match else request.path
+        message = f"{request.method} {request.path} [{view}]\n" + "\n".join(problems)
+        if settings.QUERY_DETECTOR == "raise" and detector.repeated:
+            raise NPlusOneError(message)
+        logger.warning(message)
+
+
+class QueryDetectorTestRunner(DiscoverRunner):
+    """Test runner that fails any request issuing an N+1 query pattern"""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.QUERY_DETECTOR = "raise"
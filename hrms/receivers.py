@@ -0,0 +1,182 @@
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from . import bitmaps, rollups, summaries
+from .cache import invalidate_dashboard
+from .models import Employee, Attendance
+from .signals import attendance_bulk_written, employees_bulk_created
+
+
+def _invalidate_dashboard():
+    invalidate_dashboard()
+    # Again after commit, so a concurrent request cannot re-cache
+    # stats read before this transaction became visible
+    transaction.on_commit(invalidate_dashboard)
+
+
+def _deleting_employee(origin):
+    """True when a delete cascades from an Employee (instance or queryset)"""
+    return isinstance(origin, Employee) or getattr(origin, "model", None) is Employee
+
+
+def _moved(instance):
+    """
+    Compare an updated attendance record with what was loaded.
+    Returns None if employee, date and status are unchanged, otherwise the
+    loaded (employee_id, date, status), or () if it is unknown.
+    """
+    loaded = getattr(instance, "_loaded_state", ())
+    if loaded == (instance.employee_id, instance.date, instance.status):
+        return None
+    return loaded
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def invalidate_dashboard_on_write(sender, **kwargs):
+    _invalidate_dashboard()
+
+
+@receiver(attendance_bulk_written)
+@receiver(employees_bulk_created)
+def invalidate_dashboard_on_bulk_write(sender, **kwargs):
+    _invalidate_dashboard()
+
+
+@receiver(post_save, sender=Attendance)
+def update_summary_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        summaries.record_marked([instance.employee_id], instance.date, instance.status)
+        return
+
+    loaded = _moved(instance)
+    if loaded is None:
+        return
+    if loaded[:2] != (instance.employee_id, instance.date):
+        # Moved to another employee or date: recompute from source
+        employee_ids = {instance.employee_id}
+        if loaded:
+            employee_ids.add(loaded[0])
+        summaries.rebuild_summaries(employee_ids)
+    else:
+        summaries.record_status_change(instance.employee_id, loaded[2], instance.status)
+
+
+@receiver(post_delete, sender=Attendance)
+def update_summary_on_delete(sender, instance, origin=None, **kwargs):
+    # Deleting an employee cascades to its records and its summary
+    if _deleting_employee(origin):
+        return
+    summaries.record_removed(instance.employee_id, instance.status)
+
+
+@receiver(attendance_bulk_written)
+def update_summary_on_bulk_write(sender, date, status, employee_ids, **kwargs):
+    summaries.record_marked(employee_ids, date, status)
+
+
+@receiver(post_save, sender=Attendance)
+def update_rollup_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        rollups.record_marked(
+            instance.date, instance.status, {instance.employee.department: 1}
+        )
+        return
+
+    loaded = _moved(instance)
+    if loaded is None:
+        return
+    if loaded[:2] != (instance.employee_id, instance.date):
+        dates = {instance.date}
+        if loaded:
+            dates.add(loaded[1])
+        rollups.rebuild_rollups(dates)
+    else:
+        rollups.record_status_change(
+            instance.date, instance.employee.department, loaded[2], instance.status
+        )
+
+
+@receiver(post_delete, sender=Attendance)
+def update_rollup_on_delete(sender, instance, origin=None, **kwargs):
+    # Rows removed by an employee delete are handled once per employee below
+    if _deleting_employee(origin):
+        return
+    rollups.record_removed(instance.date, instance.employee.department, instance.status)
+
+
+@receiver(attendance_bulk_written)
+def update_rollup_on_bulk_write(sender, date, status, employee_ids, **kwargs):
+    department_counts = dict(
+        Employee.objects.filter(id__in=employee_ids)
+        .order_by()
+        .values("department")
+        .annotate(count=Count("id"))
+        .values_list("department", "count")
+    )
+    rollups.record_marked(date, status, department_counts)
+
+
+@receiver(post_save, sender=Attendance)
+def update_bitmap_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        bitmaps.record_marked([instance.employee_id], instance.date, instance.status)
+        return
+    loaded = _moved(instance)
+    if loaded is not None:
+        bitmaps.record_moved(
+            loaded, instance.employee_id, instance.date, instance.status
+        )
+
+
+@receiver(post_delete, sender=Attendance)
+def update_bitmap_on_delete(sender, instance, origin=None, **kwargs):
+    # Deleting an employee clears all its days at once, below
+    if _deleting_employee(origin):
+        return
+    bitmaps.record_removed(instance.employee_id, instance.date)
+
+
+@receiver(attendance_bulk_written)
+def update_bitmap_on_bulk_write(sender, date, status, employee_ids, **kwargs):
+    bitmaps.record_marked(employee_ids, date, status)
+
+
+@receiver(post_delete, sender=Employee)
+def update_bitmap_on_employee_delete(sender, instance, **kwargs):
+    bitmaps.record_employee_removed(instance.id)
+
+
+@receiver(pre_delete, sender=Employee)
+def remember_attendance_dates(sender, instance, **kwargs):
+    # Read before the cascade removes the rows
+    instance._attendance_dates = list(
+        instance.attendance_records.order_by().values_list("date", flat=True).distinct()
+    )
+
+
+@receiver(post_delete, sender=Employee)
+def update_rollup_on_employee_delete(sender, instance, **kwargs):
+    rollups.rebuild_rollups(getattr(instance, "_attendance_dates", []))
+    rollups.refresh_headcount(timezone.localtime(timezone.now()).date())
+
+
+@receiver(employees_bulk_created)
+def update_rollup_on_employees_created(sender, **kwargs):
+    rollups.refresh_headcount(timezone.localtime(timezone.now()).date())
+
+
+@receiver(post_save, sender=Employee)
+def update_rollup_on_employee_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        rollups.refresh_headcount(timezone.localtime(timezone.now()).date())
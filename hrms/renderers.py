@@ -0,0 +1,71 @@
+"""
+orjson-backed JSON renderer and parser for DRF, with the stdlib versions as
+fallback when orjson is not installed. Output matches DRF's JSONRenderer:
+compact, UTF-8, and datetimes formatted by DRF's encoder.
+"""
+
+import json
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # Optional; stdlib json without it
+    orjson = None
+
+if orjson is not None:
+    # UUIDs, dates, dicts and lists are native. Datetimes, times and other
+    # types (Decimal, lazy strings, ...) go through DRF's encoder so output
+    # is byte-identical, e.g. millisecond precision and a "Z" suffix.
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    _default = JSONEncoder().default
+
+
+def dumps(data):
+    """Serialize to compact JSON bytes, like FastJSONRenderer"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        data, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer using orjson for compact output when it is installed"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            # Pretty-printed and ASCII-only output stay on the stdlib path
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+        # Same strict-javascript-subset escaping as JSONRenderer
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser using orjson for UTF-8 bodies when it is installed"""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            # Like strict JSONParser, orjson rejects NaN and Infinity
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,175 @@
+import calendar
+import datetime
+from collections import defaultdict
+from django.db.models import Count, F, Max, Min, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncMonth, TruncWeek
+from .models import (
+    Employee,
+    Attendance,
+    ArchivedDailyRollup,
+    AttendanceArchive,
+    DailyAttendanceRollup,
+)
+
+PERIODS = {
+    "day": None,
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+
+
+def _counter_update(status, step):
+    field = "present" if status == "PRESENT" else "absent"
+    return {field: F(field) + step}
+
+
+def _department_headcount():
+    # Coalesce: a department with no employees left has no group to count
+    return Coalesce(
+        Subquery(
+            Employee.objects.filter(department=OuterRef("department"))
+            .order_by()
+            .values("department")
+            .annotate(count=Count("id"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def record_marked(date, status, department_counts):
+    """
+    Add newly created attendance to the day's rows.
+    department_counts maps department -> number of new records.
+    """
+    for department, count in department_counts.items():
+        updated = DailyAttendanceRollup.objects.filter(
+            date=date, department=department
+        ).update(**_counter_update(status, count))
+        if not updated:
+            # First records for a department that day: rebuilding the day
+            # from source also covers the departments not yet updated
+            rebuild_rollups([date])
+            return
+
+
+def record_status_change(date, department, old_status, new_status):
+    updated = DailyAttendanceRollup.objects.filter(
+        date=date, department=department
+    ).update(**_counter_update(old_status, -1), **_counter_update(new_status, 1))
+    if not updated:
+        rebuild_rollups([date])
+
+
+def record_removed(date, department, status):
+    updated = DailyAttendanceRollup.objects.filter(
+        date=date, department=department
+    ).update(**_counter_update(status, -1))
+    if not updated:
+        rebuild_rollups([date])
+
+
+def refresh_headcount(date):
+    """Re-count department sizes on the given day's rows after employee changes"""
+    DailyAttendanceRollup.objects.filter(date=date).update(
+        headcount=_department_headcount()
+    )
+
+
+def rebuild_rollups(dates):
+    """
+    Recompute the rows for the given dates from Attendance, plus the
+    totals of archived months (ArchivedDailyRollup).
+    Attendance is attributed to employees' current departments and
+    headcount is the current department size.
+    """
+    dates = list(dates)
+    headcount = dict(
+        Employee.objects.order_by()
+        .values("department")
+        .annotate(count=Count("id"))
+        .values_list("department", "count")
+    )
+    live = (
+        Attendance.objects.filter(date__in=dates)
+        .order_by()
+        .values("date", "employee__department")
+        .annotate(
+            present=Count("id", filter=Q(status="PRESENT")),
+            absent=Count("id", filter=Q(status="ABSENT")),
+        )
+        .values_list("date", "employee__department", "present", "absent")
+    )
+    archived = (
+        ArchivedDailyRollup.objects.filter(date__in=dates)
+        .order_by()
+        .values_list("date", "department", "present", "absent")
+    )
+    counts = defaultdict(lambda: [0, 0])
+    for date, department, present, absent in live.union(archived, all=True):
+        counts[date, department][0] += present
+        counts[date, department][1] += absent
+    rows = [
+        DailyAttendanceRollup(
+            date=date,
+            department=department,
+            present=present,
+            absent=absent,
+            headcount=headcount.get(department, 0),
+        )
+        for (date, department), (present, absent) in counts.items()
+    ]
+    # Upsert rather than delete + insert so concurrent rebuilds of the same
+    # day cannot collide on the (date, department) unique constraint
+    DailyAttendanceRollup.objects.filter(date__in=dates).update(
+        present=0, absent=0, headcount=_department_headcount()
+    )
+    DailyAttendanceRollup.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["date", "department"],
+        update_fields=["present", "absent", "headcount"],
+    )
+    return len(rows)
+
+
+def history_bounds():
+    """First and last day with attendance, live or archived; (None, None) if none"""
+    live = Attendance.objects.aggregate(first=Min("date"), last=Max("date"))
+    archived = AttendanceArchive.objects.aggregate(
+        first=Min("month"), last=Max("month")
+    )
+    if archived["last"] is not None:
+        month = archived["last"]
+        archived["last"] = datetime.date(
+            month.year, month.month, calendar.monthrange(month.year, month.month)[1]
+        )
+    firsts = [value for value in (live["first"], archived["first"]) if value]
+    lasts = [value for value in (live["last"], archived["last"]) if value]
+    return min(firsts, default=None), max(lasts, default=None)
+
+
+def daily_trend(start, end, department=None, period="day"):
+    """
+    Present/absent counts per period and department between two dates,
+    read from the rollup table rather than raw attendance. For weeks and
+    months, headcount is the largest daily headcount in the period.
+    """
+    queryset = DailyAttendanceRollup.objects.filter(date__range=(start, end))
+    if department:
+        queryset = queryset.filter(department=department)
+
+    trunc = PERIODS[period]
+    period_start = trunc("date") if trunc else F("date")
+    return list(
+        queryset.annotate(period=period_start)
+        .order_by()
+        .values("period", "department")
+        .annotate(
+            present_total=Sum("present"),
+            absent_total=Sum("absent"),
+            peak_headcount=Max("headcount"),
+            days=Count("date"),
+        )
+        .order_by("period", "department")
+    )
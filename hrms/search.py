@@ -0,0 +1,167 @@
+"""
+Indexed employee search over employee ID, name and email.
+
+Employee IDs match by prefix on an index: varchar_pattern_ops on
+PostgreSQL, a range scan of the unique index on SQLite. Names and emails
+match with pg_trgm word similarity on PostgreSQL (GIN trigram indexes,
+tolerant of typos and partial words) and through an FTS5 table kept in
+sync by triggers on SQLite, with every word of the query as a prefix.
+FTS rows carry the employee UUID, which the queries join on. The indexes
+are created by migration 0008; without them (e.g. SQLite built without
+FTS5) search falls back to unindexed icontains.
+
+search_employees() returns the best matches ranked, for the API;
+filter_employees() applies the same match to a queryset, for the admin.
+"""
+
+import re
+import uuid
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
+from .models import Employee
+
+FTS_TABLE = "hrms_employee_fts"
+SEARCH_LIMIT = 20
+# FTS matches ranked by bm25 per query. Ranking costs one score per match,
+# so a broad query (one common letter) ranks only its first candidates.
+FTS_CANDIDATES = 500
+
+_WORD = re.compile(r"\w+")
+# Same characters normalize_employee_id accepts
+_EMPLOYEE_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def search_backend(queryset):
+    """Search strategy available on the queryset's database"""
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql":
+        return "trigram"
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [FTS_TABLE],
+            )
+            if cursor.fetchone():
+                return "fts"
+    return "contains"
+
+
+def _id_prefix(term, backend):
+    """Employee IDs starting with `term`, stored upper-case; None if not an ID"""
+    if not _EMPLOYEE_ID.match(term):
+        return None
+    prefix = term.upper()
+    if backend == "trigram":
+        return Q(employee_id__startswith=prefix)
+    # SQLite's LIKE is case-insensitive and cannot use the index
+    return Q(employee_id__gte=prefix, employee_id__lt=prefix + "\U0010ffff")
+
+
+def _trigram_match(term):
+    match = Q(full_name__trigram_word_similar=term) | Q(
+        email__trigram_word_similar=term
+    )
+    by_id = _id_prefix(term, "trigram")
+    return match if by_id is None else match | by_id
+
+
+def _contains_match(term):
+    return (
+        Q(employee_id__icontains=term)
+        | Q(full_name__icontains=term)
+        | Q(email__icontains=term)
+    )
+
+
+def fts_query(term):
+    """FTS5 MATCH expression: every word of `term`, each as a prefix"""
+    return " ".join(f'"{word}"*' for word in _WORD.findall(term))
+
+
+def filter_employees(queryset, term):
+    """Employees in `queryset` matching `term`, unranked"""
+    term = term.strip()
+    backend = search_backend(queryset)
+    if backend == "trigram":
+        return queryset.filter(_trigram_match(term))
+    if backend == "contains":
+        return queryset.filter(_contains_match(term))
+
+    match = Q(pk__in=[])
+    by_id = _id_prefix(term, backend)
+    if by_id is not None:
+        match |= by_id
+    words = fts_query(term)
+    if words:
+        match |= Q(
+            pk__in=RawSQL(
+                f"SELECT id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+                [words],
+            )
+        )
+    return queryset.filter(match)
+
+
+def search_employees(term, limit=SEARCH_LIMIT, queryset=None):
+    """
+    Up to `limit` employees matching `term`, best first; employee ID
+    prefix matches rank first (on SQLite they are the only results when
+    there are any). `queryset` (all employees by default) supplies
+    annotations such as the API's present-day totals.
+    """
+    queryset = Employee.objects.all() if queryset is None else queryset
+    term = term.strip()
+    backend = search_backend(queryset)
+
+    if backend == "trigram":
+        by_id = _id_prefix(term, backend)
+        return list(
+            queryset.filter(_trigram_match(term))
+            .annotate(
+                search_rank=Case(
+                    When(by_id or Q(pk__in=[]), then=Value(1.0)),
+                    default=Value(0.0),
+                    output_field=FloatField(),
+                )
+                + Greatest(
+                    TrigramWordSimilarity(term, "full_name"),
+                    TrigramWordSimilarity(term, "email"),
+                )
+            )
+            .order_by("-search_rank", "employee_id")[:limit]
+        )
+
+    if backend == "contains":
+        return list(
+            queryset.filter(_contains_match(term)).order_by("employee_id")[:limit]
+        )
+
+    ids = []
+    by_id = _id_prefix(term, backend)
+    if by_id is not None:
+        ids = list(
+            Employee.objects.using(queryset.db)
+            .filter(by_id)
+            .order_by("employee_id")
+            .values_list("id", flat=True)[:limit]
+        )
+    words = fts_query(term)
+    # A term that prefixes employee IDs is an ID lookup; matching its
+    # words too ("EMP" and "001") would scan most of the text index
+    if words and not ids:
+        with connections[queryset.db].cursor() as cursor:
+            # bm25 weights: UUID (unindexed), name, email
+            cursor.execute(
+                f"SELECT e.id FROM hrms_employee e JOIN ("
+                f"SELECT id, bm25({FTS_TABLE}, 0.0, 5.0, 1.0) AS score "
+                f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s LIMIT %s"
+                f") f ON e.id = f.id ORDER BY f.score, e.employee_id LIMIT %s",
+                [words, FTS_CANDIDATES, limit],
+            )
+            ids = [uuid.UUID(row[0]) for row in cursor.fetchall()]
+    employees = queryset.in_bulk(ids)
+    return [employees[pk] for pk in ids if pk in employees]
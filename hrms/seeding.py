@@ -0,0 +1,95 @@
+import datetime
+import random
+import uuid
+from itertools import islice
+from django.utils import timezone
+from .bulkwrite import bulk_write
+from .models import Employee, Attendance
+
+DEFAULT_DEPARTMENTS = (
+    "Engineering",
+    "Finance",
+    "HR",
+    "Marketing",
+    "Operations",
+    "Sales",
+    "Support",
+)
+
+# Rows built in memory and written per bulk_write call
+SEED_BATCH_SIZE = 5000
+
+EMPLOYEE_FIELDS = ("id", "employee_id", "full_name", "email", "department")
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def seed_employees(
+    count,
+    prefix="SEED",
+    departments=DEFAULT_DEPARTMENTS,
+    batch_size=SEED_BATCH_SIZE,
+    seed=None,
+):
+    """
+    Insert `count` synthetic employees in batches and return their IDs.
+    With a `seed` the primary keys are reproducible too (per prefix, so
+    different prefixes never collide).
+    """
+    ids = []
+    rng = random.Random(f"{prefix}:{seed}")
+    employees = (
+        (
+            (
+                uuid.UUID(int=rng.getrandbits(128), version=4)
+                if seed is not None
+                else uuid.uuid4()
+            ),
+            f"{prefix}-{i:06d}",
+            f"{prefix.title()} Employee {i}",
+            f"{prefix.lower()}-{i:06d}@example.com",
+            departments[i % len(departments)],
+        )
+        for i in range(count)
+    )
+    for chunk in chunked(employees, batch_size):
+        bulk_write(Employee, EMPLOYEE_FIELDS, chunk)
+        ids.extend(row[0] for row in chunk)
+    return ids
+
+
+def seed_attendance(
+    employee_ids,
+    days,
+    absence_rate=0.1,
+    end_date=None,
+    seed=0,
+    batch_size=SEED_BATCH_SIZE,
+    progress=None,
+):
+    """
+    Insert one record per employee per day for the `days` days ending at
+    `end_date` (today by default). Rows are generated lazily and written in
+    batches, each its own transaction, so memory stays bounded. On Postgres
+    the batches go through COPY (see hrms.bulkwrite).
+    Calls progress(written) after every batch. Returns the number of rows
+    written.
+    """
+    rng = random.Random(seed)
+    end_date = end_date or timezone.localtime(timezone.now()).date()
+    rows = (
+        (employee_id, date, "ABSENT" if rng.random() < absence_rate else "PRESENT")
+        for date in (end_date - datetime.timedelta(days=i) for i in range(days))
+        for employee_id in employee_ids
+    )
+    written = 0
+    for chunk in chunked(rows, batch_size):
+        bulk_write(Attendance, ("employee_id", "date", "status"), chunk)
+        written += len(chunk)
+        if progress:
+            progress(written)
+    return written
@@ -1,10 +1,64 @@
 from rest_framework import serializers
-from .models import Employee, Attendance
+from .models import Employee, Attendance, AttendanceArchive, Job
 from django.core.validators import EmailValidator
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone
+from .partitions import is_archived
 import re
 
 
+def normalize_email(value):
+    """Ensure email is in valid format"""
+    try:
+        EmailValidator()(value)
+    except DjangoValidationError:
+        raise serializers.ValidationError("Enter a valid email address.")
+    return value.lower()
+
+
+def normalize_employee_id(value):
+    """Ensure employee_id follows a reasonable format and is not empty"""
+    if not value or not value.strip():
+        raise serializers.ValidationError("Employee ID cannot be empty.")
+
+    # Basic sanity check: alphanumeric, hyphens, underscores allowed
+    if not re.match(r"^[A-Za-z0-9_-]+$", value):
+        raise serializers.ValidationError(
+            "Employee ID can only contain letters, numbers, hyphens, and underscores."
+        )
+    return value.strip().upper()
+
+
+def normalize_full_name(value):
+    """Ensure full name is not empty or just whitespace"""
+    if not value or not value.strip():
+        raise serializers.ValidationError("Full name cannot be empty.")
+    return value.strip()
+
+
+def normalize_department(value):
+    """Ensure department is not empty"""
+    if not value or not value.strip():
+        raise serializers.ValidationError("Department cannot be empty.")
+    return value.strip()
+
+
+def reject_archived_date(value):
+    """Records of archived months are read-only until the month is restored"""
+    if is_archived(value):
+        raise serializers.ValidationError(f"Attendance for {value:%Y-%m} is archived.")
+    return value
+
+
+# Shared by EmployeeSerializer and the bulk import (hrms/imports.py)
+EMPLOYEE_NORMALIZERS = {
+    "employee_id": normalize_employee_id,
+    "full_name": normalize_full_name,
+    "email": normalize_email,
+    "department": normalize_department,
+}
+
+
 class EmployeeSerializer(serializers.ModelSerializer):
     total_present_days = serializers.IntegerField(read_only=True, default=0)
 
@@ -14,37 +68,16 @@ class EmployeeSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "updated_at", "total_present_days")
 
     def validate_email(self, value):
-        """Ensure email is in valid format"""
-        email_validator = EmailValidator()
-        try:
-            email_validator(value)
-        except DjangoValidationError:
-            raise serializers.ValidationError("Enter a valid email address.")
-        return value.lower()
+        return normalize_email(value)
 
     def validate_employee_id(self, value):
-        """Ensure employee_id follows a reasonable format and is not empty"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("Employee ID cannot be empty.")
-
-        # Basic sanity check: alphanumeric, hyphens, underscores allowed
-        if not re.match(r"^[A-Za-z0-9_-]+$", value):
-            raise serializers.ValidationError(
-                "Employee ID can only contain letters, numbers, hyphens, and underscores."
-            )
-        return value.strip().upper()
+        return normalize_employee_id(value)
 
     def validate_full_name(self, value):
-        """Ensure full name is not empty or just whitespace"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("Full name cannot be empty.")
-        return value.strip()
+        return normalize_full_name(value)
 
     def validate_department(self, value):
-        """Ensure department is not empty"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("Department cannot be empty.")
-        return value.strip()
+        return normalize_department(value)
 
 
 class AttendanceSerializer(serializers.ModelSerializer):
@@ -57,14 +90,14 @@ class AttendanceSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "updated_at")
 
     def validate_date(self, value):
-        """Prevent marking attendance for future dates"""
+        """Prevent marking attendance for future dates and archived months"""
         from datetime import date
 
         if value > date.today():
             raise serializers.ValidationError(
                 "Cannot mark attendance for future dates."
             )
-        return value
+        return reject_archived_date(value)
 
     def validate(self, data):
         """Additional cross-field validation"""
@@ -82,3 +115,257 @@ class AttendanceSerializer(serializers.ModelSerializer):
                     )
 
         return data
+
+
+def _iso_datetime(value):
+    """Render a datetime exactly like DRF's DateTimeField"""
+    value = timezone.localtime(value).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+# Columns fetched by the flat projection, joined with Employee
+ATTENDANCE_FLAT_FIELDS = (
+    "id",
+    "employee__full_name",
+    "employee__employee_id",
+    "created_at",
+    "updated_at",
+    "date",
+    "status",
+    "employee",
+)
+
+
+def attendance_flat_rows(rows):
+    """
+    Read-only fast path equivalent to AttendanceSerializer(many=True).data.
+
+    Takes dicts from `queryset.values(*ATTENDANCE_FLAT_FIELDS)` and builds the
+    same payload without per-field DRF serialization, for large list responses.
+    """
+    for row in rows:
+        yield {
+            "id": row["id"],
+            "employee_name": row["employee__full_name"],
+            "employee_id": row["employee__employee_id"],
+            "created_at": _iso_datetime(row["created_at"]),
+            "updated_at": _iso_datetime(row["updated_at"]),
+            "date": row["date"].isoformat(),
+            "status": row["status"],
+            "employee": row["employee"],
+        }
+
+
+def archived_attendance_rows(records, employees):
+    """
+    Records read from an archived month (hrms.partitions.read_archive) in
+    the attendance_flat_rows() format. `employees` maps employee UUIDs to
+    (employee_id, full_name); employees deleted since have neither.
+    """
+    for record in records:
+        employee_id, full_name = employees.get(record["employee_id"], (None, None))
+        yield {
+            "id": record["id"],
+            "employee_name": full_name,
+            "employee_id": employee_id,
+            "created_at": _iso_datetime(record["created_at"]),
+            "updated_at": _iso_datetime(record["updated_at"]),
+            "date": record["date"].isoformat(),
+            "status": record["status"],
+            "employee": record["employee_id"],
+        }
+
+
+class BulkAttendanceSerializer(serializers.Serializer):
+    """Input for marking many employees on one date in a single request"""
+
+    date = serializers.DateField()
+    status = serializers.ChoiceField(choices=Attendance.STATUS_CHOICES)
+    # Omit to mark every employee who has no record for the date yet
+    employees = serializers.ListField(
+        child=serializers.UUIDField(), required=False, allow_empty=False
+    )
+
+    def validate_date(self, value):
+        """Prevent marking attendance for future dates and archived months"""
+        from datetime import date
+
+        if value > date.today():
+            raise serializers.ValidationError(
+                "Cannot mark attendance for future dates."
+            )
+        return reject_archived_date(value)
+
+
+class AttendanceReportQuerySerializer(serializers.Serializer):
+    """Query parameters for the attendance report"""
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    status = serializers.ChoiceField(choices=Attendance.STATUS_CHOICES, required=False)
+    department = serializers.CharField(required=False)
+
+    def validate(self, data):
+        """Ensure the date range is not inverted"""
+        start = data.get("start")
+        end = data.get("end")
+        if start and end and start > end:
+            raise serializers.ValidationError(
+                {"end": "End date must be on or after start date."}
+            )
+        return data
+
+
+class AttendanceExportQuerySerializer(AttendanceReportQuerySerializer):
+    """Query parameters for the attendance export: report filters plus file format"""
+
+    format = serializers.ChoiceField(choices=["csv", "ndjson"], default="csv")
+
+
+class AttendanceMatrixQuerySerializer(serializers.Serializer):
+    """Query parameters for the monthly attendance matrix"""
+
+    # YYYY-MM; defaults to the current month
+    month = serializers.DateField(input_formats=["%Y-%m"], required=False)
+    department = serializers.CharField(required=False)
+
+
+class AttendancePatternQuerySerializer(serializers.Serializer):
+    """Query parameters for the attendance pattern query"""
+
+    # Default to the current quarter so far
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    department = serializers.CharField(required=False)
+
+    def validate(self, data):
+        """Ensure the date range is not inverted"""
+        start = data.get("start")
+        end = data.get("end")
+        if start and end and start > end:
+            raise serializers.ValidationError(
+                {"end": "End date must be on or after start date."}
+            )
+        return data
+
+
+class AbsenceStreakQuerySerializer(AttendancePatternQuerySerializer):
+    """Query parameters for the absence streak query: pattern filters plus min_days"""
+
+    min_days = serializers.IntegerField(min_value=1, max_value=366, default=3)
+
+
+class AttendanceArchiveSerializer(serializers.ModelSerializer):
+    """An archived month of attendance"""
+
+    month = serializers.DateField(format="%Y-%m")
+
+    class Meta:
+        model = AttendanceArchive
+        fields = ["month", "rows", "size", "archived_at"]
+        read_only_fields = fields
+
+
+class AttendanceArchiveQuerySerializer(serializers.Serializer):
+    """Query parameters for reading archived attendance"""
+
+    # YYYY-MM; without it the archived months are listed
+    month = serializers.DateField(input_formats=["%Y-%m"], required=False)
+    employee = serializers.UUIDField(required=False)
+
+
+class EmployeeExportQuerySerializer(serializers.Serializer):
+    """Query parameters for the employee export"""
+
+    department = serializers.CharField(required=False)
+    format = serializers.ChoiceField(choices=["csv", "ndjson"], default="csv")
+
+
+class EmployeeSearchQuerySerializer(serializers.Serializer):
+    """Query parameters for employee search"""
+
+    q = serializers.CharField(max_length=100)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=100)
+
+
+class DailyAnalyticsQuerySerializer(serializers.Serializer):
+    """Query parameters for the daily attendance trend"""
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    department = serializers.CharField(required=False)
+    period = serializers.ChoiceField(
+        choices=["day", "week", "month"], required=False, default="day"
+    )
+
+    def validate(self, data):
+        """Default to the last 30 days and reject inverted ranges"""
+        from datetime import timedelta
+
+        end = data.setdefault("end", timezone.localtime(timezone.now()).date())
+        start = data.setdefault("start", end - timedelta(days=29))
+        if start > end:
+            raise serializers.ValidationError(
+                {"end": "End date must be on or after start date."}
+            )
+        return data
+
+
+class EmployeeImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    batch_size = serializers.IntegerField(required=False, min_value=1, max_value=5000)
+
+    def validate_file(self, value):
+        """Only CSV and XLSX sheets are accepted"""
+        extension = value.name.rsplit(".", 1)[-1].lower() if "." in value.name else ""
+        if extension not in ("csv", "xlsx"):
+            raise serializers.ValidationError("Upload a .csv or .xlsx file.")
+        value.extension = extension
+        return value
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "kind",
+            "status",
+            "params",
+            "progress_done",
+            "progress_total",
+            "result",
+            "error",
+            "worker",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+
+class JobListSerializer(JobSerializer):
+    """Job without its result, which can hold one entry per row processed"""
+
+    class Meta(JobSerializer.Meta):
+        fields = [name for name in JobSerializer.Meta.fields if name != "result"]
+        read_only_fields = fields
+
+
+class JobCreateSerializer(serializers.Serializer):
+    """Maintenance jobs that can be queued directly through /api/jobs/"""
+
+    kind = serializers.ChoiceField(choices=["rebuild_summaries", "rebuild_rollups"])
+    # rebuild_rollups only; defaults to the full attendance history
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, data):
+        """Ensure the date range is not inverted"""
+        if "start" in data and "end" in data and data["start"] > data["end"]:
+            raise serializers.ValidationError(
+                {"end": "End date must be on or after start date."}
+            )
+        return data
@@ -0,0 +1,341 @@
+import calendar
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, FilteredRelation, Q
+from . import bitmaps
+from .bulkwrite import bulk_write
+from .models import Employee, Attendance
+from .signals import attendance_bulk_written
+
+# Rows per INSERT statement; keeps parameter counts well under backend limits
+BULK_BATCH_SIZE = 1000
+
+# One character per day in attendance_matrix() rows
+MATRIX_CODES = {"PRESENT": "P", "ABSENT": "A"}
+MATRIX_UNMARKED = "-"
+MATRIX_COLUMNS = ("id", "employee_id", "full_name", "department", "days")
+
+
+def bulk_mark_attendance(date, status, employee_ids=None, batch_size=BULK_BATCH_SIZE):
+    """
+    Mark attendance for many employees on a single date.
+
+    If employee_ids is None every employee without a record for the date is
+    marked. Otherwise the given employees are validated as a set: unknown IDs
+    are reported as failed and already-marked employees are skipped.
+    Query count is constant regardless of the number of employees.
+    """
+    skipped = []
+    failed = []
+
+    with transaction.atomic():
+        if employee_ids is None:
+            # "All unmarked" - the anti-join does the duplicate check in SQL
+            targets = list(
+                Employee.objects.exclude(attendance_records__date=date).values_list(
+                    "id", flat=True
+                )
+            )
+        else:
+            # Preserve request order but drop duplicates
+            requested = list(dict.fromkeys(employee_ids))
+            existing = set(
+                Employee.objects.filter(id__in=requested).values_list("id", flat=True)
+            )
+            already_marked = set(
+                Attendance.objects.filter(
+                    date=date, employee_id__in=existing
+                ).values_list("employee_id", flat=True)
+            )
+
+            targets = []
+            for employee_id in requested:
+                if employee_id not in existing:
+                    failed.append(
+                        {"employee": employee_id, "error": "Employee not found."}
+                    )
+                elif employee_id in already_marked:
+                    skipped.append(employee_id)
+                else:
+                    targets.append(employee_id)
+
+        # The unique (employee, date) constraint still guards against
+        # concurrent writers; rows they marked first are reported skipped.
+        inserted = {
+            employee_id
+            for (employee_id,) in bulk_write(
+                Attendance,
+                ("employee_id", "date", "status"),
+                [(employee_id, date, status) for employee_id in targets],
+                unique_fields=("employee_id", "date"),
+                batch_size=batch_size,
+                returning=("employee_id",),
+            )
+        }
+        skipped += [
+            employee_id for employee_id in targets if employee_id not in inserted
+        ]
+        created = [employee_id for employee_id in targets if employee_id in inserted]
+        if created:
+            attendance_bulk_written.send(
+                sender=Attendance, date=date, status=status, employee_ids=created
+            )
+
+    return {
+        "date": date,
+        "status": status,
+        "created": created,
+        "skipped": skipped,
+        "failed": failed,
+        "summary": {
+            "created": len(created),
+            "skipped": len(skipped),
+            "failed": len(failed),
+        },
+    }
+
+
+def _today_counts():
+    return {
+        "present": Count("id", filter=Q(status="PRESENT")),
+        "absent": Count("id", filter=Q(status="ABSENT")),
+    }
+
+
+def _dashboard_payload(today, total_employees, attendance_stats):
+    return {
+        "total_employees": total_employees,
+        "today_stats": {
+            "date": today,
+            "present": attendance_stats["present"],
+            "absent": attendance_stats["absent"],
+            "unmarked": total_employees
+            - (attendance_stats["present"] + attendance_stats["absent"]),
+        },
+    }
+
+
+def dashboard_stats(today):
+    """Headcount and today's attendance breakdown"""
+    total_employees = Employee.objects.count()
+
+    # Efficiently count status for today without looping
+    attendance_stats = Attendance.objects.filter(date=today).aggregate(
+        **_today_counts()
+    )
+    return _dashboard_payload(today, total_employees, attendance_stats)
+
+
+async def adashboard_stats(today):
+    """dashboard_stats for async views"""
+    total_employees = await Employee.objects.acount()
+    attendance_stats = await Attendance.objects.filter(date=today).aaggregate(
+        **_today_counts()
+    )
+    return _dashboard_payload(today, total_employees, attendance_stats)
+
+
+def attendance_rate(present, absent):
+    """Percentage of marked days that were PRESENT"""
+    marked = present + absent
+    return round(present * 100 / marked, 2) if marked else None
+
+
+def attendance_report_summary(queryset):
+    """
+    Totals for an already-filtered attendance queryset.
+
+    One GROUP BY employee query yields per-employee present/absent counts;
+    department and overall totals are folded from those groups in Python,
+    so the cost scales with the rows in range, not with total history.
+    """
+    groups = (
+        queryset.order_by()
+        .values(
+            "employee",
+            "employee__employee_id",
+            "employee__full_name",
+            "employee__department",
+        )
+        .annotate(
+            present=Count("id", filter=Q(status="PRESENT")),
+            absent=Count("id", filter=Q(status="ABSENT")),
+        )
+        .order_by("employee__employee_id")
+    )
+
+    employees = []
+    departments = {}
+    total_present = total_absent = 0
+    for group in groups:
+        present, absent = group["present"], group["absent"]
+        total_present += present
+        total_absent += absent
+
+        department = departments.setdefault(
+            group["employee__department"], {"present": 0, "absent": 0}
+        )
+        department["present"] += present
+        department["absent"] += absent
+
+        employees.append(
+            {
+                "employee": group["employee"],
+                "employee_id": group["employee__employee_id"],
+                "employee_name": group["employee__full_name"],
+                "department": group["employee__department"],
+                "present": present,
+                "absent": absent,
+                "attendance_rate": attendance_rate(present, absent),
+            }
+        )
+
+    return {
+        "summary": {
+            "total": total_present + total_absent,
+            "present": total_present,
+            "absent": total_absent,
+            "attendance_rate": attendance_rate(total_present, total_absent),
+        },
+        "departments": [
+            {
+                "department": name,
+                "present": counts["present"],
+                "absent": counts["absent"],
+                "total": counts["present"] + counts["absent"],
+                "attendance_rate": attendance_rate(counts["present"], counts["absent"]),
+            }
+            for name, counts in sorted(departments.items())
+        ],
+        "employees": employees,
+    }
+
+
+def attendance_matrix(month, department=None):
+    """
+    Every employee's attendance for the month containing `month`, as rows
+    of MATRIX_COLUMNS values whose "days" is one MATRIX_CODES character
+    per day of the month (MATRIX_UNMARKED where nothing was recorded).
+
+    One query: employees LEFT JOIN their records in the month, so
+    employees with no records still get a row.
+    """
+    first = month.replace(day=1)
+    days = calendar.monthrange(first.year, first.month)[1]
+    last = first.replace(day=days)
+
+    employees = Employee.objects.annotate(
+        month_records=FilteredRelation(
+            "attendance_records",
+            condition=Q(attendance_records__date__range=(first, last)),
+        )
+    )
+    if department:
+        employees = employees.filter(department=department)
+    records = employees.order_by("employee_id").values_list(
+        "id",
+        "employee_id",
+        "full_name",
+        "department",
+        "month_records__date",
+        "month_records__status",
+    )
+
+    rows = []
+    row = None
+    for pk, employee_id, full_name, dept, date, status in records.iterator(
+        chunk_size=2000
+    ):
+        if row is None or row[0] != pk:
+            row = [pk, employee_id, full_name, dept, [MATRIX_UNMARKED] * days]
+            rows.append(row)
+        if date is not None:
+            row[4][date.day - 1] = MATRIX_CODES[status]
+    for row in rows:
+        row[4] = "".join(row[4])
+
+    return {
+        "month": first.strftime("%Y-%m"),
+        "days": days,
+        "codes": {
+            **{code: status for status, code in MATRIX_CODES.items()},
+            MATRIX_UNMARKED: None,
+        },
+        "columns": list(MATRIX_COLUMNS),
+        "rows": rows,
+    }
+
+
+def _range_index(records):
+    """
+    This process's bitmap index when ATTENDANCE_INDEX is on; otherwise an
+    index of `records`, built for this call
+    """
+    if settings.ATTENDANCE_INDEX:
+        return bitmaps.get_index()
+    return bitmaps.AttendanceIndex.from_database(records)
+
+
+def _employee_rows(employee_ids, department, values):
+    """
+    One row per employee in `employee_ids` (and `department`), with the
+    fields of `values(pk)` added
+    """
+    employees = Employee.objects.filter(id__in=employee_ids)
+    if department:
+        employees = employees.filter(department=department)
+    return [
+        {
+            "employee": pk,
+            "employee_id": employee_id,
+            "full_name": full_name,
+            "department": dept,
+            **values(pk),
+        }
+        for pk, employee_id, full_name, dept in employees.values_list(
+            "id", "employee_id", "full_name", "department"
+        )
+    ]
+
+
+def absence_streaks(start, end, min_days=3, department=None):
+    """
+    Employees absent `min_days` or more consecutive days within start..end,
+    longest streak first. Uses this process's bitmap index when
+    ATTENDANCE_INDEX is on; otherwise the range's absences are indexed for
+    this call.
+    """
+    index = _range_index(
+        Attendance.objects.filter(date__range=(start, end), status="ABSENT")
+    )
+    streaks = index.absence_streaks(start, end, min_days)
+    rows = _employee_rows(
+        streaks, department, lambda pk: {"longest_absence": streaks[pk]}
+    )
+    rows.sort(key=lambda row: (-row["longest_absence"], row["employee_id"]))
+    return rows
+
+
+def attendance_patterns(start, end, department=None):
+    """
+    Present and absent days, attendance rate and absences per weekday
+    (Monday first) within start..end, for each employee marked in the
+    range, by employee ID. Answered from the bitmap index like
+    absence_streaks().
+    """
+    index = _range_index(Attendance.objects.filter(date__range=(start, end)))
+    counts = index.counts(start, end)
+    weekdays = index.weekday_counts(start, end, "ABSENT")
+
+    def values(pk):
+        present, absent = counts[pk]
+        return {
+            "present_days": present,
+            "absent_days": absent,
+            "attendance_rate": attendance_rate(present, absent),
+            "absences_by_weekday": weekdays.get(pk, [0] * 7),
+        }
+
+    rows = _employee_rows(counts, department, values)
+    rows.sort(key=lambda row: row["employee_id"])
+    return rows
@@ -0,0 +1,10 @@
+from django.dispatch import Signal
+
+# Sent after bulk writes that bypass model save()/delete() (bulk_create,
+# QuerySet.update) so derived data can be refreshed.
+# Arguments: date, status, employee_ids (all newly created rows)
+attendance_bulk_written = Signal()
+
+# Sent after employees are created with bulk_create (e.g. the CSV import).
+# Arguments: employee_ids
+employees_bulk_created = Signal()
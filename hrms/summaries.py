@@ -0,0 +1,182 @@
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+from .models import (
+    Employee,
+    Attendance,
+    ArchivedAttendanceSummary,
+    EmployeeAttendanceSummary,
+)
+
+SUMMARY_FIELDS = ("present_days", "absent_days", "last_marked_date")
+
+
+def _counter_update(status, step):
+    field = "present_days" if status == "PRESENT" else "absent_days"
+    return {field: F(field) + step}
+
+
+def record_marked(employee_ids, date, status):
+    """Count newly created attendance for the given employees in one UPDATE"""
+    employee_ids = set(employee_ids)
+    updated = EmployeeAttendanceSummary.objects.filter(
+        employee_id__in=employee_ids
+    ).update(
+        # Coalesce because GREATEST is NULL on SQLite if any argument is NULL
+        last_marked_date=Greatest(
+            Coalesce("last_marked_date", Value(date)), Value(date)
+        ),
+        updated_at=timezone.now(),
+        **_counter_update(status, 1),
+    )
+    if updated < len(employee_ids):
+        # First attendance for some employees: build their rows from source
+        existing = EmployeeAttendanceSummary.objects.filter(
+            employee_id__in=employee_ids
+        ).values_list("employee_id", flat=True)
+        rebuild_summaries(employee_ids - set(existing))
+
+
+def record_status_change(employee_id, old_status, new_status):
+    """Move one day from the old status counter to the new one"""
+    updated = EmployeeAttendanceSummary.objects.filter(employee_id=employee_id).update(
+        updated_at=timezone.now(),
+        **_counter_update(old_status, -1),
+        **_counter_update(new_status, 1),
+    )
+    if not updated:
+        rebuild_summaries([employee_id])
+
+
+def _archived(employee, field, aggregate):
+    """An employee's total of `field` over archived months, or NULL"""
+    return Subquery(
+        ArchivedAttendanceSummary.objects.filter(employee=employee)
+        .order_by()
+        .values("employee")
+        .annotate(total=aggregate(field))
+        .values("total")
+    )
+
+
+def record_removed(employee_id, status):
+    """Uncount a deleted record and re-derive the last marked date"""
+    latest = Subquery(
+        Attendance.objects.filter(employee_id=OuterRef("employee_id"))
+        .order_by("-date")
+        .values("date")[:1]
+    )
+    archived = _archived(OuterRef("employee_id"), "last_marked_date", Max)
+    updated = EmployeeAttendanceSummary.objects.filter(employee_id=employee_id).update(
+        # The later of the two; NULL only if both are
+        last_marked_date=Greatest(
+            Coalesce(latest, archived), Coalesce(archived, latest)
+        ),
+        updated_at=timezone.now(),
+        **_counter_update(status, -1),
+    )
+    if not updated:
+        rebuild_summaries([employee_id])
+
+
+def compute_summaries(employee_ids):
+    """
+    Summary values for the given employees, aggregated from Attendance
+    plus the totals of archived months
+    """
+    rows = (
+        Employee.objects.filter(id__in=employee_ids)
+        .annotate(
+            present=Count(
+                "attendance_records", filter=Q(attendance_records__status="PRESENT")
+            ),
+            absent=Count(
+                "attendance_records", filter=Q(attendance_records__status="ABSENT")
+            ),
+            last_marked=Max("attendance_records__date"),
+            archived_present=_archived(OuterRef("pk"), "present_days", Sum),
+            archived_absent=_archived(OuterRef("pk"), "absent_days", Sum),
+            archived_last_marked=_archived(OuterRef("pk"), "last_marked_date", Max),
+        )
+        .values_list(
+            "id",
+            "present",
+            "absent",
+            "last_marked",
+            "archived_present",
+            "archived_absent",
+            "archived_last_marked",
+        )
+    )
+    return {
+        employee_id: (
+            present + (archived_present or 0),
+            absent + (archived_absent or 0),
+            max(filter(None, (last_marked, archived_last_marked)), default=None),
+        )
+        for (
+            employee_id,
+            present,
+            absent,
+            last_marked,
+            archived_present,
+            archived_absent,
+            archived_last_marked,
+        ) in rows
+    }
+
+
+def rebuild_summaries(employee_ids):
+    """Recompute and upsert summary rows for the given employees"""
+    EmployeeAttendanceSummary.objects.bulk_create(
+        [
+            EmployeeAttendanceSummary(
+                employee_id=employee_id,
+                present_days=present,
+                absent_days=absent,
+                last_marked_date=last_marked,
+            )
+            for employee_id, (present, absent, last_marked) in compute_summaries(
+                employee_ids
+            ).items()
+        ],
+        update_conflicts=True,
+        unique_fields=["employee"],
+        update_fields=[*SUMMARY_FIELDS, "updated_at"],
+    )
+
+
+def find_drift(employee_ids):
+    """
+    Compare stored summaries with values recomputed from Attendance and
+    archived totals.
+    Returns (employee_id, stored, expected) for every mismatch; a missing
+    row counts as zeros.
+    """
+    expected = compute_summaries(employee_ids)
+    stored = {
+        row[0]: row[1:]
+        for row in EmployeeAttendanceSummary.objects.filter(
+            employee_id__in=employee_ids
+        ).values_list("employee_id", *SUMMARY_FIELDS)
+    }
+    drift = []
+    for employee_id, values in expected.items():
+        actual = stored.get(employee_id, (0, 0, None))
+        if actual != values:
+            drift.append((employee_id, actual, values))
+    return drift
+
+
+def employee_id_chunks(chunk_size):
+    """Yield lists of employee IDs in primary-key order, one chunk at a time"""
+    last = None
+    while True:
+        queryset = Employee.objects.order_by("id").values_list("id", flat=True)
+        if last is not None:
+            queryset = queryset.filter(id__gt=last)
+        chunk = list(queryset[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1]
@@ -1,9 +1,55 @@
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
 from django.urls import reverse
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
-from .models import Employee, Attendance
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Sum
+from django.utils import timezone
+from . import (
+    async_views,
+    bitmaps,
+    bulkwrite,
+    imports,
+    jobs,
+    middleware,
+    partitions,
+    renderers,
+    search,
+)
+from .models import (
+    Employee,
+    Attendance,
+    EmployeeAttendanceSummary,
+    DailyAttendanceRollup,
+    Job,
+    AttendanceArchive,
+    ArchivedAttendanceSummary,
+    ArchivedDailyRollup,
+)
+from .metrics import registry
+from .querycheck import NPlusOneError, QueryDetector, fingerprint
+from .renderers import FastJSONRenderer
+from .seeding import seed_attendance, seed_employees
+from .services import bulk_mark_attendance
+from .summaries import find_drift
+from .views import AttendanceViewSet
 import datetime
+import gzip
+import json
+import os
+import tempfile
+import uuid
+from decimal import Decimal
+from io import StringIO
+from unittest import mock, skipUnless
 
 User = get_user_model()
 
@@ -12,6 +58,7 @@ class HRMSTests(APITestCase):
     def setUp(self):
         # No authentication required per assignment specification
         # "Assume a single admin user (no authentication required)"
+        cache.clear()
 
         # Setup Data
         self.employee = Employee.objects.create(
@@ -206,7 +253,7 @@ class HRMSTests(APITestCase):
         url = reverse("employee-list")
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
 
     def test_delete_employee(self):
         """Test deleting an employee"""
@@ -223,4 +270,1886 @@ class HRMSTests(APITestCase):
         url = reverse("attendance-list")
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
+
+
+class BulkAttendanceTests(APITestCase):
+    def setUp(self):
+        self.employees = [
+            Employee.objects.create(
+                employee_id=f"EMP-{i:03d}",
+                full_name=f"Employee {i}",
+                email=f"emp{i}@example.com",
+                department="IT",
+            )
+            for i in range(1, 4)
+        ]
+        self.url = reverse("attendance-bulk")
+        self.today = datetime.date.today()
+
+    def test_bulk_marks_all_unmarked(self):
+        """Omitting employees marks everyone without a record for the date"""
+        Attendance.objects.create(
+            employee=self.employees[0], date=self.today, status="ABSENT"
+        )
+        data = {"date": self.today, "status": "PRESENT"}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["summary"]["created"], 2)
+        self.assertEqual(Attendance.objects.filter(status="PRESENT").count(), 2)
+        # Existing record is left untouched
+        self.assertEqual(
+            Attendance.objects.get(employee=self.employees[0]).status, "ABSENT"
+        )
+
+    def test_bulk_reports_skipped_and_failed(self):
+        """Already-marked employees are skipped and unknown IDs fail"""
+        Attendance.objects.create(
+            employee=self.employees[0], date=self.today, status="PRESENT"
+        )
+        missing = "00000000-0000-0000-0000-000000000000"
+        data = {
+            "date": self.today,
+            "status": "ABSENT",
+            "employees": [self.employees[0].id, self.employees[1].id, missing],
+        }
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], [self.employees[1].id])
+        self.assertEqual(response.data["skipped"], [self.employees[0].id])
+        self.assertEqual(str(response.data["failed"][0]["employee"]), missing)
+
+    def test_bulk_query_count_is_constant(self):
+        """Marking many employees must not issue per-employee queries"""
+        for i in range(4, 54):
+            Employee.objects.create(
+                employee_id=f"EMP-{i:03d}",
+                full_name=f"Employee {i}",
+                email=f"emp{i}@example.com",
+                department="HR",
+            )
+        data = {
+            "date": self.today,
+            "status": "PRESENT",
+            "employees": list(Employee.objects.values_list("id", flat=True)),
+        }
+        # Employee lookup, existing-record lookup, conflicting-key lookup,
+        # INSERT, summary counter UPDATE plus first-time summary rebuild (3),
+        # rollup department counts, rollup UPDATE plus first-time rollup
+        # rebuild (4), savepoint pair
+        with self.assertNumQueries(16):
+            response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.data["summary"]["created"], 53)
+
+    def test_bulk_reports_rows_lost_to_concurrent_writer(self):
+        """Rows another writer inserted first are skipped, not counted"""
+        from . import services
+
+        def concurrent_write(*args, **kwargs):
+            Attendance.objects.bulk_create(
+                [
+                    Attendance(
+                        employee=self.employees[0], date=self.today, status="ABSENT"
+                    )
+                ]
+            )
+            return bulkwrite.bulk_write(*args, **kwargs)
+
+        data = {"date": self.today, "status": "PRESENT"}
+        with mock.patch.object(services, "bulk_write", side_effect=concurrent_write):
+            response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.data["summary"]["created"], 2)
+        self.assertEqual(response.data["skipped"], [self.employees[0].id])
+        self.assertFalse(
+            EmployeeAttendanceSummary.objects.filter(
+                employee=self.employees[0], present_days__gt=0
+            ).exists()
+        )
+
+    def test_bulk_future_date_rejected(self):
+        """Bulk marking follows the same no-future-dates rule"""
+        data = {
+            "date": self.today + datetime.timedelta(days=1),
+            "status": "PRESENT",
+        }
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("date", response.data)
+
+
+class PaginationTests(APITestCase):
+    def setUp(self):
+        self.employees = [
+            Employee.objects.create(
+                employee_id=f"EMP-{i:03d}",
+                full_name=f"Employee {i}",
+                email=f"emp{i}@example.com",
+                department="IT",
+            )
+            for i in range(5)
+        ]
+        today = datetime.date.today()
+        for day in range(3):
+            for employee in self.employees:
+                Attendance.objects.create(
+                    employee=employee,
+                    date=today - datetime.timedelta(days=day),
+                    status="PRESENT",
+                )
+
+    def _collect_pages(self, url, params):
+        """Follow next links and return all rows"""
+        rows = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), params["page_size"])
+            rows.extend(response.data["results"])
+            if not response.data["next"]:
+                return rows
+            response = self.client.get(response.data["next"])
+
+    def test_attendance_pages_cover_all_rows_in_order(self):
+        """Paging by (date, id) returns every row exactly once, newest first"""
+        rows = self._collect_pages(reverse("attendance-list"), {"page_size": 4})
+        self.assertEqual(len(rows), 15)
+        self.assertEqual(len({row["id"] for row in rows}), 15)
+        keys = [(row["date"], row["id"]) for row in rows]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+
+    def test_employee_pages_cover_all_rows(self):
+        """Paging by (created_at, id) returns every employee exactly once"""
+        rows = self._collect_pages(reverse("employee-list"), {"page_size": 2})
+        self.assertEqual(
+            {row["id"] for row in rows}, {str(e.id) for e in self.employees}
+        )
+
+    def test_invalid_cursor_rejected(self):
+        response = self.client.get(reverse("attendance-list"), {"cursor": "garbage"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_stream_ndjson(self):
+        """Streaming mode returns one JSON object per line, unpaginated"""
+        response = self.client.get(
+            reverse("attendance-list"), {"stream": "ndjson", "page_size": 2}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 15)
+        self.assertEqual(
+            json.loads(lines[0])["date"], datetime.date.today().isoformat()
+        )
+
+    def test_stream_json_array(self):
+        response = self.client.get(reverse("employee-list"), {"stream": "json"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(rows), 5)
+
+    def test_stream_unknown_format_rejected(self):
+        response = self.client.get(reverse("employee-list"), {"stream": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AttendanceQueryCountTests(APITestCase):
+    """Attendance reads must cost a constant number of queries (no N+1)"""
+
+    SIZES = (1, 100, 10_000)
+
+    def _seed(self, count):
+        employees = Employee.objects.bulk_create(
+            [
+                Employee(
+                    employee_id=f"EMP-{i:05d}",
+                    full_name=f"Employee {i}",
+                    email=f"emp{i}@example.com",
+                    department="IT",
+                )
+                for i in range(count)
+            ]
+        )
+        Attendance.objects.bulk_create(
+            [
+                Attendance(employee=e, date=datetime.date.today(), status="PRESENT")
+                for e in employees
+            ]
+        )
+
+    def test_list_query_count_is_constant(self):
+        for size in self.SIZES:
+            with self.subTest(size=size):
+                Employee.objects.all().delete()
+                self._seed(size)
+                # The page itself plus the ETag validator keys
+                with self.assertNumQueries(2):
+                    response = self.client.get(
+                        reverse("attendance-list"), {"page_size": 1000}
+                    )
+                self.assertEqual(len(response.data["results"]), min(size, 1000))
+
+    def test_stream_is_single_query(self):
+        for size in self.SIZES:
+            with self.subTest(size=size):
+                Employee.objects.all().delete()
+                self._seed(size)
+                with self.assertNumQueries(1):
+                    response = self.client.get(
+                        reverse("attendance-list"), {"stream": "ndjson"}
+                    )
+                    lines = b"".join(response.streaming_content).splitlines()
+                self.assertEqual(len(lines), size)
+
+    def test_retrieve_query_count(self):
+        self._seed(1)
+        record = Attendance.objects.get()
+        # Validator keys, then the joined row
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("attendance-detail", kwargs={"pk": record.pk})
+            )
+        self.assertEqual(response.data["employee_id"], "EMP-00000")
+
+    def test_flat_rows_match_serializer(self):
+        """The .values() fast path returns the same payload as the serializer"""
+        self._seed(3)
+        url = reverse("attendance-list")
+        serialized = self.client.get(url).json()
+        with self.assertNumQueries(2):
+            flat = self.client.get(url, {"flat": "true"}).json()
+        self.assertEqual(flat, serialized)
+
+        streamed = self.client.get(url, {"flat": "true", "stream": "json"})
+        self.assertEqual(
+            json.loads(b"".join(streamed.streaming_content)), serialized["results"]
+        )
+
+
+class AttendanceReportTests(APITestCase):
+    def setUp(self):
+        self.it = Employee.objects.create(
+            employee_id="EMP-001",
+            full_name="John Doe",
+            email="john@example.com",
+            department="IT",
+        )
+        self.hr = Employee.objects.create(
+            employee_id="EMP-002",
+            full_name="Jane Doe",
+            email="jane@example.com",
+            department="HR",
+        )
+        self.today = datetime.date.today()
+        for day in range(4):
+            date = self.today - datetime.timedelta(days=day)
+            Attendance.objects.create(employee=self.it, date=date, status="PRESENT")
+            Attendance.objects.create(
+                employee=self.hr, date=date, status="ABSENT" if day % 2 else "PRESENT"
+            )
+        self.url = reverse("attendance-report")
+
+    def test_report_filters_by_range_in_sql(self):
+        """Only rows inside the requested range are returned and counted"""
+        start = self.today - datetime.timedelta(days=1)
+        response = self.client.get(self.url, {"start": start, "end": self.today})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 4)
+        self.assertEqual(
+            response.data["summary"],
+            {"total": 4, "present": 3, "absent": 1, "attendance_rate": 75.0},
+        )
+
+    def test_report_breakdowns(self):
+        response = self.client.get(self.url)
+        departments = {d["department"]: d for d in response.data["departments"]}
+        self.assertEqual(departments["IT"]["attendance_rate"], 100.0)
+        self.assertEqual(departments["HR"]["absent"], 2)
+        employees = {e["employee_id"]: e for e in response.data["employees"]}
+        self.assertEqual(employees["EMP-002"]["attendance_rate"], 50.0)
+
+    def test_report_department_and_status_filters(self):
+        response = self.client.get(self.url, {"department": "HR", "status": "ABSENT"})
+        self.assertEqual(response.data["summary"]["total"], 2)
+        self.assertTrue(
+            all(r["employee_id"] == "EMP-002" for r in response.data["results"])
+        )
+
+    def test_report_query_count(self):
+        """One page query plus one grouped aggregate, regardless of history"""
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    def test_report_rejects_inverted_range(self):
+        response = self.client.get(
+            self.url,
+            {"start": self.today, "end": self.today - datetime.timedelta(days=1)},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("end", response.data)
+
+
+class DashboardCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.employee = Employee.objects.create(
+            employee_id="EMP-001",
+            full_name="John Doe",
+            email="john@example.com",
+            department="IT",
+        )
+        self.url = reverse("dashboard-stats")
+
+    def test_warm_dashboard_costs_no_queries(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data["total_employees"], 1)
+
+    def test_attendance_write_invalidates(self):
+        self.client.get(self.url)
+        Attendance.objects.create(
+            employee=self.employee, date=datetime.date.today(), status="PRESENT"
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["today_stats"]["present"], 1)
+        self.assertEqual(response.data["today_stats"]["unmarked"], 0)
+
+    def test_bulk_write_invalidates(self):
+        self.client.get(self.url)
+        self.client.post(
+            reverse("attendance-bulk"),
+            {"date": datetime.date.today(), "status": "ABSENT"},
+            format="json",
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["today_stats"]["absent"], 1)
+
+    def test_employee_delete_invalidates(self):
+        self.client.get(self.url)
+        self.employee.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["total_employees"], 0)
+
+    def test_conditional_get_returns_304(self):
+        first = self.client.get(self.url)
+        self.assertIn("no-cache", first["Cache-Control"])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # A write changes the stats, so the old ETag no longer matches
+        Attendance.objects.create(
+            employee=self.employee, date=datetime.date.today(), status="PRESENT"
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class AttendanceSummaryTests(APITestCase):
+    def setUp(self):
+        self.employee = Employee.objects.create(
+            employee_id="EMP-001",
+            full_name="John Doe",
+            email="john@example.com",
+            department="IT",
+        )
+        self.today = datetime.date.today()
+        self.yesterday = self.today - datetime.timedelta(days=1)
+
+    def summary(self):
+        return EmployeeAttendanceSummary.objects.get(employee=self.employee)
+
+    def test_counters_follow_create_update_delete(self):
+        Attendance.objects.create(
+            employee=self.employee, date=self.yesterday, status="PRESENT"
+        )
+        record = Attendance.objects.create(
+            employee=self.employee, date=self.today, status="PRESENT"
+        )
+        summary = self.summary()
+        self.assertEqual((summary.present_days, summary.absent_days), (2, 0))
+        self.assertEqual(summary.last_marked_date, self.today)
+
+        url = reverse("attendance-detail", kwargs={"pk": record.pk})
+        self.client.patch(url, {"status": "ABSENT"}, format="json")
+        summary = self.summary()
+        self.assertEqual((summary.present_days, summary.absent_days), (1, 1))
+
+        self.client.delete(url)
+        summary = self.summary()
+        self.assertEqual((summary.present_days, summary.absent_days), (1, 0))
+        self.assertEqual(summary.last_marked_date, self.yesterday)
+
+    def test_bulk_write_updates_counters(self):
+        self.client.post(
+            reverse("attendance-bulk"),
+            {"date": self.today, "status": "ABSENT"},
+            format="json",
+        )
+        self.assertEqual(self.summary().absent_days, 1)
+
+    def test_employee_list_reads_summary_without_aggregating(self):
+        Attendance.objects.create(
+            employee=self.employee, date=self.today, status="PRESENT"
+        )
+        # Page query plus the ETag validator keys
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("employee-list"))
+        self.assertEqual(response.data["results"][0]["total_present_days"], 1)
+
+    def test_rebuild_command_repairs_drift(self):
+        Attendance.objects.create(
+            employee=self.employee, date=self.today, status="PRESENT"
+        )
+        # QuerySet.update bypasses signals and leaves the counters stale
+        Attendance.objects.update(status="ABSENT")
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_attendance_summary", "--check", stdout=StringIO())
+
+        call_command("rebuild_attendance_summary", stdout=StringIO())
+        summary = self.summary()
+        self.assertEqual((summary.present_days, summary.absent_days), (0, 1))
+        call_command("rebuild_attendance_summary", "--check", stdout=StringIO())
+
+
+class AnalyticsRollupTests(APITestCase):
+    def setUp(self):
+        self.engineer = Employee.objects.create(
+            employee_id="E1",
+            full_name="Eng One",
+            email="e1@example.com",
+            department="IT",
+        )
+        self.recruiter = Employee.objects.create(
+            employee_id="H1",
+            full_name="Hr One",
+            email="h1@example.com",
+            department="HR",
+        )
+        self.today = datetime.date.today()
+        self.yesterday = self.today - datetime.timedelta(days=1)
+        self.url = reverse("analytics-daily")
+
+    def rollup(self, date, department):
+        row = DailyAttendanceRollup.objects.get(date=date, department=department)
+        return (row.present, row.absent, row.headcount)
+
+    def test_rollup_follows_create_update_delete(self):
+        record = Attendance.objects.create(
+            employee=self.engineer, date=self.today, status="PRESENT"
+        )
+        self.assertEqual(self.rollup(self.today, "IT"), (1, 0, 1))
+
+        url = reverse("attendance-detail", kwargs={"pk": record.pk})
+        self.client.patch(url, {"status": "ABSENT"}, format="json")
+        self.assertEqual(self.rollup(self.today, "IT"), (0, 1, 1))
+
+        self.client.delete(url)
+        self.assertEqual(self.rollup(self.today, "IT"), (0, 0, 1))
+
+    def test_bulk_write_updates_each_department(self):
+        self.client.post(
+            reverse("attendance-bulk"),
+            {"date": self.yesterday, "status": "PRESENT"},
+            format="json",
+        )
+        self.assertEqual(self.rollup(self.yesterday, "IT"), (1, 0, 1))
+        self.assertEqual(self.rollup(self.yesterday, "HR"), (1, 0, 1))
+
+    def test_employee_delete_removes_counts(self):
+        Attendance.objects.create(
+            employee=self.engineer, date=self.yesterday, status="ABSENT"
+        )
+        self.engineer.delete()
+        self.assertEqual(self.rollup(self.yesterday, "IT"), (0, 0, 0))
+
+    def test_daily_and_monthly_trend(self):
+        for employee in (self.engineer, self.recruiter):
+            Attendance.objects.create(
+                employee=employee, date=self.yesterday, status="PRESENT"
+            )
+        Attendance.objects.create(
+            employee=self.engineer, date=self.today, status="ABSENT"
+        )
+        params = {"start": self.yesterday, "end": self.today, "department": "IT"}
+
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(row["present"], row["absent"]) for row in response.data["results"]],
+            [(1, 0), (0, 1)],
+        )
+        self.assertEqual(response.data["results"][0]["attendance_rate"], 100.0)
+
+        response = self.client.get(self.url, {**params, "period": "month"})
+        totals = (
+            sum(row["present"] for row in response.data["results"]),
+            sum(row["absent"] for row in response.data["results"]),
+        )
+        self.assertEqual(totals, (1, 1))
+
+    def test_invalid_range_rejected(self):
+        response = self.client.get(
+            self.url, {"start": self.today, "end": self.yesterday}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_backfill_repairs_rollups(self):
+        Attendance.objects.create(
+            employee=self.engineer, date=self.today, status="PRESENT"
+        )
+        # QuerySet.update bypasses signals and leaves the rollup stale
+        Attendance.objects.update(status="ABSENT")
+        call_command(
+            "backfill_attendance_rollups",
+            "--start",
+            str(self.today),
+            "--end",
+            str(self.today),
+            stdout=StringIO(),
+        )
+        self.assertEqual(self.rollup(self.today, "IT"), (0, 1, 1))
+
+
+class EmployeeImportTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("employee-import-file")
+        Employee.objects.create(
+            employee_id="EMP-001",
+            full_name="Existing",
+            email="existing@example.com",
+            department="IT",
+        )
+
+    def upload(self, content, name="employees.csv", **data):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        data["file"] = SimpleUploadedFile(name, content.encode())
+        return self.client.post(self.url, data, format="multipart")
+
+    def test_import_creates_valid_rows_and_reports_errors(self):
+        content = (
+            "Employee_ID,Full_Name,Email,Department\n"
+            "emp-002, Jane Doe ,Jane@Example.com,HR\n"
+            "EMP 003,Bad Id,bad@example.com,HR\n"
+            "EMP-004,No Email,not-an-email,HR\n"
+            "EMP-001,Taken Id,new@example.com,HR\n"
+            "EMP-005,Duplicate Email,jane@example.com,HR\n"
+            "\n"
+            "EMP-006,John Roe,john@example.com,Sales\n"
+        )
+        response = self.upload(content)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(
+            [(e["row"], sorted(e["errors"])) for e in response.data["errors"]],
+            [
+                (3, ["employee_id"]),
+                (4, ["email"]),
+                (5, ["employee_id"]),
+                (6, ["email"]),
+            ],
+        )
+
+        # Same normalization as EmployeeSerializer
+        jane = Employee.objects.get(employee_id="EMP-002")
+        self.assertEqual((jane.full_name, jane.email), ("Jane Doe", "jane@example.com"))
+        self.assertTrue(Employee.objects.filter(employee_id="EMP-006").exists())
+
+    def test_query_count_is_per_chunk(self):
+        rows = "".join(f"E{i},Employee {i},e{i}@example.com,IT\n" for i in range(10))
+        content = "employee_id,full_name,email,department\n" + rows
+        # Per chunk of 5: duplicate lookup, INSERT, headcount refresh,
+        # savepoint pair
+        with self.assertNumQueries(10):
+            response = self.upload(content, batch_size=5)
+        self.assertEqual(response.data["created"], 10)
+
+    def test_rows_taken_during_import_reported(self):
+        content = (
+            "employee_id,full_name,email,department\n"
+            "E1,Employee 1,e1@example.com,IT\n"
+            "E2,Employee 2,e2@example.com,IT\n"
+        )
+        taken = imports._taken
+
+        def check_then_insert(candidates):
+            errors = taken(candidates)
+            # Another request creates E2 between the check and the insert
+            if not Employee.objects.filter(employee_id="E2").exists():
+                Employee.objects.create(
+                    employee_id="E2",
+                    full_name="Other",
+                    email="other@example.com",
+                    department="HR",
+                )
+            return errors
+
+        with mock.patch.object(imports, "_taken", side_effect=check_then_insert):
+            response = self.upload(content)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(
+            response.data["errors"],
+            [
+                {
+                    "row": 3,
+                    "errors": {
+                        "employee_id": [
+                            "employee with this employee id already exists."
+                        ]
+                    },
+                }
+            ],
+        )
+        self.assertTrue(Employee.objects.filter(employee_id="E1").exists())
+
+    def test_missing_column_rejected(self):
+        response = self.upload("employee_id,full_name,email\nE1,A,a@example.com\n")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("department", response.data["file"][0])
+
+    def test_unsupported_extension_rejected(self):
+        response = self.upload("employee_id", name="employees.txt")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ExportTests(APITestCase):
+    def setUp(self):
+        self.today = datetime.date.today()
+        self.yesterday = self.today - datetime.timedelta(days=1)
+        for i, department in enumerate(["IT", "HR"]):
+            employee = Employee.objects.create(
+                employee_id=f"EMP-00{i}",
+                full_name=f"Employee {i}",
+                email=f"e{i}@example.com",
+                department=department,
+            )
+            for date in (self.yesterday, self.today):
+                Attendance.objects.create(
+                    employee=employee, date=date, status="PRESENT"
+                )
+        self.url = reverse("attendance-export")
+
+    def content(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_export_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"start": self.today})
+            lines = self.content(response).splitlines()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        self.assertIn("attachment", response["Content-Disposition"])
+        self.assertEqual(
+            lines[0], "id,date,employee_id,employee_name,department,status"
+        )
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].split(",")[1] == str(self.today))
+
+    def test_ndjson_export_with_department(self):
+        response = self.client.get(self.url, {"format": "ndjson", "department": "HR"})
+        rows = [json.loads(line) for line in self.content(response).splitlines()]
+        self.assertEqual(
+            [row["date"] for row in rows], [str(self.yesterday), str(self.today)]
+        )
+        self.assertEqual({row["employee_id"] for row in rows}, {"EMP-001"})
+
+    def test_unknown_format_rejected(self):
+        response = self.client.get(self.url, {"format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("format", response.data)
+
+    def test_employee_export(self):
+        response = self.client.get(reverse("employee-export"))
+        lines = self.content(response).splitlines()
+        self.assertEqual(lines[0], "id,employee_id,full_name,email,department")
+        self.assertEqual(
+            [line.split(",")[1] for line in lines[1:]], ["EMP-000", "EMP-001"]
+        )
+
+
+class AsyncViewTests(APITestCase):
+    """The async views served in ASGI mode match their sync counterparts"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        today = datetime.date.today()
+        for i in range(3):
+            employee = Employee.objects.create(
+                employee_id=f"EMP-00{i}",
+                full_name=f"Employee {i}",
+                email=f"e{i}@example.com",
+                department="IT",
+            )
+            Attendance.objects.create(employee=employee, date=today, status="PRESENT")
+
+    def call(self, view, path, params=None, **headers):
+        request = self.factory.get(path, params or {}, **headers)
+        return async_to_sync(view)(request)
+
+    def test_list_matches_sync_pages(self):
+        for view, name in (
+            (async_views.employee_list, "employee-list"),
+            (async_views.attendance_list, "attendance-list"),
+        ):
+            url = reverse(name)
+            params = {"page_size": 2}
+            expected = self.client.get(url, params).json()
+            response = self.call(view, url, params)
+            self.assertEqual(json.loads(response.content), expected)
+
+            # Following the cursor reaches the same last page
+            params["cursor"] = expected["next"].split("cursor=")[1]
+            expected = self.client.get(url, params).json()
+            response = self.call(view, url, params)
+            self.assertEqual(json.loads(response.content), expected)
+
+    def test_flat_attendance(self):
+        url = reverse("attendance-list")
+        expected = self.client.get(url, {"flat": "true"}).json()
+        response = self.call(async_views.attendance_list, url, {"flat": "true"})
+        self.assertEqual(json.loads(response.content), expected)
+
+    def test_invalid_cursor_is_404(self):
+        response = self.call(
+            async_views.employee_list, reverse("employee-list"), {"cursor": "bad"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_create_is_handled_by_sync_viewset(self):
+        request = self.factory.post(
+            reverse("employee-list"),
+            {
+                "employee_id": "EMP-100",
+                "full_name": "New Hire",
+                "email": "new@example.com",
+                "department": "HR",
+            },
+            content_type="application/json",
+        )
+        response = async_to_sync(async_views.employee_list)(request)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Employee.objects.filter(employee_id="EMP-100").exists())
+
+    def test_dashboard_and_conditional_get(self):
+        url = reverse("dashboard-stats")
+        response = self.call(async_views.dashboard_stats, url)
+        self.assertEqual(json.loads(response.content), self.client.get(url).json())
+        response = self.call(
+            async_views.dashboard_stats, url, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_health_check(self):
+        response = self.call(async_views.health_check, reverse("health-check"))
+        self.assertEqual(json.loads(response.content)["status"], "healthy")
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.employee = Employee.objects.create(
+            employee_id="EMP-001",
+            full_name="John Doe",
+            email="john@example.com",
+            department="IT",
+        )
+        self.record = Attendance.objects.create(
+            employee=self.employee, date=datetime.date.today(), status="PRESENT"
+        )
+
+    def revalidate(self, url, response, params=None):
+        return self.client.get(url, params, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_unchanged_list_is_not_modified(self):
+        url = reverse("attendance-list")
+        response = self.client.get(url, {"date": self.record.date})
+        self.assertIn("Last-Modified", response)
+        self.assertIn("must-revalidate", response["Cache-Control"])
+
+        # One query for the page keys and no serialization
+        with self.assertNumQueries(1):
+            cached = self.revalidate(url, response, {"date": self.record.date})
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached["ETag"], response["ETag"])
+
+    def test_writes_change_the_etag(self):
+        url = reverse("attendance-list")
+        response = self.client.get(url)
+
+        # Employee rename shows up in attendance rows
+        self.client.patch(
+            reverse("employee-detail", kwargs={"pk": self.employee.pk}),
+            {"full_name": "John Q. Doe"},
+            format="json",
+        )
+        changed = self.revalidate(url, response)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data["results"][0]["employee_name"], "John Q. Doe")
+
+        self.client.delete(reverse("attendance-detail", kwargs={"pk": self.record.pk}))
+        self.assertEqual(self.revalidate(url, changed).status_code, status.HTTP_200_OK)
+
+    def test_list_validators_read_only_the_page(self):
+        older = Attendance.objects.create(
+            employee=self.employee,
+            date=self.record.date - datetime.timedelta(days=1),
+            status="PRESENT",
+        )
+        url = reverse("attendance-list")
+        params = {"page_size": 1}
+        response = self.client.get(url, params)
+
+        # Rows beyond the page (and its one look-ahead row) are not read
+        Attendance.objects.create(
+            employee=self.employee,
+            date=self.record.date - datetime.timedelta(days=2),
+            status="ABSENT",
+        )
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.revalidate(url, response, params)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertIn("LIMIT 2", queries[0]["sql"])
+
+        # The look-ahead row decides the next link
+        older.delete()
+        self.assertEqual(
+            self.revalidate(url, response, params).status_code, status.HTTP_200_OK
+        )
+
+    def test_attendance_changes_employee_list_etag(self):
+        """total_present_days comes from the summary, which has its own timestamp"""
+        url = reverse("employee-list")
+        response = self.client.get(url)
+        self.client.patch(
+            reverse("attendance-detail", kwargs={"pk": self.record.pk}),
+            {"status": "ABSENT"},
+            format="json",
+        )
+        changed = self.revalidate(url, response)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data["results"][0]["total_present_days"], 0)
+
+    def test_detail_is_not_modified(self):
+        url = reverse("employee-detail", kwargs={"pk": self.employee.pk})
+        response = self.client.get(url)
+        with self.assertNumQueries(1):
+            cached = self.revalidate(url, response)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # A different query string is a different representation
+        other = self.revalidate(url, response, {"format": "json"})
+        self.assertEqual(other.status_code, status.HTTP_200_OK)
+
+    def test_missing_detail_is_404(self):
+        for pk in ("00000000-0000-0000-0000-000000000000", "not-a-uuid"):
+            url = reverse("employee-detail", kwargs={"pk": pk})
+            self.assertEqual(
+                self.client.get(url).status_code, status.HTTP_404_NOT_FOUND
+            )
+
+    def test_async_list_shares_validators(self):
+        url = reverse("employee-list")
+        response = self.client.get(url)
+        request = RequestFactory().get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        cached = async_to_sync(async_views.employee_list)(request)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class CompressionTests(APITestCase):
+    def setUp(self):
+        employee_ids = seed_employees(30, prefix="ZIP")
+        seed_attendance(employee_ids, 1)
+
+    def test_large_list_is_gzipped(self):
+        plain = self.client.get(reverse("attendance-list"))
+        response = self.client.get(
+            reverse("attendance-list"), HTTP_ACCEPT_ENCODING="gzip, deflate"
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertLess(len(response.content), len(plain.content) / 3)
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+    def test_stream_is_gzipped(self):
+        params = {"stream": "ndjson"}
+        plain = b"".join(
+            self.client.get(reverse("attendance-list"), params).streaming_content
+        )
+        response = self.client.get(
+            reverse("attendance-list"), params, HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), plain)
+
+    def test_small_or_refused_responses_are_not_compressed(self):
+        response = self.client.get(
+            reverse("dashboard-stats"), HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+        response = self.client.get(
+            reverse("attendance-list"), HTTP_ACCEPT_ENCODING="gzip;q=0, identity"
+        )
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @skipUnless(middleware.brotli, "brotli is not installed")
+    def test_brotli_preferred(self):
+        response = self.client.get(
+            reverse("attendance-list"), HTTP_ACCEPT_ENCODING="gzip, br"
+        )
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(
+            middleware.brotli.decompress(response.content),
+            self.client.get(reverse("attendance-list")).content,
+        )
+
+
+class FastJSONTests(APITestCase):
+    payload = {
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "date": datetime.date(2024, 1, 31),
+        "created_at": datetime.datetime(
+            2024, 1, 31, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc
+        ),
+        "rate": Decimal("97.50"),
+        "name": "Zoë ",
+        "nested": [{"present": 1}, None, True],
+    }
+
+    def test_output_matches_drf_renderer(self):
+        expected = JSONRenderer().render(self.payload)
+        self.assertEqual(FastJSONRenderer().render(self.payload), expected)
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(FastJSONRenderer().render(self.payload), expected)
+
+    def test_indent_falls_back_to_stdlib(self):
+        rendered = FastJSONRenderer().render(
+            {"a": 1}, accepted_media_type="application/json; indent=4"
+        )
+        self.assertEqual(rendered, b'{\n    "a": 1\n}')
+
+    def test_parser_rejects_invalid_json(self):
+        response = self.client.post(
+            reverse("employee-list"), "{not json", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("JSON parse error", response.data["detail"])
+
+
+class PerformanceMetricsTests(APITestCase):
+    def setUp(self):
+        registry.reset()
+        employee_ids = seed_employees(3, prefix="PERF")
+        seed_attendance(employee_ids, 1)
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse("attendance-list"))
+        timings = response["Server-Timing"]
+        self.assertRegex(
+            timings, r"^app;dur=[\d.]+, db;dur=[\d.]+;desc=\"\d+ queries\"$"
+        )
+
+    def test_requests_are_aggregated_per_route(self):
+        self.client.get(reverse("attendance-list"))
+        self.client.get(reverse("attendance-list"))
+        self.client.get(reverse("employee-list"))
+        self.client.get("/no-such-page/")
+
+        body = self.client.get(reverse("metrics")).content.decode()
+        self.assertIn(
+            'hrms_http_requests_total{route="attendance-list",method="GET",'
+            'status="200"} 2',
+            body,
+        )
+        self.assertIn(
+            'hrms_http_requests_total{route="unmatched",method="GET",status="404"} 1',
+            body,
+        )
+        self.assertIn(
+            'hrms_db_queries_per_request_count{route="employee-list"} 1', body
+        )
+        self.assertIn(
+            'hrms_http_request_duration_seconds_bucket{route="attendance-list",'
+            'le="+Inf"} 2',
+            body,
+        )
+        self.assertRegex(
+            body, r'hrms_http_response_bytes_total\{route="employee-list"\} [1-9]'
+        )
+
+    def test_stream_recorded_after_last_chunk(self):
+        response = self.client.get(reverse("attendance-list"), {"stream": "ndjson"})
+        self.assertFalse(response.has_header("Server-Timing"))
+        self.assertNotIn('route="attendance-list"', registry.render())
+
+        size = len(b"".join(response.streaming_content))
+        self.assertIn(
+            f'hrms_http_response_bytes_total{{route="attendance-list"}} {size}',
+            registry.render(),
+        )
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_token(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+        response = self.client.get(
+            reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret"
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class QueryDetectorTests(APITestCase):
+    def setUp(self):
+        employee_ids = seed_employees(8, prefix="NPO")
+        seed_attendance(employee_ids, 1)
+
+    def test_fingerprint_collapses_literals(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s) AND n = 42"),
+            fingerprint("SELECT * FROM t WHERE id IN (%s) AND n = 7"),
+        )
+
+    def test_missing_select_related_fails_request(self):
+        """The test runner runs in "raise" mode, so N+1s fail tests"""
+        with mock.patch.object(AttendanceViewSet, "queryset", Attendance.objects.all()):
+            with self.assertRaises(NPlusOneError) as raised:
+                self.client.get(reverse("attendance-list"))
+        message = str(raised.exception)
+        self.assertIn("[attendance-list]", message)
+        self.assertIn("field AttendanceSerializer.employee_name", message)
+        self.assertIn('FROM "hrms_employee"', message)
+
+    @override_settings(QUERY_DETECTOR="log")
+    def test_log_mode_warns(self):
+        with mock.patch.object(AttendanceViewSet, "queryset", Attendance.objects.all()):
+            with self.assertLogs("hrms.querycheck", "WARNING") as logs:
+                response = self.client.get(reverse("attendance-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("N+1: 8 x", logs.output[0])
+
+    @override_settings(QUERY_DETECTOR_SLOW_MS=-1)
+    def test_slow_queries_are_logged_not_raised(self):
+        with self.assertLogs("hrms.querycheck", "WARNING") as logs:
+            response = self.client.get(reverse("employee-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("Slow query:", logs.output[0])
+
+    def test_detector_context_manager(self):
+        with QueryDetector(repeat_limit=2) as detector:
+            for record in Attendance.objects.all():
+                record.employee.full_name
+        [problem] = detector.problems()
+        self.assertRegex(problem, r"^N\+1: 8 x SELECT .* \(hrms/tests.py:\d+\)$")
+
+
+class SeedCommandTests(APITestCase):
+    def _seed(self, **options):
+        call_command("seed_hrms", stdout=StringIO(), **options)
+        return list(
+            Attendance.objects.order_by("employee__employee_id", "date").values_list(
+                "employee_id", "date", "status"
+            )
+        )
+
+    def test_seeds_employees_attendance_and_derived_tables(self):
+        rows = self._seed(employees=12, days=5, absence_rate=0.3, seed=7)
+        self.assertEqual(Employee.objects.count(), 12)
+        self.assertEqual(len(rows), 60)
+        self.assertEqual(
+            {date for _, date, _ in rows},
+            {
+                timezone.localdate() - datetime.timedelta(days=offset)
+                for offset in range(5)
+            },
+        )
+        self.assertEqual(find_drift(Employee.objects.values_list("id", flat=True)), [])
+        totals = DailyAttendanceRollup.objects.aggregate(
+            present=Sum("present"), absent=Sum("absent")
+        )
+        self.assertEqual(totals["present"] + totals["absent"], 60)
+        self.assertEqual(
+            totals["absent"], sum(status == "ABSENT" for *_, status in rows)
+        )
+
+    def test_same_seed_same_data(self):
+        first = self._seed(employees=5, days=3, absence_rate=0.5, seed=1)
+        Employee.objects.all().delete()
+        self.assertEqual(
+            self._seed(employees=5, days=3, absence_rate=0.5, seed=1), first
+        )
+
+    def test_existing_prefix_is_rejected(self):
+        self._seed(employees=1, days=1)
+        with self.assertRaises(CommandError):
+            self._seed(employees=1, days=1)
+        self._seed(employees=1, days=1, prefix="OTHER")
+        self.assertEqual(Employee.objects.count(), 2)
+
+
+class BulkWriteTests(APITestCase):
+    fields = ("employee_id", "date", "status")
+
+    def setUp(self):
+        self.employee_ids = seed_employees(3, prefix="COPY")
+        self.today = datetime.date(2024, 1, 31)
+
+    def test_fallback_skips_or_updates_conflicts(self):
+        rows = [
+            (employee_id, self.today, "PRESENT") for employee_id in self.employee_ids
+        ]
+        bulkwrite.bulk_write(Attendance, self.fields, rows[:2])
+        original = Attendance.objects.get(employee_id=rows[0][0])
+
+        absent = [(employee_id, date, "ABSENT") for employee_id, date, _ in rows]
+        bulkwrite.bulk_write(
+            Attendance, self.fields, absent, unique_fields=("employee_id", "date")
+        )
+        self.assertEqual(
+            dict(Attendance.objects.values_list("employee_id", "status")),
+            dict(zip(self.employee_ids, ["PRESENT", "PRESENT", "ABSENT"])),
+        )
+
+        bulkwrite.bulk_write(
+            Attendance,
+            self.fields,
+            absent,
+            unique_fields=("employee_id", "date"),
+            update_fields=("status",),
+        )
+        updated = Attendance.objects.get(pk=original.pk)
+        self.assertEqual(updated.status, "ABSENT")
+        self.assertEqual(updated.created_at, original.created_at)
+        self.assertGreater(updated.updated_at, original.updated_at)
+
+        # Of rows with the same key, the last one sent is written (as on COPY)
+        bulkwrite.bulk_write(
+            Attendance,
+            self.fields,
+            [absent[0], rows[0]],
+            unique_fields=("employee_id", "date"),
+            update_fields=("status",),
+        )
+        self.assertEqual(Attendance.objects.get(pk=original.pk).status, "PRESENT")
+
+    def test_fallback_returns_inserted_rows(self):
+        Attendance.objects.create(
+            employee_id=self.employee_ids[0], date=self.today, status="ABSENT"
+        )
+        rows = [
+            (employee_id, self.today, "PRESENT") for employee_id in self.employee_ids
+        ]
+        inserted = bulkwrite.bulk_write(
+            Attendance,
+            self.fields,
+            rows + rows[1:2],
+            unique_fields=("employee_id", "date"),
+            returning=("employee_id",),
+        )
+        self.assertEqual(
+            inserted, [(employee_id,) for employee_id in self.employee_ids[1:]]
+        )
+        self.assertEqual(Attendance.objects.count(), 3)
+
+    @override_settings(DB_COPY_MIN_ROWS=1)
+    def test_copy_statements(self):
+        fake = mock.MagicMock()
+        fake.ops.quote_name = lambda name: f'"{name}"'
+        cursor = fake.cursor.return_value.__enter__.return_value
+        rows = [(self.employee_ids[0], self.today, "PRESENT")]
+        with mock.patch.object(
+            bulkwrite, "connections", {"default": fake}
+        ), mock.patch.object(bulkwrite, "copy_enabled", return_value=True):
+            bulkwrite.bulk_write(
+                Attendance,
+                self.fields,
+                rows,
+                unique_fields=("employee_id", "date"),
+                update_fields=("status",),
+            )
+
+        create, sequence, insert, drop = [
+            call.args[0] for call in cursor.execute.call_args_list
+        ]
+        columns = '"employee_id", "date", "status", "created_at", "updated_at"'
+        self.assertIn(
+            f'AS SELECT {columns} FROM "hrms_attendance" WITH NO DATA', create
+        )
+        self.assertIn('ADD COLUMN "hrms_copy_seq"', sequence)
+        # Of rows with the same key, the last one sent is written
+        self.assertRegex(
+            insert,
+            rf'^INSERT INTO "hrms_attendance" \({columns}\) SELECT DISTINCT ON '
+            r'\("employee_id", "date"\) .* ORDER BY "employee_id", "date", '
+            r'"hrms_copy_seq" DESC ON CONFLICT \("employee_id", "date"\) '
+            r'DO UPDATE SET "status" = EXCLUDED."status", '
+            r'"updated_at" = EXCLUDED."updated_at"$',
+        )
+        self.assertTrue(drop.startswith("DROP TABLE"))
+        copy_sql, data = cursor.cursor.copy_expert.call_args.args
+        self.assertTrue(copy_sql.startswith("COPY "))
+        self.assertTrue(
+            data.getvalue().startswith(f"{self.employee_ids[0]}\t2024-01-31\tPRESENT\t")
+        )
+
+    def test_copy_text_escaping(self):
+        self.assertEqual(
+            bulkwrite.copy_text([("a\tb", None, "back\\slash\nline", 3)]),
+            "a\\tb\t\\N\tback\\\\slash\\nline\t3\n",
+        )
+
+
+class JobTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.employees = [
+            Employee.objects.create(
+                employee_id=f"EMP-{i:03d}",
+                full_name=f"Employee {i}",
+                email=f"emp{i}@example.com",
+                department="IT",
+            )
+            for i in range(1, 4)
+        ]
+        self.today = datetime.date.today()
+
+    def run_worker(self):
+        call_command("run_hrms_worker", once=True, stdout=StringIO())
+
+    def poll(self, response):
+        return self.client.get(response["Location"])
+
+    def test_background_bulk_mark_reports_progress_and_result(self):
+        unknown = uuid.uuid4()
+        data = {
+            "date": self.today,
+            "status": "PRESENT",
+            "employees": [str(e.id) for e in self.employees] + [str(unknown)],
+        }
+        response = self.client.post(
+            reverse("attendance-bulk") + "?background=true", data, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], Job.QUEUED)
+        self.assertFalse(Attendance.objects.exists())
+
+        self.run_worker()
+        job = self.poll(response).data
+        self.assertEqual(job["status"], Job.SUCCEEDED)
+        self.assertEqual((job["progress_done"], job["progress_total"]), (4, 4))
+        # Same result as the synchronous endpoint
+        self.assertEqual(
+            job["result"]["summary"], {"created": 3, "skipped": 0, "failed": 1}
+        )
+        self.assertEqual(job["result"]["failed"][0]["employee"], str(unknown))
+        self.assertEqual(Attendance.objects.filter(date=self.today).count(), 3)
+        self.assertEqual(
+            EmployeeAttendanceSummary.objects.filter(present_days=1).count(), 3
+        )
+
+    def test_background_import(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        content = "employee_id,full_name,email,department\n" + "".join(
+            f"NEW-{i},New {i},new{i}@example.com,HR\n" for i in range(5)
+        )
+        response = self.client.post(
+            reverse("employee-import-file") + "?background=true",
+            {"file": SimpleUploadedFile("new.csv", content.encode()), "batch_size": 2},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.run_worker()
+
+        job = self.poll(response).data
+        self.assertEqual(job["status"], Job.SUCCEEDED)
+        self.assertEqual(job["result"], {"created": 5, "failed": 0, "errors": []})
+        self.assertEqual(job["progress_done"], 5)
+        self.assertEqual(Employee.objects.filter(department="HR").count(), 5)
+        # The upload is dropped once the job has finished
+        self.assertIsNone(Job.objects.get(id=job["id"]).payload)
+
+    def test_failure_is_recorded(self):
+        job = jobs.enqueue(
+            "import_employees", {"extension": "csv"}, payload=b"employee_id\nE1\n"
+        )
+        with self.assertLogs("hrms.jobs", "ERROR"):
+            self.run_worker()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertIn("Missing column(s)", job.error)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_queue_rebuild_and_list_jobs(self):
+        Attendance.objects.create(
+            employee=self.employees[0], date=self.today, status="PRESENT"
+        )
+        DailyAttendanceRollup.objects.all().delete()
+        response = self.client.post(
+            reverse("job-list"), {"kind": "rebuild_rollups"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.run_worker()
+
+        rollup = DailyAttendanceRollup.objects.get(date=self.today)
+        self.assertEqual((rollup.present, rollup.headcount), (1, 3))
+        listed = self.client.get(reverse("job-list"), {"status": Job.SUCCEEDED})
+        self.assertEqual(
+            [job["kind"] for job in listed.data["results"]], ["rebuild_rollups"]
+        )
+        self.assertNotIn("result", listed.data["results"][0])
+        self.assertEqual(self.poll(response).data["result"]["rows"], 1)
+
+        response = self.client.post(
+            reverse("job-list"), {"kind": "bulk_mark"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_claim_is_exclusive_and_stale_jobs_fail(self):
+        job = jobs.enqueue("rebuild_summaries")
+        self.assertEqual(jobs.claim_next("a").id, job.id)
+        self.assertIsNone(jobs.claim_next("b"))
+
+        Job.objects.filter(id=job.id).update(
+            heartbeat_at=timezone.now() - datetime.timedelta(hours=1)
+        )
+        with override_settings(JOB_STALE_SECONDS=60):
+            self.assertEqual(jobs.fail_stale(), 1)
+        self.assertEqual(Job.objects.get(id=job.id).status, Job.FAILED)
+        with override_settings(JOB_RETENTION_DAYS=0):
+            self.assertEqual(jobs.prune_finished(), 1)
+
+    def test_heartbeat_does_not_wait_for_progress(self):
+        job = jobs.enqueue("rebuild_summaries")
+        jobs.claim_next("a")
+        stale = timezone.now() - datetime.timedelta(hours=1)
+        Job.objects.filter(id=job.id).update(heartbeat_at=stale)
+
+        # Two beats, then the job finishes
+        stop = mock.Mock(wait=mock.Mock(side_effect=[False, False, True]))
+        jobs.heartbeat(job.id, stop, interval=30)
+        stop.wait.assert_called_with(30)
+        self.assertGreater(Job.objects.get(id=job.id).heartbeat_at, stale)
+        with override_settings(JOB_STALE_SECONDS=60):
+            self.assertEqual(jobs.fail_stale(), 0)
+
+
+class EmployeeSearchTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("employee-search")
+        for employee_id, name, email in [
+            ("ENG-001", "Jane Doe", "jane.doe@example.com"),
+            ("ENG-002", "Janet Smith", "janet@example.com"),
+            ("OPS-010", "John Roe", "jroe@corp.example"),
+            ("ENG-0010", "Mary Jane Watson", "mary@example.com"),
+        ]:
+            Employee.objects.create(
+                employee_id=employee_id, full_name=name, email=email, department="IT"
+            )
+
+    def search(self, q, **params):
+        response = self.client.get(self.url, {"q": q, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [employee["employee_id"] for employee in response.data["results"]]
+
+    def test_matches_name_email_and_id_prefix(self):
+        self.assertEqual(set(self.search("jane")), {"ENG-001", "ENG-002", "ENG-0010"})
+        self.assertEqual(self.search("jroe"), ["OPS-010"])
+        self.assertEqual(self.search("ops-01"), ["OPS-010"])
+        self.assertEqual(self.search("nobody"), [])
+
+    def test_exact_employee_id_ranks_first_and_limit_applies(self):
+        self.assertEqual(self.search("ENG-001")[0], "ENG-001")
+        self.assertEqual(len(self.search("eng", limit=2)), 2)
+        response = self.client.get(self.url, {"q": "jane"})
+        self.assertIn("total_present_days", response.data["results"][0])
+
+    def test_index_follows_updates_and_deletes(self):
+        employee = Employee.objects.get(employee_id="OPS-010")
+        employee.full_name = "Johnny Walker"
+        employee.save()
+        self.assertEqual(self.search("walker"), ["OPS-010"])
+        self.assertEqual(self.search("roe john"), [])
+        employee.delete()
+        self.assertEqual(self.search("walker"), [])
+
+    @skipUnless(connection.vendor == "sqlite", "rowids are SQLite's")
+    def test_index_survives_rowid_renumbering(self):
+        # As VACUUM may do to a table without an INTEGER PRIMARY KEY
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE hrms_employee SET rowid = -rowid WHERE employee_id = %s",
+                ["ENG-001"],
+            )
+            cursor.execute(
+                "UPDATE hrms_employee SET rowid = -rowid - 1000 "
+                "WHERE employee_id = %s",
+                ["OPS-010"],
+            )
+        self.assertEqual(self.search("jroe"), ["OPS-010"])
+        self.assertEqual(set(self.search("doe")), {"ENG-001"})
+
+    def test_query_is_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_fallback_without_index(self):
+        with mock.patch.object(search, "search_backend", return_value="contains"):
+            self.assertEqual(
+                set(self.search("ane")), {"ENG-001", "ENG-002", "ENG-0010"}
+            )
+
+    def test_admin_uses_search(self):
+        from django.contrib.admin.sites import site
+
+        model_admin = site._registry[Employee]
+        queryset, duplicates = model_admin.get_search_results(
+            None, Employee.objects.all(), "janet"
+        )
+        self.assertEqual([e.employee_id for e in queryset], ["ENG-002"])
+        self.assertFalse(duplicates)
+
+
+class AttendanceMatrixTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("attendance-matrix")
+        self.it = Employee.objects.create(
+            employee_id="EMP-001",
+            full_name="John Doe",
+            email="john@example.com",
+            department="IT",
+        )
+        self.hr = Employee.objects.create(
+            employee_id="EMP-002",
+            full_name="Jane Doe",
+            email="jane@example.com",
+            department="HR",
+        )
+        for day, record_status in [(1, "PRESENT"), (3, "ABSENT"), (30, "PRESENT")]:
+            Attendance.objects.create(
+                employee=self.it,
+                date=datetime.date(2026, 9, day),
+                status=record_status,
+            )
+        # Outside the month
+        Attendance.objects.create(
+            employee=self.it, date=datetime.date(2026, 10, 1), status="ABSENT"
+        )
+
+    def test_one_row_per_employee_with_day_codes(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"month": "2026-09"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["month"], "2026-09")
+        self.assertEqual(response.data["days"], 30)
+        self.assertEqual(
+            response.data["columns"],
+            ["id", "employee_id", "full_name", "department", "days"],
+        )
+        self.assertEqual(
+            response.data["rows"],
+            [
+                [self.it.id, "EMP-001", "John Doe", "IT", "P-A" + "-" * 26 + "P"],
+                [self.hr.id, "EMP-002", "Jane Doe", "HR", "-" * 30],
+            ],
+        )
+        self.assertEqual(response.data["codes"]["A"], "ABSENT")
+
+    def test_department_filter_and_month_length(self):
+        response = self.client.get(self.url, {"month": "2028-02", "department": "HR"})
+        self.assertEqual(response.data["days"], 29)
+        self.assertEqual([row[1] for row in response.data["rows"]], ["EMP-002"])
+
+    def test_defaults_to_current_month(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["month"], timezone.localdate().strftime("%Y-%m"))
+
+    def test_rejects_invalid_month(self):
+        response = self.client.get(self.url, {"month": "2026-13"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("month", response.data)
+
+
+@override_settings(ATTENDANCE_INDEX=True, ATTENDANCE_INDEX_SNAPSHOT="")
+class AttendanceIndexTests(APITestCase):
+    def setUp(self):
+        bitmaps.reset()
+        self.addCleanup(bitmaps.reset)
+        self.url = reverse("attendance-streaks")
+        self.it = Employee.objects.create(
+            employee_id="EMP-001",
+            full_name="John Doe",
+            email="john@example.com",
+            department="IT",
+        )
+        self.hr = Employee.objects.create(
+            employee_id="EMP-002",
+            full_name="Jane Doe",
+            email="jane@example.com",
+            department="HR",
+        )
+        # IT: absent 30 Dec - 2 Jan (across the year boundary) and 4 - 5 Jan
+        # HR: absent 3 Jan only
+        for day in range(30, 37):
+            date = datetime.date(2025, 12, 1) + datetime.timedelta(days=day - 1)
+            Attendance.objects.create(
+                employee=self.it,
+                date=date,
+                status="PRESENT" if date.day == 3 else "ABSENT",
+            )
+            Attendance.objects.create(
+                employee=self.hr,
+                date=date,
+                status="ABSENT" if date.day == 3 else "PRESENT",
+            )
+
+    def test_queries(self):
+        index = bitmaps.get_index()
+        start, end = datetime.date(2025, 12, 29), datetime.date(2026, 1, 31)
+        self.assertEqual(index.absence_streaks(start, end, 3), {self.it.id: 4})
+        self.assertEqual(
+            index.absence_streaks(datetime.date(2026, 1, 1), end, 1),
+            {self.it.id: 2, self.hr.id: 1},
+        )
+        self.assertEqual(
+            index.counts(start, end), {self.it.id: (1, 6), self.hr.id: (6, 1)}
+        )
+        # 3 January 2026 is a Saturday
+        self.assertEqual(
+            index.weekday_counts(datetime.date(2026, 1, 1), end)[self.hr.id],
+            [0, 0, 0, 0, 0, 1, 0],
+        )
+
+    def test_streak_endpoint(self):
+        params = {"start": "2025-12-01", "end": "2026-01-31"}
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [
+                (r["employee_id"], r["longest_absence"])
+                for r in response.data["results"]
+            ],
+            [("EMP-001", 4)],
+        )
+        response = self.client.get(
+            self.url, {**params, "min_days": 1, "department": "HR"}
+        )
+        self.assertEqual(response.data["results"][0]["employee_id"], "EMP-002")
+        with override_settings(ATTENDANCE_INDEX=False):
+            response = self.client.get(self.url, params)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_pattern_endpoint(self):
+        url = reverse("attendance-patterns")
+        params = {"start": "2025-12-29", "end": "2026-01-31"}
+        expected = [
+            ("EMP-001", 1, 6, 14.29, [1, 1, 1, 1, 1, 0, 1]),
+            ("EMP-002", 6, 1, 85.71, [0, 0, 0, 0, 0, 1, 0]),
+        ]
+        for enabled in (True, False):
+            with override_settings(ATTENDANCE_INDEX=enabled):
+                response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                [
+                    (
+                        r["employee_id"],
+                        r["present_days"],
+                        r["absent_days"],
+                        r["attendance_rate"],
+                        r["absences_by_weekday"],
+                    )
+                    for r in response.data["results"]
+                ],
+                expected,
+            )
+        response = self.client.get(url, {**params, "department": "HR"})
+        self.assertEqual(
+            [r["employee_id"] for r in response.data["results"]], ["EMP-002"]
+        )
+
+    def test_writes_apply_on_commit(self):
+        index = bitmaps.get_index()
+        start, end = datetime.date(2026, 1, 1), datetime.date(2026, 1, 31)
+        record = Attendance.objects.get(
+            employee=self.hr, date=datetime.date(2026, 1, 3)
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            record.status = "PRESENT"
+            record.save()
+        self.assertNotIn(self.hr.id, index.absence_streaks(start, end))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_mark_attendance(datetime.date(2026, 1, 6), "ABSENT", [self.it.id])
+        self.assertEqual(index.absence_streaks(start, end, 1)[self.it.id], 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Attendance.objects.get(
+                employee=self.it, date=datetime.date(2026, 1, 5)
+            ).delete()
+        self.assertEqual(index.absence_streaks(start, end, 1)[self.it.id], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.it.delete()
+        self.assertNotIn(self.it.id, index.counts(start, end))
+        self.assertIs(bitmaps.get_index(), index)
+
+    def test_snapshot_round_trip_and_catch_up(self):
+        index = bitmaps.get_index()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "attendance.idx")
+            index.save(path)
+            loaded = bitmaps.AttendanceIndex.from_snapshot(path)
+            start, end = datetime.date(2025, 1, 1), datetime.date(2026, 12, 31)
+            self.assertEqual(loaded.counts(start, end), index.counts(start, end))
+
+            Attendance.objects.create(
+                employee=self.hr, date=datetime.date(2026, 1, 9), status="ABSENT"
+            )
+            bitmaps.reset()
+            with override_settings(ATTENDANCE_INDEX_SNAPSHOT=path):
+                with self.assertNumQueries(1):
+                    caught_up = bitmaps.get_index()
+            self.assertEqual(caught_up.counts(start, end)[self.hr.id], (6, 2))
+
+            with open(path, "wb") as f:
+                f.write(b"not a snapshot")
+            bitmaps.reset()
+            with override_settings(ATTENDANCE_INDEX_SNAPSHOT=path), self.assertLogs(
+                "hrms.bitmaps", "WARNING"
+            ):
+                fresh = bitmaps.get_index()
+            self.assertEqual(fresh.counts(start, end)[self.hr.id], (6, 2))
+
+    def test_refreshes_in_background_when_expired(self):
+        index = bitmaps.get_index()
+        with override_settings(ATTENDANCE_INDEX_MAX_AGE=-1), mock.patch.object(
+            bitmaps, "_refresh_in_background"
+        ) as refresh_in_background:
+            self.assertIs(bitmaps.get_index(), index)
+            refresh_in_background.assert_called_once()
+            bitmaps.refresh()
+        self.assertIsNot(bitmaps.get_index(), index)
+
+    def test_refresh_replays_changes_committed_while_loading(self):
+        bitmaps.get_index().expire()
+        date = datetime.date(2026, 1, 3)
+        load = bitmaps._load
+
+        def load_while_record_deleted():
+            fresh = load()
+            bitmaps._apply(lambda index: index.unmark(self.hr.id, date))
+            return fresh
+
+        with mock.patch.object(bitmaps, "_load", load_while_record_deleted):
+            bitmaps.refresh()
+        counts = bitmaps.get_index().counts(date, date)
+        self.assertNotIn(self.hr.id, counts)
+
+
+class AttendanceArchiveTests(APITestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(ATTENDANCE_ARCHIVE_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.url = reverse("attendance-archive")
+        self.employee = Employee.objects.create(
+            employee_id="EMP-001",
+            full_name="John Doe",
+            email="john@example.com",
+            department="IT",
+        )
+        self.departed = uuid.uuid4()
+        month = datetime.date(2024, 1, 1)
+        # Same format as the COPY ... (FORMAT csv, HEADER) partitions.py runs
+        lines = [",".join(partitions.ARCHIVE_COLUMNS)]
+        for pk, employee, day, record_status in [
+            (1, self.employee.id, 2, "PRESENT"),
+            (2, self.departed, 2, "ABSENT"),
+            (3, self.employee.id, 3, "ABSENT"),
+        ]:
+            lines.append(
+                f"{pk},{employee},2024-01-0{day},{record_status},"
+                f"2024-01-0{day} 09:00:00.5+00,2024-01-0{day} 09:00:00.5+00"
+            )
+        file = partitions.archive_file_name(month)
+        with gzip.open(os.path.join(directory.name, file), "wt") as f:
+            f.write("\n".join(lines) + "\n")
+        AttendanceArchive.objects.create(
+            month=month, file=file, rows=3, size=0, sha256=""
+        )
+
+    def test_lists_archived_months(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["month"], "2024-01")
+        self.assertEqual(response.data[0]["rows"], 3)
+
+    def test_reads_archived_month_as_list_rows(self):
+        response = self.client.get(self.url, {"month": "2024-01"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = json.loads(b"".join(response.streaming_content))
+        self.assertEqual([row["id"] for row in rows], [1, 2, 3])
+        self.assertEqual(
+            rows[0],
+            {
+                "id": 1,
+                "employee_name": "John Doe",
+                "employee_id": "EMP-001",
+                "created_at": "2024-01-02T14:30:00.500000+05:30",
+                "updated_at": "2024-01-02T14:30:00.500000+05:30",
+                "date": "2024-01-02",
+                "status": "PRESENT",
+                "employee": str(self.employee.id),
+            },
+        )
+        # Records of employees deleted since keep their UUID only
+        self.assertIsNone(rows[1]["employee_id"])
+
+        response = self.client.get(
+            self.url, {"month": "2024-01", "employee": self.employee.id}
+        )
+        rows = json.loads(b"".join(response.streaming_content))
+        self.assertEqual([row["id"] for row in rows], [1, 3])
+
+    def test_rebuilds_count_archived_totals(self):
+        archive = AttendanceArchive.objects.get()
+        # As recorded by partitions.archive_month()
+        ArchivedAttendanceSummary.objects.create(
+            archive=archive,
+            employee=self.employee,
+            present_days=1,
+            absent_days=1,
+            last_marked_date=datetime.date(2024, 1, 3),
+        )
+        ArchivedDailyRollup.objects.create(
+            archive=archive, date=datetime.date(2024, 1, 2), department="IT", present=1
+        )
+        record = Attendance.objects.create(
+            employee=self.employee, date=datetime.date(2024, 2, 1), status="PRESENT"
+        )
+        summary = EmployeeAttendanceSummary.objects.get(employee=self.employee)
+        self.assertEqual(
+            (summary.present_days, summary.absent_days, summary.last_marked_date),
+            (2, 1, datetime.date(2024, 2, 1)),
+        )
+        call_command("rebuild_attendance_summary", "--check", stdout=StringIO())
+
+        DailyAttendanceRollup.objects.all().delete()
+        call_command("backfill_attendance_rollups", stdout=StringIO())
+        self.assertEqual(
+            list(DailyAttendanceRollup.objects.values_list("date", "present")),
+            [(datetime.date(2024, 1, 2), 1), (datetime.date(2024, 2, 1), 1)],
+        )
+
+        record.delete()
+        summary.refresh_from_db()
+        self.assertEqual(
+            (summary.present_days, summary.last_marked_date),
+            (1, datetime.date(2024, 1, 3)),
+        )
+        call_command("rebuild_attendance_summary", "--check", stdout=StringIO())
+
+    def test_rejects_writes_for_archived_month(self):
+        for url, data in [
+            (
+                reverse("attendance-list"),
+                {"employee": self.employee.id, "date": "2024-01-05"},
+            ),
+            (reverse("attendance-bulk"), {"date": "2024-01-05"}),
+        ]:
+            response = self.client.post(url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(
+                response.data["date"], ["Attendance for 2024-01 is archived."]
+            )
+        self.assertFalse(Attendance.objects.exists())
+        self.assertFalse(partitions.is_archived(datetime.date(2024, 2, 5)))
+
+    def test_month_not_archived(self):
+        response = self.client.get(self.url, {"month": "2024-02"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_month_helpers(self):
+        self.assertEqual(
+            partitions.add_months(datetime.date(2024, 11, 1), 3),
+            datetime.date(2025, 2, 1),
+        )
+        self.assertEqual(
+            partitions.add_months(datetime.date(2024, 1, 1), -1),
+            datetime.date(2023, 12, 1),
+        )
+        self.assertEqual(
+            partitions.partition_name(datetime.date(2024, 3, 1)),
+            "hrms_attendance_y2024m03",
+        )
+
+    @skipUnless(connection.vendor != "postgresql", "Attendance is partitioned")
+    def test_commands_without_partitioning(self):
+        out = StringIO()
+        call_command("attendance_partitions", "create", stdout=out)
+        self.assertIn("not partitioned", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("attendance_partitions", "archive", stdout=StringIO())
+
+
+@skipUnless(connection.vendor == "postgresql", "partitioning needs PostgreSQL")
+class AttendancePartitionTests(APITestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(ATTENDANCE_ARCHIVE_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.employee = Employee.objects.create(
+            employee_id="EMP-001",
+            full_name="John Doe",
+            email="john@example.com",
+            department="IT",
+        )
+
+    def test_migration_partitions_attendance(self):
+        self.assertTrue(partitions.is_partitioned())
+        names = [p.name for p in partitions.partitions()]
+        current = partitions.month_start(timezone.localdate())
+        self.assertIn(partitions.partition_name(current), names)
+        self.assertIn(partitions.DEFAULT_PARTITION, names)
+        self.assertEqual(partitions.ensure_partitions(), [])
+
+    def test_archive_and_restore_month(self):
+        month = partitions.add_months(partitions.month_start(timezone.localdate()), -30)
+        for day in (1, 2):
+            Attendance.objects.create(
+                employee=self.employee, date=month.replace(day=day), status="PRESENT"
+            )
+        # Stored in the default partition until the month gets one
+        partitions.create_partition(month)
+        archive = partitions.archive_month(month)
+        self.assertEqual(archive.rows, 2)
+        self.assertFalse(Attendance.objects.filter(employee=self.employee).exists())
+        self.assertEqual(len(list(partitions.read_archive(archive))), 2)
+        # Sealed: nothing can slip into the default partition meanwhile
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Attendance.objects.create(
+                employee=self.employee, date=month.replace(day=3), status="PRESENT"
+            )
+
+        self.assertEqual(partitions.restore_month(month), 2)
+        self.assertEqual(Attendance.objects.filter(employee=self.employee).count(), 2)
+        self.assertFalse(AttendanceArchive.objects.exists())
+        Attendance.objects.create(
+            employee=self.employee, date=month.replace(day=3), status="PRESENT"
+        )
+
+    def test_archive_refuses_current_month(self):
+        with self.assertRaises(ValueError):
+            partitions.archive_month(timezone.localdate())
@@ -1,31 +1,212 @@
-from rest_framework import viewsets, permissions
+from rest_framework import mixins, viewsets, permissions, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.reverse import reverse
+from django.conf import settings
+from django.db.models.functions import Coalesce
+from django.http import HttpResponse, HttpResponseForbidden, StreamingHttpResponse
 from django.utils import timezone
-from django.db.models import Count, Q
-from .models import Employee, Attendance
-from .serializers import EmployeeSerializer, AttendanceSerializer
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.crypto import constant_time_compare
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+from .cache import get_dashboard_entry
+from .conditional import ConditionalGetMixin
+from .jobs import enqueue
+from .models import Employee, Attendance, AttendanceArchive, Job
+from .serializers import (
+    EmployeeSerializer,
+    EmployeeImportSerializer,
+    AttendanceSerializer,
+    BulkAttendanceSerializer,
+    AttendanceReportQuerySerializer,
+    AttendanceExportQuerySerializer,
+    AttendanceMatrixQuerySerializer,
+    AbsenceStreakQuerySerializer,
+    AttendancePatternQuerySerializer,
+    AttendanceArchiveSerializer,
+    AttendanceArchiveQuerySerializer,
+    EmployeeExportQuerySerializer,
+    EmployeeSearchQuerySerializer,
+    DailyAnalyticsQuerySerializer,
+    JobSerializer,
+    JobListSerializer,
+    JobCreateSerializer,
+    ATTENDANCE_FLAT_FIELDS,
+    archived_attendance_rows,
+    attendance_flat_rows,
+)
+from .metrics import registry
+from .partitions import read_archive
+from .imports import IMPORT_BATCH_SIZE, READERS, ImportFormatError, import_employees
+from .rollups import daily_trend
+from .search import SEARCH_LIMIT, search_employees
+from .pagination import EmployeePagination, AttendancePagination, JobPagination
+from .services import (
+    absence_streaks,
+    attendance_matrix,
+    attendance_patterns,
+    attendance_rate,
+    attendance_report_summary,
+    bulk_mark_attendance,
+)
+from .streaming import (
+    ExportContentNegotiation,
+    StreamingListMixin,
+    export_response,
+    stream_json_array,
+)
 
+# Export columns -> lookups; attendance rows are joined with Employee
+EMPLOYEE_EXPORT_FIELDS = {
+    "id": "id",
+    "employee_id": "employee_id",
+    "full_name": "full_name",
+    "email": "email",
+    "department": "department",
+}
+ATTENDANCE_EXPORT_FIELDS = {
+    "id": "id",
+    "date": "date",
+    "employee_id": "employee__employee_id",
+    "employee_name": "employee__full_name",
+    "department": "employee__department",
+    "status": "status",
+}
 
-class EmployeeViewSet(viewsets.ModelViewSet):
+
+def run_in_background(request):
+    """`?background=true`: queue the work as a job instead of doing it inline"""
+    return request.query_params.get("background", "").lower() in ("1", "true")
+
+
+def job_accepted(request, job):
+    """202 for a queued job, pointing at the URL to poll for its progress"""
+    return Response(
+        JobSerializer(job).data,
+        status=status.HTTP_202_ACCEPTED,
+        headers={"Location": reverse("job-detail", args=[job.id], request=request)},
+    )
+
+
+class ListRowsMixin:
+    """List queryset and payload hooks, shared with the async list views"""
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_list_queryset())
+        return self.get_paginated_response(self.get_list_data(page))
+
+    def get_list_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    def get_list_data(self, page):
+        return self.get_serializer(page, many=True).data
+
+
+class EmployeeViewSet(
+    ConditionalGetMixin, StreamingListMixin, ListRowsMixin, viewsets.ModelViewSet
+):
     queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
+    pagination_class = EmployeePagination
+    # total_present_days is read from the summary row
+    validator_timestamps = ("updated_at", "attendance_summary__updated_at")
     # Assignment specifies: "Assume a single admin user (no authentication required)"
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        """Annotate employees with total present days count"""
+        """Annotate employees with total present days from the maintained summary"""
         return Employee.objects.annotate(
-            total_present_days=Count(
-                "attendance_records", filter=Q(attendance_records__status="PRESENT")
+            total_present_days=Coalesce("attendance_summary__present_days", 0)
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        serializer_class=EmployeeImportSerializer,
+        parser_classes=[MultiPartParser],
+    )
+    def import_file(self, request):
+        """
+        Create employees from an uploaded CSV or XLSX sheet with the columns
+        employee_id, full_name, email and department.
+        Valid rows are created; the response lists errors per row number.
+        With `?background=true` the file is imported by a job worker and
+        the response is the queued job.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["file"]
+        if run_in_background(request):
+            params = {"extension": upload.extension}
+            if "batch_size" in serializer.validated_data:
+                params["batch_size"] = serializer.validated_data["batch_size"]
+            job = enqueue("import_employees", params, payload=upload.read())
+            return job_accepted(request, job)
+        rows = READERS[upload.extension](upload)
+        try:
+            result = import_employees(
+                rows,
+                batch_size=serializer.validated_data.get(
+                    "batch_size", IMPORT_BATCH_SIZE
+                ),
             )
-        ).all()
+        except ImportFormatError as exc:
+            raise ValidationError({"file": [str(exc)]})
+        response_status = (
+            status.HTTP_201_CREATED if result["created"] else status.HTTP_200_OK
+        )
+        return Response(result, status=response_status)
 
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        """
+        Employees matching `q` by employee ID prefix, name or email, best
+        match first, at most `limit` (default 20) of them.
+        """
+        params = EmployeeSearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        employees = search_employees(
+            params.validated_data["q"],
+            limit=params.validated_data.get("limit", SEARCH_LIMIT),
+            queryset=self.get_queryset(),
+        )
+        return Response({"results": self.get_serializer(employees, many=True).data})
 
-class AttendanceViewSet(viewsets.ModelViewSet):
-    queryset = Attendance.objects.all()
+    @action(
+        detail=False,
+        methods=["get"],
+        content_negotiation_class=ExportContentNegotiation,
+    )
+    def export(self, request):
+        """Download all employees as CSV or NDJSON (`?format=csv|ndjson`)"""
+        params = EmployeeExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = Employee.objects.order_by("employee_id")
+        if "department" in params.validated_data:
+            queryset = queryset.filter(department=params.validated_data["department"])
+        return export_response(
+            queryset,
+            EMPLOYEE_EXPORT_FIELDS,
+            params.validated_data["format"],
+            filename="employees",
+            chunk_size=self.stream_chunk_size,
+        )
+
+
+class AttendanceViewSet(
+    ConditionalGetMixin, StreamingListMixin, ListRowsMixin, viewsets.ModelViewSet
+):
+    # Join Employee up front; the serializer reads employee name and ID
+    queryset = Attendance.objects.select_related("employee")
     serializer_class = AttendanceSerializer
+    pagination_class = AttendancePagination
+    # Rows embed the employee's name and ID
+    validator_timestamps = ("updated_at", "employee__updated_at")
     # Assignment specifies: "Assume a single admin user (no authentication required)"
     permission_classes = [permissions.AllowAny]
 
@@ -45,32 +226,307 @@ class AttendanceViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def use_flat_rows(self):
+        """`?flat=true` opts list responses into the .values() fast path"""
+        return self.request.query_params.get("flat", "").lower() in ("1", "true")
+
+    def get_list_queryset(self):
+        queryset = super().get_list_queryset()
+        if self.use_flat_rows():
+            return queryset.values(*ATTENDANCE_FLAT_FIELDS)
+        return queryset
+
+    def get_list_data(self, page):
+        if self.use_flat_rows():
+            return list(attendance_flat_rows(page))
+        return super().get_list_data(page)
+
+    def get_stream_rows(self, queryset):
+        if not self.use_flat_rows():
+            return super().get_stream_rows(queryset)
+        rows = queryset.values(*ATTENDANCE_FLAT_FIELDS)
+        return attendance_flat_rows(rows.iterator(chunk_size=self.stream_chunk_size))
+
+    @action(detail=False, methods=["post"], serializer_class=BulkAttendanceSerializer)
+    def bulk(self, request):
+        """
+        Mark many employees for one date in a single request.
+        Returns per-employee created/skipped/failed results, or with
+        `?background=true` the queued job whose result they become.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if run_in_background(request):
+            return job_accepted(
+                request, enqueue("bulk_mark", serializer.validated_data)
+            )
+        result = bulk_mark_attendance(
+            date=serializer.validated_data["date"],
+            status=serializer.validated_data["status"],
+            employee_ids=serializer.validated_data.get("employees"),
+        )
+        response_status = (
+            status.HTTP_201_CREATED if result["created"] else status.HTTP_200_OK
+        )
+        return Response(result, status=response_status)
+
+    @action(detail=False, methods=["get"])
+    def report(self, request):
+        """
+        Attendance for a date range, filtered in SQL.
+        Rows are paginated; totals, per-employee rates and per-department
+        breakdown cover the whole filtered range.
+        """
+        params = AttendanceReportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+
+        queryset = self.filter_range(self.get_queryset(), filters)
+        page = self.paginate_queryset(queryset)
+        response = self.get_paginated_response(
+            AttendanceSerializer(page, many=True).data
+        )
+        response.data.update(attendance_report_summary(queryset))
+        return response
+
+    @action(detail=False, methods=["get"])
+    def matrix(self, request):
+        """
+        Who was present on which day of a month (`?month=YYYY-MM`, default
+        the current month; optional `department`): one row per employee
+        with a compact per-day status string, e.g. "PPA-P...".
+        """
+        params = AttendanceMatrixQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        month = params.validated_data.get(
+            "month", timezone.localtime(timezone.now()).date()
+        )
+        return Response(
+            attendance_matrix(month, params.validated_data.get("department"))
+        )
+
+    @action(detail=False, methods=["get"])
+    def streaks(self, request):
+        """
+        Employees absent `min_days` (default 3) or more consecutive days
+        between `start` and `end`, by default the current quarter so far;
+        optional `department`. Longest streak first.
+        """
+        params = AbsenceStreakQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        start, end = self.quarter_range(params.validated_data)
+        min_days = params.validated_data["min_days"]
+        return Response(
+            {
+                "start": start,
+                "end": end,
+                "min_days": min_days,
+                "results": absence_streaks(
+                    start, end, min_days, params.validated_data.get("department")
+                ),
+            }
+        )
+
+    @action(detail=False, methods=["get"])
+    def patterns(self, request):
+        """
+        Per-employee present and absent days, attendance rate and absences
+        per weekday (Monday first) between `start` and `end`, by default the
+        current quarter so far; optional `department`.
+        """
+        params = AttendancePatternQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        start, end = self.quarter_range(params.validated_data)
+        return Response(
+            {
+                "start": start,
+                "end": end,
+                "results": attendance_patterns(
+                    start, end, params.validated_data.get("department")
+                ),
+            }
+        )
+
+    @action(detail=False, methods=["get"])
+    def archive(self, request):
+        """
+        Months archived out of the partitioned table (see hrms/partitions.py),
+        or with `?month=YYYY-MM` that month's records read from its archive
+        file, streamed as a JSON array of list rows; optional `employee`.
+        """
+        params = AttendanceArchiveQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        month = params.validated_data.get("month")
+        if month is None:
+            return Response(
+                AttendanceArchiveSerializer(
+                    AttendanceArchive.objects.all(), many=True
+                ).data
+            )
+
+        archive = AttendanceArchive.objects.filter(month=month).first()
+        if archive is None:
+            raise NotFound(f"{month:%Y-%m} is not archived.")
+        employee = params.validated_data.get("employee")
+        employees = Employee.objects.all()
+        if employee is not None:
+            employees = employees.filter(id=employee)
+        names = {
+            pk: (employee_id, full_name)
+            for pk, employee_id, full_name in employees.values_list(
+                "id", "employee_id", "full_name"
+            )
+        }
+        rows = archived_attendance_rows(read_archive(archive, employee), names)
+        return StreamingHttpResponse(
+            stream_json_array(rows), content_type="application/json"
+        )
+
+    @action(
+        detail=False,
+        methods=["get"],
+        content_negotiation_class=ExportContentNegotiation,
+    )
+    def export(self, request):
+        """
+        Download attendance as CSV or NDJSON (`?format=csv|ndjson`), with the
+        report's start/end/status/department filters, oldest first.
+        """
+        params = AttendanceExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+
+        queryset = self.filter_range(self.get_queryset(), filters)
+        filename = "attendance"
+        if "start" in filters or "end" in filters:
+            filename += f"-{filters.get('start', '')}-{filters.get('end', '')}"
+        return export_response(
+            queryset.order_by("date", "id"),
+            ATTENDANCE_EXPORT_FIELDS,
+            filters["format"],
+            filename=filename,
+            chunk_size=self.stream_chunk_size,
+        )
+
+    def quarter_range(self, filters):
+        """Validated start/end, defaulting to the current quarter so far"""
+        today = timezone.localtime(timezone.now()).date()
+        quarter_start = today.replace(month=(today.month - 1) // 3 * 3 + 1, day=1)
+        return filters.get("start", quarter_start), filters.get("end", today)
+
+    def filter_range(self, queryset, filters):
+        """Apply validated start/end/department report filters"""
+        if "start" in filters:
+            queryset = queryset.filter(date__gte=filters["start"])
+        if "end" in filters:
+            queryset = queryset.filter(date__lte=filters["end"])
+        if "department" in filters:
+            queryset = queryset.filter(employee__department=filters["department"])
+        return queryset
+
+
+class JobViewSet(
+    mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+):
+    """
+    Background jobs: poll one for progress, its result or its error, list
+    recent ones (`?status=`, `?kind=`), or queue a maintenance rebuild.
+    """
+
+    queryset = Job.objects.defer("payload")
+    serializer_class = JobSerializer
+    pagination_class = JobPagination
+    permission_classes = [permissions.AllowAny]
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return JobListSerializer
+        if self.action == "create":
+            return JobCreateSerializer
+        return JobSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action != "list":
+            return queryset
+        queryset = queryset.defer("result")
+        for field in ("status", "kind"):
+            value = self.request.query_params.get(field)
+            if value:
+                queryset = queryset.filter(**{field: value})
+        return queryset
+
+    def create(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        params = dict(serializer.validated_data)
+        return job_accepted(request, enqueue(params.pop("kind"), params))
+
 
 class DashboardStatsView(APIView):
     # Assignment specifies: "Assume a single admin user (no authentication required)"
     permission_classes = [permissions.AllowAny]
 
     def get(self, request):
-        # Get today's date in the configured timezone (IST)
-        today = timezone.localtime(timezone.now()).date()
-        total_employees = Employee.objects.count()
+        # Served from cache; invalidated by hrms.signals on every write
+        entry = get_dashboard_entry()
 
-        # Efficiently count status for today without looping
-        attendance_stats = Attendance.objects.filter(date=today).aggregate(
-            present=Count("id", filter=Q(status="PRESENT")),
-            absent=Count("id", filter=Q(status="ABSENT")),
+        # Cheap 304 when the client already has the current stats
+        not_modified = get_conditional_response(
+            request,
+            etag=entry["etag"],
+            last_modified=int(entry["last_modified"].timestamp()),
         )
+        if not_modified is not None:
+            return not_modified
+
+        response = Response(entry["data"])
+        response["ETag"] = entry["etag"]
+        response["Last-Modified"] = http_date(entry["last_modified"].timestamp())
+        # Let clients keep a copy but revalidate on every poll
+        patch_cache_control(response, no_cache=True)
+        return response
+
+
+class DailyAnalyticsView(APIView):
+    """
+    Attendance trend per day, week or month and department, served from
+    DailyAttendanceRollup so a year of history is a few hundred rows.
+    """
 
+    # Assignment specifies: "Assume a single admin user (no authentication required)"
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        params = DailyAnalyticsQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+
+        rows = daily_trend(
+            filters["start"],
+            filters["end"],
+            department=filters.get("department"),
+            period=filters["period"],
+        )
         return Response(
             {
-                "total_employees": total_employees,
-                "today_stats": {
-                    "date": today,
-                    "present": attendance_stats["present"],
-                    "absent": attendance_stats["absent"],
-                    "unmarked": total_employees
-                    - (attendance_stats["present"] + attendance_stats["absent"]),
-                },
+                "start": filters["start"],
+                "end": filters["end"],
+                "period": filters["period"],
+                "results": [
+                    {
+                        "period_start": row["period"],
+                        "department": row["department"],
+                        "present": row["present_total"],
+                        "absent": row["absent_total"],
+                        "headcount": row["peak_headcount"],
+                        "days": row["days"],
+                        "attendance_rate": attendance_rate(
+                            row["present_total"], row["absent_total"]
+                        ),
+                    }
+                    for row in rows
+                ],
             }
         )
 
@@ -89,3 +545,19 @@ def health_check(request):
             "service": "hrms-lite-backend",
         }
     )
+
+
+@require_safe
+def metrics(request):
+    """
+    Request metrics in the Prometheus text format. Requires
+    `Authorization: Bearer <METRICS_TOKEN>` when METRICS_TOKEN is set.
+    """
+    token = settings.METRICS_TOKEN
+    if token and not constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )